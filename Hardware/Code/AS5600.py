@@ -23,6 +23,7 @@ Implementation Notes
 
 from micropython import const
 import adafruit_bus_device.i2c_device as i2c_device
+import WriteVerify
 
 # Register map & bit positions
 
@@ -77,6 +78,14 @@ _REGISTER_MAGNITUDE_HI = const(0x1B) # R
 _REGISTER_MAGNITUDE_LO = const(0x1C) # R
 _REGISTER_BURN = const(0xFF) # W
 
+# STATUS through MAGNITUDE (0x0B - 0x1C) are contiguous and read as one block
+_SNAPSHOT_START = const(_REGISTER_STATUS)
+_SNAPSHOT_STATUS = const(_REGISTER_STATUS - _SNAPSHOT_START)
+_SNAPSHOT_RAW_ANGLE = const(_REGISTER_RAW_ANGLE_HI - _SNAPSHOT_START)
+_SNAPSHOT_ANGLE = const(_REGISTER_ANGLE_HI - _SNAPSHOT_START)
+_SNAPSHOT_AGC = const(_REGISTER_AGC - _SNAPSHOT_START)
+_SNAPSHOT_MAGNITUDE = const(_REGISTER_MAGNITUDE_HI - _SNAPSHOT_START)
+
 # Commands
 
 _BURN_ANGLE_COMMAND = const(0x80)
@@ -122,13 +131,81 @@ FAST_FILTER_THRESHOLD_21LSB = const(5)
 FAST_FILTER_THRESHOLD_24LSB = const(6)
 FAST_FILTER_THRESHOLD_10LSB = const(7)
 
+# Register write read-back policies, see WriteVerify
+VERIFY_OFF = WriteVerify.VERIFY_OFF
+VERIFY_ON = WriteVerify.VERIFY_ON
+VERIFY_SAMPLED = WriteVerify.VERIFY_SAMPLED
+
+SNAPSHOT_SIZE = const(_REGISTER_MAGNITUDE_LO - _REGISTER_STATUS + 1)
+
 
-class AS5600:
+class Snapshot:
+    """Decoded view of a block of AS5600 output & status registers read by ``AS5600.read_snapshot``
+
+    :param bytearray buffer: ``SNAPSHOT_SIZE`` byte buffer holding registers STATUS to MAGNITUDE
     """
-    Initialise the PCA9955 chip at ``address`` on ``i2c_bus``.
+
+    def __init__(self, buffer: bytearray):
+        self.buffer = buffer
+
+    @property
+    def raw_angle(self) -> int:
+        """The unscaled and unmodified 12-bit angle (RAWANGLE)."""
+        return ((self.buffer[_SNAPSHOT_RAW_ANGLE] << 8) | self.buffer[_SNAPSHOT_RAW_ANGLE + 1]) & 0x0FFF
+
+    @property
+    def angle(self) -> int:
+        """The 12-bit angle (ANGLE)."""
+        return ((self.buffer[_SNAPSHOT_ANGLE] << 8) | self.buffer[_SNAPSHOT_ANGLE + 1]) & 0x0FFF
+
+    @property
+    def status(self) -> int:
+        """The 8-bit status register (STATUS)."""
+        return self.buffer[_SNAPSHOT_STATUS] & _STATUS_MASK
+
+    @property
+    def is_magnet_too_strong(self) -> bool:
+        """ Test MH Status Bit"""
+        return bool(self.buffer[_SNAPSHOT_STATUS] & _STATUS_MH)
+
+    @property
+    def is_magnet_too_weak(self) -> bool:
+        """ Test ML Status Bit"""
+        return bool(self.buffer[_SNAPSHOT_STATUS] & _STATUS_ML)
+
+    @property
+    def is_magnet_detected(self) -> bool:
+        """ Test MD Status Bit"""
+        return bool(self.buffer[_SNAPSHOT_STATUS] & _STATUS_MD)
+
+    @property
+    def gain(self) -> int:
+        """The 8-bit Automatic Gain Control value (AGC)."""
+        return self.buffer[_SNAPSHOT_AGC]
+
+    @property
+    def magnitude(self) -> int:
+        """The 12-bit CORDIC magnitude (MAGNITUDE)."""
+        return ((self.buffer[_SNAPSHOT_MAGNITUDE] << 8) | self.buffer[_SNAPSHOT_MAGNITUDE + 1]) & 0x0FFF
+
+
+class AS5600(WriteVerify.WriteVerify):
     """
-    def __init__(self, i2c, address=_AS5600_DEFAULT_I2C_ADDR):
+    Initialise the AS5600 chip at ``address`` on ``i2c_bus``.
+
+    :param ~busio.I2C i2c_bus: The I2C bus which the AS5600 is connected to.
+    :param int address: The I2C address of the AS5600.
+    :param int verify: Register write read-back policy, ``VERIFY_OFF``, ``VERIFY_ON`` or ``VERIFY_SAMPLED``.
+    :param int verify_interval: With ``VERIFY_SAMPLED``, read back every Nth write.
+    :param bool strict: Raise on a read-back mismatch, otherwise only count it in ``verify_failures``.
+    """
+    def __init__(self, i2c, address=_AS5600_DEFAULT_I2C_ADDR, verify: int = VERIFY_OFF, verify_interval: int = 16, strict: bool = True):
+        self._init_verify(verify, verify_interval, strict)
         self._device = i2c_device.I2CDevice(i2c, address)
+        # Preallocated command & result buffers, so register I/O does not allocate
+        self._command = bytearray(3)
+        self._result = bytearray(2)
+        self._snapshot = None
 
     # Output Registers
 
@@ -174,6 +251,21 @@ class AS5600:
         """Get the 12-bit CORDIC magnitude (MAGNITUDE)."""
         return self._read_16(_REGISTER_MAGNITUDE_HI)
 
+    def read_snapshot(self, buffer: bytearray) -> Snapshot:
+        """Read STATUS, RAWANGLE, ANGLE, AGC & MAGNITUDE in a single transaction.
+
+        :param bytearray buffer: Preallocated ``SNAPSHOT_SIZE`` byte buffer to read into
+        :return: A decoded view of ``buffer``, reused while the same buffer is passed in
+        """
+        if len(buffer) != SNAPSHOT_SIZE:
+            raise ValueError(f"Buffer must be {SNAPSHOT_SIZE} bytes")
+        self._command[0] = _SNAPSHOT_START
+        with self._device as i2c:
+            i2c.write_then_readinto(self._command, buffer, out_end=1)
+        if self._snapshot is None or self._snapshot.buffer is not buffer:
+            self._snapshot = Snapshot(buffer)
+        return self._snapshot
+
     # Configuration Registers
 
     @property
@@ -305,36 +397,53 @@ class AS5600:
 
     def _read_8(self, address: int) -> int:
         # Read and return a byte from the specified 8-bit register address.
-        result = bytearray(1)
+        command = self._command
+        result = self._result
+        command[0] = address
         with self._device as i2c:
-            i2c.write(bytes([address]))
-            i2c.readinto(result)
+            i2c.write_then_readinto(command, result, out_end=1, in_end=1)
         return result[0]
 
     def _write_8(self, address: int, value: int) -> int:
-        # write a byte to the specified 8-bit register address.
-        result = bytearray(1)
+        # write a byte to the specified 8-bit register address, reading it back if the verify policy says so.
+        command = self._command
+        result = self._result
+        command[0] = address
+        command[1] = value
+        verify = address != _REGISTER_BURN and self._should_verify()
         with self._device as i2c:
-            i2c.write(bytes([address, value]))
-            i2c.write(bytes([address]))
-            i2c.readinto(result)
+            i2c.write(command, end=2)
+            if verify:
+                i2c.write_then_readinto(command, result, out_end=1, in_end=1)
+        if not verify:
+            return value
+        self._check_write(address, value, result[0])
         return result[0]
 
     def _read_16(self, address: int) -> int:
         # Read and return a 16-bit unsigned big endian value read from the specified 16-bit register address.
-        result = bytearray(2)
+        command = self._command
+        result = self._result
+        command[0] = address
         with self._device as i2c:
-            i2c.write(bytes([address]))
-            i2c.readinto(result)
+            i2c.write_then_readinto(command, result, out_end=1)
         return (result[0] << 8) | result[1]
 
     def _write_16(self, address: int, value: int) -> int:
         # Write a 16-bit big endian value to the specified 16-bit register address.
-        result = bytearray(2)
+        command = self._command
+        result = self._result
+        command[0] = address
+        command[1] = (value & 0xFF00) >> 8
+        command[2] = value & 0x00FF
+        verify = self._should_verify()
         with self._device as i2c:
-            i2c.write(bytes([address, (value & 0xFF00) >> 8, value & 0x00FF]))
-            i2c.write(bytes([address]))
-            i2c.readinto(result)
+            i2c.write(command)
+            if verify:
+                i2c.write_then_readinto(command, result, out_end=1)
+        if not verify:
+            return value
+        self._check_write(address, value, (result[0] << 8) | result[1])
         return (result[0] << 8) | result[1]
 
     def _read_conf_register(self, register: int, mask: int, offset: int) -> int:
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`AS5600Out`
+================================================================================
+Read the AMS AS5600 angle from its OUT pin, instead of over I2C
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Both backends configure the sensor's output stage through the I2C ``AS5600``
+driver once, then read the angle with no bus traffic. They have the same
+``angle`` property as ``AS5600``, so either can be used in its place for the
+angle reads.
+
+``AS5600Analog`` reads the OUT pin voltage with ``analogio``.
+``AS5600Pwm`` times the OUT pin PWM high & low pulses with ``pulseio``. A PWM
+frame is 128 clocks high, then the angle in clocks high, then 4095 - angle
+clocks low, then 128 clocks low, 4351 clocks in all.
+
+``PulseIn`` keeps capturing between reads, dropping its oldest pulse when full,
+so the high & low order is only known while it hasn't overflowed. Its buffer
+holds 256 pulses, 139ms at 920Hz, longer than the slowest joystick period.
+Counting from the last resume the even pulses are high, so ``angle`` decodes the
+newest complete high & low pair. A full buffer may have overflowed, that read
+keeps the previous angle.
+
+**Hardware:**
+
+* `AS5600 <https://ams.com/as5600>`
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+"""
+
+from micropython import const
+import analogio
+import pulseio
+import AS5600
+
+_ANALOG_FULL_SCALE = const(65536)
+# Reduced analog output swings from 10% to 90% of VDD
+_ANALOG_REDUCED_MIN = const(6554)
+_ANALOG_REDUCED_SPAN = const(52429)
+_PWM_FRAME_CLOCKS = const(4351)
+_PWM_HEADER_CLOCKS = const(128)
+_PWM_PULSE_BUFFER = const(256)
+
+
+class AS5600Analog:
+    """
+    AS5600 angle read from its OUT pin in analog mode.
+
+    :param AS5600 sensor: The I2C AS5600, used to set the output stage.
+    :param ~microcontroller.Pin pin: Analog input pin wired to the AS5600 OUT pin.
+    :param bool reduced: Use the reduced (10% - 90% VDD) rather than the full (0% - 100% VDD) output range.
+    """
+
+    def __init__(self, sensor: AS5600.AS5600, pin, reduced: bool = False):
+        sensor.output_stage = AS5600.OUTPUT_STAGE_ANALOG_REDUCED if reduced else AS5600.OUTPUT_STAGE_ANALOG_FULL
+        self._reduced = reduced
+        self._analog = analogio.AnalogIn(pin)
+
+    def deinit(self) -> None:
+        """Release the analog input pin."""
+        self._analog.deinit()
+
+    @property
+    def angle(self) -> int:
+        """Get the current 12-bit angle (ANGLE)."""
+        value = self._analog.value
+        if self._reduced:
+            value = ((value - _ANALOG_REDUCED_MIN) * _ANALOG_FULL_SCALE) // _ANALOG_REDUCED_SPAN
+            if value < 0:
+                value = 0
+            elif value >= _ANALOG_FULL_SCALE:
+                value = _ANALOG_FULL_SCALE - 1
+        return value >> 4
+
+
+class AS5600Pwm:
+    """
+    AS5600 angle read from its OUT pin in PWM mode.
+
+    Never blocks, ``angle`` returns the most recent complete PWM frame, or the
+    previous angle if a new frame hasn't been captured since the last read.
+
+    :param AS5600 sensor: The I2C AS5600, used to set the output stage & PWM frequency.
+    :param ~microcontroller.Pin pin: Pin wired to the AS5600 OUT pin.
+    :param int frequency: PWM frequency, one of the ``AS5600.PWM_FREQUENCY_*`` constants.
+    """
+
+    def __init__(self, sensor: AS5600.AS5600, pin, frequency: int = AS5600.PWM_FREQUENCY_920HZ):
+        sensor.output_stage = AS5600.OUTPUT_STAGE_DIGITAL_PWM
+        sensor.pwm_frequency = frequency
+        # Starting from idle low, the first pulse recorded after a resume is a high pulse
+        self._pulses = pulseio.PulseIn(pin, maxlen=_PWM_PULSE_BUFFER, idle_state=False)
+        self._angle = sensor.angle
+
+    def deinit(self) -> None:
+        """Release the PWM input pin."""
+        self._pulses.deinit()
+
+    @property
+    def angle(self) -> int:
+        """Get the current 12-bit angle (ANGLE)."""
+        pulses = self._pulses
+        count = len(pulses)
+        if count < 2:
+            return self._angle
+        if count < _PWM_PULSE_BUFFER:
+            # The newest high pulse with its low pulse after it, high pulses are at even indexes
+            index = (count - 2) & ~1
+            high = pulses[index]
+            low = pulses[index + 1]
+            angle = (high * _PWM_FRAME_CLOCKS) // (high + low) - _PWM_HEADER_CLOCKS
+            if angle < 0:
+                angle = 0
+            elif angle > 4095:
+                angle = 4095
+            self._angle = angle
+        # Restart capture so the first pulse is again a high pulse
+        pulses.pause()
+        pulses.clear()
+        pulses.resume()
+        return self._angle
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`AdaptiveSampling`
+================================================================================
+Motion adaptive sample rate and AS5600 power mode management
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+While the yoke is moving the joystick job runs at ``activePeriodMs`` and the
+AS5600 is in nominal power mode with a fast filter threshold, for the lowest
+latency. Once the angle has stayed within ``motionThreshold`` counts for
+``idleTimeoutMs`` the job drops to ``idlePeriodMs`` and the sensor to a low
+power mode with more hysteresis and the slow filter only. The first movement
+beyond the threshold switches straight back.
+
+The sensor is only reconfigured on a change between the two states.
+"""
+
+import supervisor
+import AS5600
+import Scheduler
+
+
+class AdaptiveSampler:
+    """
+    :param AS5600 sensor: The I2C AS5600 to manage
+    :param Job job: The scheduler job sampling the sensor
+    :param int activePeriodMs: Job period while moving
+    :param int idlePeriodMs: Job period while idle
+    :param int idleTimeoutMs: Time without movement before going idle
+    :param int motionThreshold: Angle change, in counts, counted as movement
+    :param int idlePowerMode: AS5600 power mode while idle, its polling time should be under ``idlePeriodMs``
+    """
+
+    def __init__(self, sensor: AS5600.AS5600, job: Scheduler.Job, activePeriodMs: int = 10, idlePeriodMs: int = 100,
+                 idleTimeoutMs: int = 5000, motionThreshold: int = 4, idlePowerMode: int = AS5600.POWER_MODE_LPM2):
+        self.sensor = sensor
+        self.job = job
+        self.activePeriodMs = activePeriodMs
+        self.idlePeriodMs = idlePeriodMs
+        self.idleTimeoutMs = idleTimeoutMs
+        self.motionThreshold = motionThreshold
+        self.idlePowerMode = idlePowerMode
+        self.lastAngle = None
+        self.lastMotionMs = supervisor.ticks_ms()
+        self.active = False
+        self.transitions = 0
+        self.setActive()
+
+    def update(self, angle: int, otherMotion: bool = False) -> None:
+        """Track a new 12-bit angle sample, switching between active and idle as needed.
+
+        :param int angle: The latest angle
+        :param bool otherMotion: True if another axis, e.g. pitch, has moved, so the panel is in use
+        """
+        now = supervisor.ticks_ms()
+        if self.lastAngle is None:
+            self.lastAngle = angle
+        # Signed difference, the short way round the 0 / 4095 wrap
+        delta = ((angle - self.lastAngle + 2048) & 0x0FFF) - 2048
+        if otherMotion or delta > self.motionThreshold or delta < -self.motionThreshold:
+            self.lastAngle = angle
+            self.lastMotionMs = now
+            if not self.active:
+                self.setActive()
+        elif self.active and Scheduler.ticks_diff(now, self.lastMotionMs) > self.idleTimeoutMs:
+            self.setIdle()
+
+    def setActive(self) -> None:
+        self.sensor.power_mode = AS5600.POWER_MODE_NOM
+        self.sensor.hysteresis = AS5600.HYSTERESIS_OFF
+        self.sensor.fast_filter = AS5600.FAST_FILTER_THRESHOLD_6LSB
+        self.job.period_ms = self.activePeriodMs
+        self.active = True
+        self.transitions += 1
+
+    def setIdle(self) -> None:
+        self.sensor.power_mode = self.idlePowerMode
+        self.sensor.hysteresis = AS5600.HYSTERESIS_3LSB
+        self.sensor.fast_filter = AS5600.FAST_FILTER_THRESHOLD_SLOW
+        self.job.period_ms = self.idlePeriodMs
+        self.active = False
+        self.transitions += 1
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`AnglePredictor`
+================================================================================
+Latency compensating extrapolation of the AS5600 angle
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Each timestamped 12-bit angle is unwrapped across 0 / 4095 into a continuous
+position, and incremental, exponentially smoothed estimates of velocity and
+acceleration are updated from it in integer fixed point. The output is the
+position extrapolated ``leadMs`` ahead, wrapped back to 0 - 4095.
+
+Fixed point shifts & divisions round to nearest, symmetrically about zero, as
+flooring would hold the estimates, and so the output, below a yoke at rest.
+When the angle hasn't changed and a smoothing step rounds to nothing, that
+estimate has settled and is snapped to 0.
+
+To measure what it buys, each new sample is also compared against where the
+previous state predicted it would be, and against simply holding the previous
+sample, as the joystick does without prediction. A held sample lags by the
+sample interval; scaling that lag by how much of the hold error prediction
+removes gives ``latencyRemovedMs``.
+"""
+
+import Scheduler
+
+# Fractional bits of the velocity & acceleration estimates
+_FRACTION_BITS = 8
+
+
+def roundShift(value: int, shift: int) -> int:
+    """``value / 2**shift`` rounded to nearest, halves away from zero."""
+    if shift <= 0:
+        return value
+    half = 1 << (shift - 1)
+    if value >= 0:
+        return (value + half) >> shift
+    return -((half - value) >> shift)
+
+
+def roundDiv(value: int, divisor: int) -> int:
+    """``value / divisor`` rounded to nearest, halves away from zero, for a positive divisor."""
+    if value >= 0:
+        return (value + (divisor >> 1)) // divisor
+    return -(((divisor >> 1) - value) // divisor)
+
+
+class AnglePredictor:
+    """
+    :param int leadMs: How far ahead to extrapolate, roughly the lag being compensated
+    :param int velocityShift: Velocity smoothing, alpha = 1 / 2**velocityShift
+    :param int accelerationShift: Acceleration smoothing, alpha = 1 / 2**accelerationShift
+    :param int maxCorrection: Largest correction, in counts, applied to the measured angle
+    """
+
+    def __init__(self, leadMs: int = 15, velocityShift: int = 1, accelerationShift: int = 2, maxCorrection: int = 256):
+        self.leadMs = leadMs
+        self.velocityShift = velocityShift
+        self.accelerationShift = accelerationShift
+        self.maxCorrection = maxCorrection
+        self.position = None
+        self.velocity = 0
+        self.acceleration = 0
+        self.lastMs = 0
+        self.output = 0
+        self.resetStats()
+
+    def update(self, angle: int, timeMs: int) -> int:
+        """Add a new angle sample taken at ``timeMs`` (ticks_ms) and return the predicted angle."""
+        if self.position is None:
+            self.position = angle
+            self.lastMs = timeMs
+            self.output = angle
+            return angle
+        dt = Scheduler.ticks_diff(timeMs, self.lastMs)
+        if dt <= 0:
+            return self.output
+
+        # Unwrap, the short way round the 0 / 4095 wrap
+        delta = ((angle - self.position + 2048) & 0x0FFF) - 2048
+        expected = roundShift(self.velocity * dt + roundShift(self.acceleration * dt * dt, 1), _FRACTION_BITS)
+        if delta:
+            holdError = abs(delta)
+            predictError = abs(delta - expected)
+            self.holdError += holdError
+            self.predictError += predictError
+            self.weightedLagMs += dt * (holdError - predictError)
+        self.position += delta
+        self.lastMs = timeMs
+
+        step = roundShift(roundDiv(delta << _FRACTION_BITS, dt) - self.velocity, self.velocityShift)
+        velocity = self.velocity + step if step or delta else 0
+        step = roundShift(roundDiv(velocity - self.velocity, dt) - self.acceleration, self.accelerationShift)
+        self.acceleration = self.acceleration + step if step or delta else 0
+        self.velocity = velocity
+
+        lead = self.leadMs
+        correction = roundShift(velocity * lead + roundShift(self.acceleration * lead * lead, 1), _FRACTION_BITS)
+        if correction > self.maxCorrection:
+            correction = self.maxCorrection
+        elif correction < -self.maxCorrection:
+            correction = -self.maxCorrection
+        self.output = (self.position + correction) & 0x0FFF
+        return self.output
+
+    @property
+    def latencyRemovedMs(self) -> float:
+        """Average latency removed by prediction while moving, in milliseconds, since the last reset."""
+        if not self.holdError:
+            return 0.0
+        return self.weightedLagMs / self.holdError
+
+    def resetStats(self) -> None:
+        self.holdError = 0
+        self.predictError = 0
+        self.weightedLagMs = 0
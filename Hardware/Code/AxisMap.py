@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`AxisMap`
+================================================================================
+Lookup table mapping of raw sensor readings to joystick axis values
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Each response ``Curve`` is turned into a table with one entry per possible raw
+reading when the ``AxisMap`` is created, so mapping a reading in the hot path is
+a single index, ``axisMap.table[reading]``. Alternate curves are built up front
+too, so ``select()`` swaps them at runtime without any per sample math.
+"""
+
+from array import array
+
+
+class Curve:
+    """A declarative axis response curve
+
+    :param int travel: Input counts from centre to the end stop, readings beyond are clamped
+    :param int deadzone: Input counts either side of centre that read as 0
+    :param float expo: Exponential response 0.0 (linear) - 1.0 (cubic), softens small movements
+    :param bool invert: Reverse the axis direction
+    :param int outputMax: Output at the end stop, the output range is -outputMax to outputMax
+    """
+
+    def __init__(self, travel: int, deadzone: int = 0, expo: float = 0.0, invert: bool = False, outputMax: int = 127):
+        if not 0 <= deadzone < travel:
+            raise ValueError("Deadzone must be between 0 & travel")
+        if not 0.0 <= expo <= 1.0:
+            raise ValueError("Expo must be between 0.0 & 1.0")
+        if not 1 <= outputMax <= 32767:
+            raise ValueError("Output max must be between 1 & 32767")
+        self.travel = travel
+        self.deadzone = deadzone
+        self.expo = expo
+        self.invert = invert
+        self.outputMax = outputMax
+
+    def apply(self, offset: int) -> int:
+        """Map an input offset from centre to an output value, only used when building tables."""
+        magnitude = abs(offset)
+        if magnitude <= self.deadzone:
+            return 0
+        if magnitude > self.travel:
+            magnitude = self.travel
+        x = (magnitude - self.deadzone) / (self.travel - self.deadzone)
+        x = (1.0 - self.expo) * x + self.expo * x * x * x
+        output = int(x * self.outputMax + 0.5)
+        if (offset < 0) != self.invert:
+            output = -output
+        return output
+
+    def buildTable(self, size: int, centre: int, wrap: bool = False) -> array:
+        """Build the lookup table for readings 0 to size - 1.
+
+        :param int size: Number of possible readings
+        :param int centre: Reading at the centre of travel
+        :param bool wrap: Readings wrap around, e.g. a rotation sensor, so offsets are taken the short way round
+        """
+        table = array("b" if self.outputMax <= 127 else "h", bytes(size if self.outputMax <= 127 else size * 2))
+        half = size >> 1
+        for reading in range(size):
+            offset = reading - centre
+            if wrap:
+                offset = (offset + half) % size - half
+            table[reading] = self.apply(offset)
+        return table
+
+
+class AxisMap:
+    """A set of precomputed response curves for one axis, with one selected
+
+    :param dict curves: Curve for each name
+    :param str selected: Name of the curve to start with
+    :param int size: Number of possible readings
+    :param int centre: Reading at the centre of travel
+    :param bool wrap: Readings wrap around, e.g. a rotation sensor
+    """
+
+    def __init__(self, curves: dict, selected: str, size: int, centre: int = 0, wrap: bool = False):
+        self.tables = {}
+        for name, curve in curves.items():
+            self.tables[name] = curve.buildTable(size, centre, wrap)
+        self.select(selected)
+
+    def select(self, name: str) -> None:
+        if name not in self.tables:
+            raise ValueError(f"Curve must be one of {tuple(self.tables)}")
+        self.name = name
+        self.table = self.tables[name]
+
+    def map(self, reading: int) -> int:
+        return self.table[reading]
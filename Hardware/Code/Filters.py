@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`Filters`
+================================================================================
+Integer only sensor filters for the control panel axes
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Every filter takes an integer sample in ``update()`` and returns the filtered
+integer. Updates are O(1), use only integer add, subtract & shift, and do not
+allocate, so they can be chained per axis and run at the full sample rate.
+"""
+
+# Fractional bits kept in filter state, so shift based smoothing doesn't lose resolution
+_FRACTION_BITS = 8
+
+
+class BoxcarFilter:
+    """Moving average over the last 2**sizeShift samples, kept as a running sum."""
+
+    def __init__(self, initialValue: int, sizeShift: int = 3):
+        self.sizeShift = sizeShift
+        self.buffer = [initialValue] * (1 << sizeShift)
+        self.mask = (1 << sizeShift) - 1
+        self.index = 0
+        self.total = initialValue << sizeShift
+
+    def update(self, newValue: int) -> int:
+        self.total += newValue - self.buffer[self.index]
+        self.buffer[self.index] = newValue
+        self.index = (self.index + 1) & self.mask
+        return self.total >> self.sizeShift
+
+
+class EmaFilter:
+    """Exponential moving average with alpha = 1 / 2**shift."""
+
+    def __init__(self, initialValue: int, shift: int = 2):
+        self.shift = shift
+        self.state = initialValue << _FRACTION_BITS
+
+    def update(self, newValue: int) -> int:
+        self.state += ((newValue << _FRACTION_BITS) - self.state) >> self.shift
+        return (self.state + (1 << (_FRACTION_BITS - 1))) >> _FRACTION_BITS
+
+
+class MedianOf3Filter:
+    """Median of the last 3 samples, rejects single sample spikes & dropouts."""
+
+    def __init__(self, initialValue: int):
+        self.a = initialValue
+        self.b = initialValue
+
+    def update(self, newValue: int) -> int:
+        a = self.a
+        b = self.b
+        self.a = b
+        self.b = newValue
+        if a > b:
+            a, b = b, a
+        if newValue <= a:
+            return a
+        if newValue >= b:
+            return b
+        return newValue
+
+
+class AdaptiveFilter:
+    """One euro style filter, heavy smoothing when still and light smoothing when moving.
+
+    The smoothing shift drops from ``slowShift`` towards ``fastShift`` by one for every
+    2**speedShift counts per sample of (smoothed) speed.
+    """
+
+    def __init__(self, initialValue: int, slowShift: int = 4, fastShift: int = 0, speedShift: int = 2, speedSmoothingShift: int = 2):
+        self.slowShift = slowShift
+        self.fastShift = fastShift
+        self.speedShift = speedShift + _FRACTION_BITS
+        self.speedSmoothingShift = speedSmoothingShift
+        self.state = initialValue << _FRACTION_BITS
+        self.speed = 0
+
+    def update(self, newValue: int) -> int:
+        target = newValue << _FRACTION_BITS
+        delta = target - self.state
+        if delta < 0:
+            delta = -delta
+        self.speed += (delta - self.speed) >> self.speedSmoothingShift
+        shift = self.slowShift - (self.speed >> self.speedShift)
+        if shift < self.fastShift:
+            shift = self.fastShift
+        self.state += (target - self.state) >> shift
+        return (self.state + (1 << (_FRACTION_BITS - 1))) >> _FRACTION_BITS
+
+
+class FilterChain:
+    """Runs a sample through each filter stage in turn."""
+
+    def __init__(self, *stages):
+        self.stages = stages
+
+    def update(self, newValue: int) -> int:
+        for stage in self.stages:
+            newValue = stage.update(newValue)
+        return newValue
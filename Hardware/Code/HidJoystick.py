@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`HidJoystick`
+================================================================================
+High resolution USB HID joystick with 16-bit axes and 16 buttons
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+``boot.py`` enables the device returned by ``device()``, whose report descriptor
+has 16 buttons and four signed 16-bit axes: X & Y for the yoke, Z & Rz for a
+future throttle & trim. ``HidJoystick`` packs reports into a preallocated buffer
+with ``struct.pack_into`` so sending one does not allocate. Its methods match
+``adafruit_hid`` ``Gamepad``, so it can be used in its place, and ``set_state()``
+sends buttons & axes together in a single report.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+"""
+
+import struct
+import usb_hid
+from micropython import const
+
+_REPORT_ID = const(4)
+_REPORT_LENGTH = const(10)
+_REPORT_FORMAT = "<Hhhhh"       # buttons, x, y, z, rz
+_BUTTON_COUNT = const(16)
+_USAGE_PAGE_GENERIC_DESKTOP = const(0x01)
+_USAGE_JOYSTICK = const(0x04)
+
+AXIS_MAX = const(32767)
+
+REPORT_DESCRIPTOR = bytes((
+    0x05, 0x01,         # Usage Page (Generic Desktop)
+    0x09, 0x04,         # Usage (Joystick)
+    0xA1, 0x01,         # Collection (Application)
+    0x85, _REPORT_ID,   #   Report ID
+    0x05, 0x09,         #   Usage Page (Button)
+    0x19, 0x01,         #   Usage Minimum (Button 1)
+    0x29, 0x10,         #   Usage Maximum (Button 16)
+    0x15, 0x00,         #   Logical Minimum (0)
+    0x25, 0x01,         #   Logical Maximum (1)
+    0x75, 0x01,         #   Report Size (1)
+    0x95, 0x10,         #   Report Count (16)
+    0x81, 0x02,         #   Input (Data, Variable, Absolute)
+    0x05, 0x01,         #   Usage Page (Generic Desktop)
+    0x16, 0x01, 0x80,   #   Logical Minimum (-32767)
+    0x26, 0xFF, 0x7F,   #   Logical Maximum (32767)
+    0x09, 0x30,         #   Usage (X)
+    0x09, 0x31,         #   Usage (Y)
+    0x09, 0x32,         #   Usage (Z)
+    0x09, 0x35,         #   Usage (Rz)
+    0x75, 0x10,         #   Report Size (16)
+    0x95, 0x04,         #   Report Count (4)
+    0x81, 0x02,         #   Input (Data, Variable, Absolute)
+    0xC0,               # End Collection
+))
+
+
+def device() -> usb_hid.Device:
+    """The joystick USB HID device, for ``usb_hid.enable()`` in boot.py."""
+    return usb_hid.Device(
+        report_descriptor=REPORT_DESCRIPTOR,
+        usage_page=_USAGE_PAGE_GENERIC_DESKTOP,
+        usage=_USAGE_JOYSTICK,
+        report_ids=(_REPORT_ID,),
+        in_report_lengths=(_REPORT_LENGTH,),
+        out_report_lengths=(0,),
+    )
+
+
+class HidJoystick:
+    """
+    Send high resolution joystick reports.
+
+    :param devices: ``usb_hid.devices``, searched for the joystick device
+    """
+
+    def __init__(self, devices):
+        self._device = None
+        for candidate in devices:
+            if candidate.usage_page == _USAGE_PAGE_GENERIC_DESKTOP and candidate.usage == _USAGE_JOYSTICK:
+                self._device = candidate
+                break
+        if self._device is None:
+            raise ValueError("Joystick HID device not found, is it enabled in boot.py?")
+        self._report = bytearray(_REPORT_LENGTH)
+        self._buttons = 0
+        self._x = 0
+        self._y = 0
+        self._z = 0
+        self._rz = 0
+
+    def press_buttons(self, *buttons: int) -> None:
+        """Press and hold the given buttons, 1 - 16."""
+        for button in buttons:
+            self._buttons |= 1 << self._validate_button(button)
+        self._send()
+
+    def release_buttons(self, *buttons: int) -> None:
+        """Release the given buttons, 1 - 16."""
+        for button in buttons:
+            self._buttons &= ~(1 << self._validate_button(button))
+        self._send()
+
+    def release_all_buttons(self) -> None:
+        """Release all buttons."""
+        self._buttons = 0
+        self._send()
+
+    def move_joysticks(self, x: int = None, y: int = None, z: int = None, rz: int = None) -> None:
+        """Set and send the given axes, -32767 to 32767. Axes left as None keep their value."""
+        if x is not None:
+            self._x = self._validate_axis(x)
+        if y is not None:
+            self._y = self._validate_axis(y)
+        if z is not None:
+            self._z = self._validate_axis(z)
+        if rz is not None:
+            self._rz = self._validate_axis(rz)
+        self._send()
+
+    def set_state(self, buttons: int, x: int = None, y: int = None, z: int = None, rz: int = None) -> None:
+        """Set every button and the given axes, then send them in one report.
+
+        :param int buttons: Button bit mask, bit 0 is button 1
+        """
+        if not 0 <= buttons < (1 << _BUTTON_COUNT):
+            raise ValueError(f"Buttons must be a {_BUTTON_COUNT}-bit mask")
+        self._buttons = buttons
+        self.move_joysticks(x, y, z, rz)
+
+    def reset_all(self) -> None:
+        """Release all buttons and centre all axes."""
+        self._buttons = 0
+        self._x = 0
+        self._y = 0
+        self._z = 0
+        self._rz = 0
+        self._send()
+
+    def _send(self) -> None:
+        struct.pack_into(_REPORT_FORMAT, self._report, 0, self._buttons, self._x, self._y, self._z, self._rz)
+        self._device.send_report(self._report)
+
+    @staticmethod
+    def _validate_button(button: int) -> int:
+        if not 1 <= button <= _BUTTON_COUNT:
+            raise ValueError(f"Button number must be between 1 & {_BUTTON_COUNT}")
+        return button - 1
+
+    @staticmethod
+    def _validate_axis(value: int) -> int:
+        if not -AXIS_MAX <= value <= AXIS_MAX:
+            raise ValueError(f"Axis value must be between {-AXIS_MAX} & {AXIS_MAX}")
+        return value
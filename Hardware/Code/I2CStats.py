@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`I2CStats`
+================================================================================
+Opt-in I2C bus instrumentation, per device & per register counts and latency
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+``I2CStats.instrument(driver, name)`` swaps the driver's ``_device``, the
+``I2CDevice`` that ``AS5600``, ``PCA9955`` & ``RangeSensor`` do all their bus
+I/O through, for a ``DeviceStats`` wrapper with the same methods. The wrapper
+times each transaction with ``time.monotonic_ns`` and counts it, with its bytes,
+against the register it addresses, the first byte written (the low byte for
+16-bit register addresses). A read with no write before it counts against the
+last register addressed. Latencies go into a histogram of power of two buckets,
+from under 16us to 4ms & over. All counts are preallocated arrays.
+
+Nothing is changed until a driver is instrumented, and ``release()`` puts the
+original ``I2CDevice`` back, so when off there is no overhead at all.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+"""
+
+import array
+import time
+from micropython import const
+
+_REGISTER_COUNT = const(256)
+_BUCKET_COUNT = const(10)
+_FIRST_BUCKET_US = const(16)    # Upper bound of the first bucket, each bucket doubles
+
+
+class DeviceStats:
+    """
+    Counting & timing stand-in for an ``I2CDevice``.
+
+    :param ~adafruit_bus_device.i2c_device.I2CDevice device: The device to wrap
+    :param str name: Name used in the summary
+    :param int address_bytes: Register address length, 1 or 2 bytes
+    """
+
+    def __init__(self, device, name: str, address_bytes: int = 1):
+        self.device = device
+        self.name = name
+        self._register_byte = address_bytes - 1
+        self._register = 0
+        self.transactions = array.array("L", [0] * _REGISTER_COUNT)
+        self.bytes = array.array("L", [0] * _REGISTER_COUNT)
+        self.histogram = array.array("L", [0] * _BUCKET_COUNT)
+        self.busy_us = 0
+
+    def __getattr__(self, name: str):
+        # Anything not instrumented, e.g. device_address, is the wrapped device's
+        return getattr(self.device, name)
+
+    def __enter__(self) -> "DeviceStats":
+        self.device.__enter__()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> bool:
+        return self.device.__exit__(exception_type, exception_value, traceback)
+
+    def readinto(self, buf, *, start: int = 0, end: int = None) -> None:
+        started = time.monotonic_ns()
+        self.device.readinto(buf, start=start, end=end)
+        self._record(started, (len(buf) if end is None else end) - start)
+
+    def write(self, buf, *, start: int = 0, end: int = None) -> None:
+        started = time.monotonic_ns()
+        self.device.write(buf, start=start, end=end)
+        end = len(buf) if end is None else end
+        if end - start > self._register_byte:
+            self._register = buf[start + self._register_byte]
+        self._record(started, end - start)
+
+    def write_then_readinto(self, out_buffer, in_buffer, *, out_start: int = 0, out_end: int = None, in_start: int = 0, in_end: int = None) -> None:
+        started = time.monotonic_ns()
+        self.device.write_then_readinto(out_buffer, in_buffer, out_start=out_start, out_end=out_end, in_start=in_start, in_end=in_end)
+        out_end = len(out_buffer) if out_end is None else out_end
+        in_end = len(in_buffer) if in_end is None else in_end
+        if out_end - out_start > self._register_byte:
+            self._register = out_buffer[out_start + self._register_byte]
+        self._record(started, out_end - out_start + in_end - in_start)
+
+    @property
+    def total_transactions(self) -> int:
+        return sum(self.transactions)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.bytes)
+
+    def reset(self) -> None:
+        """Zero all counts."""
+        for index in range(_REGISTER_COUNT):
+            self.transactions[index] = 0
+            self.bytes[index] = 0
+        for index in range(_BUCKET_COUNT):
+            self.histogram[index] = 0
+        self.busy_us = 0
+
+    def report(self) -> None:
+        """Print a compact summary to the serial console."""
+        print(f"I2C {self.name}: {self.total_transactions} transactions {self.total_bytes} bytes {self.busy_us} us")
+        for register in range(_REGISTER_COUNT):
+            if self.transactions[register]:
+                print(f" 0x{register:02X} {self.transactions[register]} {self.bytes[register]}")
+        print(" us", " ".join(f"<{_FIRST_BUCKET_US << bucket}:{self.histogram[bucket]}" for bucket in range(_BUCKET_COUNT - 1)),
+              f">={_FIRST_BUCKET_US << (_BUCKET_COUNT - 2)}:{self.histogram[_BUCKET_COUNT - 1]}")
+
+    def _record(self, started: int, count: int) -> None:
+        elapsed_us = (time.monotonic_ns() - started) // 1000
+        register = self._register
+        self.transactions[register] += 1
+        self.bytes[register] += count
+        self.busy_us += elapsed_us
+        bucket = 0
+        limit = _FIRST_BUCKET_US
+        while elapsed_us >= limit and bucket < _BUCKET_COUNT - 1:
+            bucket += 1
+            limit <<= 1
+        self.histogram[bucket] += 1
+
+
+class I2CStats:
+    """The instrumented drivers."""
+
+    def __init__(self):
+        self.drivers = []
+
+    def instrument(self, driver, name: str, address_bytes: int = 1) -> DeviceStats:
+        """Start counting & timing ``driver``'s bus I/O.
+
+        :param driver: An ``AS5600``, ``PCA9955``, ``RangeSensor`` or any driver doing its I/O through ``_device``
+        :param str name: Name used in the summary
+        :param int address_bytes: Register address length, 2 for ``RangeSensor``
+        """
+        stats = DeviceStats(driver._device, name, address_bytes)  # pylint: disable=protected-access
+        driver._device = stats  # pylint: disable=protected-access
+        self.drivers.append(driver)
+        return stats
+
+    def release(self, driver) -> None:
+        """Stop instrumenting ``driver``, restoring its ``I2CDevice``."""
+        driver._device = driver._device.device  # pylint: disable=protected-access
+        self.drivers.remove(driver)
+
+    def release_all(self) -> None:
+        while self.drivers:
+            self.release(self.drivers[-1])
+
+    def reset(self) -> None:
+        for driver in self.drivers:
+            driver._device.reset()  # pylint: disable=protected-access
+
+    def report(self) -> None:
+        """Print every instrumented device's summary to the serial console."""
+        for driver in self.drivers:
+            driver._device.report()  # pylint: disable=protected-access
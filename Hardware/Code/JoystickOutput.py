@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`JoystickOutput`
+================================================================================
+Change driven HID joystick report output
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Tracks the last report sent to the host and only sends a new one when an axis
+has moved by more than the deadband or a button has changed. The current state
+is resent at least every ``keepaliveMs`` so any movement inside the deadband
+still reaches the host. Buttons & axes go out together, one report per update,
+so the counters match the reports the host sees.
+"""
+
+import supervisor
+import Scheduler
+
+
+class JoystickOutput:
+    """
+    :param gamePad: The HID joystick, anything with ``HidJoystick.set_state``
+    :param int deadband: Axis change, in output counts, that is ignored
+    :param int keepaliveMs: Longest time between reports in milliseconds
+    """
+
+    def __init__(self, gamePad, deadband: int = 1, keepaliveMs: int = 250):
+        self.gamePad = gamePad
+        self.deadband = deadband
+        self.keepaliveMs = keepaliveMs
+        self.lastX = None
+        self.lastY = None
+        self.lastButtons = 0
+        self.lastSentMs = supervisor.ticks_ms()
+        self.reportsSent = 0
+        self.reportsSuppressed = 0
+        self.keepalives = 0
+
+    def update(self, x: int, y: int, buttons: int = 0) -> bool:
+        """Send a report if the state has changed enough, or the keepalive is due.
+
+        :param int x: X axis value
+        :param int y: Y axis value
+        :param int buttons: Button bit mask, bit 0 is button 1
+        :return: True if a report was sent
+        """
+        now = supervisor.ticks_ms()
+        changedButtons = buttons ^ self.lastButtons
+        moved = (self.lastX is None
+                 or abs(x - self.lastX) > self.deadband
+                 or abs(y - self.lastY) > self.deadband)
+        if not moved and not changedButtons:
+            if Scheduler.ticks_diff(now, self.lastSentMs) < self.keepaliveMs:
+                self.reportsSuppressed += 1
+                return False
+            self.keepalives += 1
+
+        self.gamePad.set_state(buttons, x = x, y = y)
+        self.lastX = x
+        self.lastY = y
+        self.lastButtons = buttons
+        self.lastSentMs = now
+        self.reportsSent += 1
+        return True
+
+    def resetCounters(self) -> None:
+        self.reportsSent = 0
+        self.reportsSuppressed = 0
+        self.keepalives = 0
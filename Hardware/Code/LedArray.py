@@ -1,34 +1,45 @@
 import random
 import neopixel
 
+# Board is a 64-bit integer, bit (row * 8 + col) is the cell at row, col
+_BOARD_MASK = 0xFFFFFFFFFFFFFFFF
+_NOT_COL_0 = 0xFEFEFEFEFEFEFEFE
+_NOT_COL_7 = 0x7F7F7F7F7F7F7F7F
+_SEED_BOARD = 0x2830624C4C0C0303
+
+
 class LedArray:
     rows = 8
     cols = 8
     maxGenerations = 1000
+    historyLength = 8
+    brightness = 0.1
 
-    def __init__(self, pin):
+    def __init__(self, pin, pixelType=neopixel.NeoPixel):
         self.colour = 0
         self.currentGeneration = 0
-        self.pixels = neopixel.NeoPixel(pin, 64)
-        self.pixels.brightness = 0.1
-        self.panel = [ [1, 1, 0, 0, 0, 0, 0, 0],
-          [1, 1, 0, 0, 0, 0, 0, 0],
-          [0, 0, 1, 1, 0, 0, 0, 0],
-          [0, 0, 1, 1, 0, 0, 1, 0],
-          [0, 0, 1, 1, 0, 0, 1, 0],
-          [0, 1, 0, 0, 0, 1, 1, 0],
-          [0, 0, 0, 0, 1, 1, 0, 0],
-          [0, 0, 0, 1, 0, 1, 0, 0],
-          [0, 0, 0, 0, 0, 0, 0, 0]
-          ]
+        # Brightness is baked into the colour table, so the strip never rescales
+        self.pixels = pixelType(pin, 64, brightness=1.0, auto_write=False)
+        self.colourTable = self.buildColourTable(LedArray.brightness)
+        self.frame = [0] * (LedArray.rows * LedArray.cols)
+        self.board = _SEED_BOARD
+        # Recent boards, a repeat means the panel is static or oscillating
+        self.history = [-1] * LedArray.historyLength
+        self.historyIndex = 0
         self.reSeedPanel()
 
 
     def reSeedPanel(self) -> None:
         self.currentGeneration = 0
+        for j in range(LedArray.historyLength):
+            self.history[j] = -1
         i = random.randint(10,26)
         for j in range(i):
-            self.panel[random.randint(0,LedArray.rows-1)][random.randint(0,LedArray.cols-1)] = random.randint(0,1)
+            cell = 1 << random.randint(0, LedArray.rows * LedArray.cols - 1)
+            if random.randint(0,1):
+                self.board |= cell
+            else:
+                self.board &= ~cell & _BOARD_MASK
 
 
     def colourWheel(self, pos):
@@ -43,46 +54,74 @@ class LedArray:
         return (pos * 3, 0, 255 - pos * 3)
 
 
-    def GameOfLife(self) -> None:
-        # Array to find 8 bordering cells to a given cell
-        neighbourCells = [(1,0), (1,-1), (0,-1), (-1,-1), (-1,0), (-1,1), (0,1), (1,1)]
+    def buildColourTable(self, brightness: float) -> list:
+        # Pre-scaled packed 0xRRGGBB colour for every colour wheel position
+        table = [0] * 256
+        for pos in range(256):
+            r, g, b = self.colourWheel(pos)
+            table[pos] = (int(r * brightness) << 16) | (int(g * brightness) << 8) | int(b * brightness)
+        return table
+
+
+    @staticmethod
+    def nextGeneration(board: int) -> int:
+        # Shift the board one cell in each direction to line every cell up with each of its 8 neighbours,
+        # masking off cells that would wrap around the panel edges.
+        west = (board << 1) & _NOT_COL_0
+        east = (board >> 1) & _NOT_COL_7
+        n0 = (board << 8) & _BOARD_MASK
+        n1 = board >> 8
+        n2 = west
+        n3 = east
+        n4 = (west << 8) & _BOARD_MASK
+        n5 = west >> 8
+        n6 = (east << 8) & _BOARD_MASK
+        n7 = east >> 8
+
+        # Bit-sliced adder tree, every bit position counts its own live neighbours in parallel.
+        # (s2, s1, s0) is the count modulo 8, a count of 8 reads as 0 which is dead either way.
+        a0 = n0 ^ n1 ^ n2
+        a1 = (n0 & n1) | (n2 & (n0 ^ n1))
+        b0 = n3 ^ n4 ^ n5
+        b1 = (n3 & n4) | (n5 & (n3 ^ n4))
+        c0 = n6 ^ n7
+        c1 = n6 & n7
+        s0 = a0 ^ b0 ^ c0
+        d1 = (a0 & b0) | (c0 & (a0 ^ b0))
+        e1 = a1 ^ b1 ^ c1
+        e2 = (a1 & b1) | (c1 & (a1 ^ b1))
+        s1 = e1 ^ d1
+        s2 = e2 ^ (e1 & d1)
 
-        # Copy the existing panel
-        original = self.panel
+        # Live with 3 neighbours, or live with 2 if already live
+        return s1 & ~s2 & (s0 | board) & _BOARD_MASK
 
-        # Process panel.
-        isStatic = True
+
+    def GameOfLife(self) -> None:
+        board = LedArray.nextGeneration(self.board)
+        self.board = board
+        self.currentGeneration += 1
+
+        # Render into the frame buffer, then output neopixels in one go
+        frame = self.frame
+        colourTable = self.colourTable
+        colour = self.colour
         liveCells = 0
-        outputPixel = 0
-        for row in range(LedArray.rows):
-            for col in range(LedArray.cols):
-                # For each cell count the number of live neighbourCells.
-                liveNeighbours = 0
-                for neighbour in neighbourCells:
-                    r = (row + neighbour[0])
-                    c = (col + neighbour[1])
-                    # Check the validity of the neighbouring cell and if it was originally a live cell.
-                    if (r < LedArray.rows and r >= 0) and (c < LedArray.cols and c >= 0) and (original[r][c] == 1):
-                        liveNeighbours += 1
-                # Rule 1 or Rule 3
-                if original[row][col] == 1 and (liveNeighbours < 2 or liveNeighbours > 3):
-                    self.panel[row][col] = 0
-                # Rule 4
-                if original[row][col] == 0 and liveNeighbours == 3:
-                    self.panel[row][col] = 1
-
-                liveCells += self.panel[row][col]
-                if original[row][col] != self.panel[row][col]:
-                    isStatic = False
-                # Output neopixels
-                if self.panel[row][col] == 1:
-                    self.pixels[outputPixel] = self.colourWheel(self.colour)
-                else:
-                    self.pixels[outputPixel] = (0, 0, 0)
-                outputPixel += 1
-                self.colour = (self.colour + 1) % 255
-
-        if isStatic == True or liveCells <= 4 or self.currentGeneration > LedArray.maxGenerations:
+        for outputPixel in range(LedArray.rows * LedArray.cols):
+            if (board >> outputPixel) & 1:
+                liveCells += 1
+                frame[outputPixel] = colourTable[colour]
+            else:
+                frame[outputPixel] = 0
+            colour = (colour + 1) % 255
+        self.colour = colour
+        self.pixels[:] = frame
+        self.pixels.show()
+
+        isRepeat = board in self.history
+        self.history[self.historyIndex] = board
+        self.historyIndex = (self.historyIndex + 1) % LedArray.historyLength
+
+        if isRepeat or liveCells <= 4 or self.currentGeneration > LedArray.maxGenerations:
             # Re-seed the panel
             self.reSeedPanel()
-
@@ -0,0 +1,96 @@
+import PioPixels
+
+# Effect names, in host command order
+PULSE = "pulse"
+STROBE = "strobe"
+BEACON = "beacon"
+RED_ALERT = "redalert"
+EFFECTS = (PULSE, STROBE, BEACON, RED_ALERT)
+
+_AMBER = (255, 165, 0)
+_WHITE = (255, 255, 255)
+_RED = (255, 0, 0)
+
+
+class OctoAlert:
+    pixelCount = 16
+    brightness = 1.0
+
+    def __init__(self, pin, pixelType=PioPixels.PioPixels):
+        self.pixels = pixelType(pin, OctoAlert.pixelCount, auto_write=False)
+        # Byte offset of red, green & blue within each pixel, in the strip's colour order
+        byteOrder = self.pixels.byteorder
+        self.bytesPerPixel = len(byteOrder)
+        self.offsets = (byteOrder.index("R"), byteOrder.index("G"), byteOrder.index("B"))
+        # Every frame of every effect, pre-scaled and in strip byte order
+        self.effects = {}
+        for name in EFFECTS:
+            self.effects[name] = self.buildEffect(name)
+        self.effect = PULSE
+        self.frames = self.effects[PULSE]
+        self.frameIndex = 0
+        # PioPixels sends a packed frame as is, any other pixel buffer (e.g. neopixel.NeoPixel) is set pixel by pixel
+        self.writeFrame = getattr(self.pixels, "write_frame", None) or self.showFrame
+
+    def select(self, name: str) -> None:
+        if name not in self.effects:
+            raise ValueError(f"Effect must be one of {EFFECTS}")
+        self.effect = name
+        self.frames = self.effects[name]
+        self.frameIndex = 0
+
+    def selectIndex(self, index: int) -> None:
+        if not 0 <= index < len(EFFECTS):
+            raise ValueError(f"Effect index must be between 0 & {len(EFFECTS) - 1}")
+        self.select(EFFECTS[index])
+
+    def tick(self) -> None:
+        # Playback is a buffer copy plus one show
+        self.writeFrame(self.frames[self.frameIndex])
+        self.frameIndex = (self.frameIndex + 1) % len(self.frames)
+
+    def showFrame(self, frame: memoryview) -> None:
+        # Fallback for pixel buffers without write_frame, unpack the frame into the pixels then show
+        red, green, blue = self.offsets
+        for pixel in range(OctoAlert.pixelCount):
+            base = pixel * self.bytesPerPixel
+            self.pixels[pixel] = (frame[base + red], frame[base + green], frame[base + blue])
+        self.pixels.show()
+
+    def buildEffect(self, name: str) -> list:
+        # Each frame is a list of per pixel (colour, level) pairs, level 0.0 - 1.0
+        count = OctoAlert.pixelCount
+        frames = []
+        if name == PULSE:
+            # Ramp up and down over 20 frames
+            for step in range(20):
+                level = (10 - abs(10 - step)) / 10
+                frames.append([(_AMBER, level)] * count)
+        elif name == STROBE:
+            # One bright flash every 10 frames
+            frames.append([(_WHITE, 1.0)] * count)
+            for step in range(9):
+                frames.append([(_WHITE, 0.0)] * count)
+        elif name == BEACON:
+            # A lit head with a fading tail rotating around the ring
+            for step in range(count):
+                frame = []
+                for pixel in range(count):
+                    distance = (step - pixel) % count
+                    frame.append((_AMBER, 1.0 / (1 << distance) if distance < 4 else 0.0))
+                frames.append(frame)
+        elif name == RED_ALERT:
+            # Fast deep red pulse, never fully off
+            for step in range(10):
+                level = 0.2 + 0.8 * (5 - abs(5 - step)) / 5
+                frames.append([(_RED, level)] * count)
+        return [self.packFrame(frame) for frame in frames]
+
+    def packFrame(self, frame: list) -> memoryview:
+        data = bytearray(OctoAlert.pixelCount * self.bytesPerPixel)
+        for pixel, (colour, level) in enumerate(frame):
+            base = pixel * self.bytesPerPixel
+            scale = level * OctoAlert.brightness
+            for component in range(3):
+                data[base + self.offsets[component]] = int(colour[component] * scale)
+        return memoryview(data)
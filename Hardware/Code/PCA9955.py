@@ -24,10 +24,25 @@ Implementation Notes
 
 from micropython import const
 import adafruit_bus_device.i2c_device as i2c_device
+import WriteVerify
+
+try:
+    from typing import Optional, Type
+    from types import TracebackType
+    from busio import I2C
+except ImportError:
+    pass
 
 # Register map & bit positions
 
+#---------------------------------------------------------------#
+#   7   |   6   |   5   |   4   |   3   |   2   |   1   |   0   |
+#-------+-------+-------+-------+-------+-------+-------+-------|
+#  AIF  |  AI1  |  AI0  | SLEEP |  SUB1 |  SUB2 |  SUB3 |ALLCALL|
+#---------------------------------------------------------------#
 _REGISTER_MODE1 = const(0x00)            # R/W
+_BIT_SUB1 = const(3)                     #  Respond to SUBADR1 (1 bit), SUB2 & SUB3 follow
+_BIT_ALLCALL = const(0)                  #  Respond to ALLCALLADR (1 bit)
 
  #-------+-------+-------+-------+-------+-------+-------+-------+
  #   7   |   6   |   5   |   4   |   3   |   2   |   1   |   0   |
@@ -53,7 +68,8 @@ _REGISTER_IREF0 = const(0x18)    # R/W
 #-------+-------+-------+-------+-------+-------+-------+-------|
 #  R UP | R DOWN|                   RATE                        |
 #---------------------------------------------------------------#
-_REGISTER_RAMP_RATE_GRP0 = const(0x28)  # R/W
+_REGISTER_RAMP_RATE_GRP0 = const(0x28)  # R/W, groups 1 - 3 follow every _GROUP_STRIDE registers
+_GROUP_STRIDE = const(4)
 _BIT_RAMP_UP = const(7)                 #  Enable/disable (1 bit)
 _BIT_RAMP_DOWN = const(6)               #  Enable/disable (1 bit)
 _BIT_RAMP_RATE = const(0)               #  Enable/disable (6 bits)
@@ -63,7 +79,7 @@ _BIT_RAMP_RATE = const(0)               #  Enable/disable (6 bits)
 #-------+-------+-------+-------+-------+-------+-------+-------|
 #       | CTIME |               FACTOR PER STEP                 |
 #---------------------------------------------------------------#
-_REGISTER_STEP_TIME_GRP0 = const(0x2A)  # R/W
+_REGISTER_STEP_TIME_GRP0 = const(0x29)  # R/W
 _BIT_CYCLE_TIME = const(6)              #  Cycle time 1 bit
 _BIT_FACTOR_PER_STEP = const(0)         #  Factor per step (6 bits)
 
@@ -72,22 +88,38 @@ _BIT_FACTOR_PER_STEP = const(0)         #  Factor per step (6 bits)
 #-------+-------+-------+-------+-------+-------+-------+-------|
 #  H ON | H OFF |          ON TIME      |        OFF TIME       |
 #---------------------------------------------------------------#
-_REGISTER_HOLD_CNTL_GRP0 = const(0x2B)  # R/W
+_REGISTER_HOLD_CNTL_GRP0 = const(0x2A)  # R/W
 _BIT_HOLD_ON = const(7)                 #  Enable/disable (1 bit)
 _BIT_HOLD_OFF = const(6)                #  Enable/disable (1 bit)
 _BIT_HOLD_ON_TIME = const(3)            #  Hold On time (3 bits)
 _BIT_HOLD_OFF_TIME = const(0)           #  Hold Off time (3 bits)
 
-_REGISTER_IREF_GRP0 = const(0x2C)        # R/W
+_REGISTER_IREF_GRP0 = const(0x2B)        # R/W
 _REGISTER_GRAD_MODE_SEL0 = const(0x38)   # R/W
 _REGISTER_GRAD_MODE_SEL1 = const(0x39)   # R/W
 _REGISTER_GRAD_GRP_SEL0 = const(0x3A)    # R/W
+
+#---------------------------------------------------------------#
+#   7   |   6   |   5   |   4   |   3   |   2   |   1   |   0   |
+#-------+-------+-------+-------+-------+-------+-------+-------|
+# START3| CONT3 | START2| CONT2 | START1| CONT1 | START0| CONT0 |
+#---------------------------------------------------------------#
 _REGISTER_GRAD_CTRL = const(0x3E)        # R/W
+_BIT_GRAD_CONTINUOUS = const(0)          #  Single shot/continuous (1 bit per group)
+_BIT_GRAD_START = const(1)               #  Stop/start (1 bit per group)
 _REGISTER_OFFSET = const(0x3F)           # R/W
+_REGISTER_SUBADR1 = const(0x40)          # R/W, SUBADR2 & SUBADR3 follow
+_REGISTER_ALLCALLADR = const(0x43)       # R/W
 _REGISTER_PWMALL = const(0x44)           # W
 _REGISTER_IREALL = const(0x45)           # W
 _REGISTER_EFLAG0 = const(0x46)           # R
 
+_AUTO_INCREMENT = const(0x80)            # Auto-Increment flag, OR'ed into the register address
+_SHADOW_SIZE = const(_REGISTER_ALLCALLADR + 1)  # Read/write registers 0x00 - 0x43
+_CHANNEL_COUNT = const(16)
+_MODE2_READ_WRITE = const(0b00101100)            # MODE2 bits that read back as written
+_FRAME_SIZE = const(1 + 2 * _CHANNEL_COUNT)     # Address + PWM0-15 + IREF0-15
+
 
 _1_BIT =  const(0b00000001)
 _2_BITS = const(0b00000011)
@@ -101,6 +133,11 @@ LED_DRIVER_FULL_ON = const(0x01)
 LED_DRIVER_PWM = const(0x02)
 LED_DRIVER_PWM_GRP = const(0x03)
 
+# Register write read-back policies, see WriteVerify
+VERIFY_OFF = WriteVerify.VERIFY_OFF
+VERIFY_ON = WriteVerify.VERIFY_ON
+VERIFY_SAMPLED = WriteVerify.VERIFY_SAMPLED
+
 
 
 class Channel:
@@ -163,6 +200,15 @@ class Channel:
             raise ValueError(f"Group must be between 0 and 3")
         self._device.write_channel_config(_REGISTER_GRAD_GRP_SEL0, self._index, value)
 
+    @property
+    def gradation(self) -> bool:
+        """Gradation mode enable/disable, output current follows the group's gradation."""
+        return bool(self._device.read_register(_REGISTER_GRAD_MODE_SEL0, self._index >> 3, _1_BIT, self._index & 7))
+
+    @gradation.setter
+    def gradation(self, value: bool) -> bool:
+        self._device.write_register(_REGISTER_GRAD_MODE_SEL0, self._index >> 3, bool(value), _1_BIT, self._index & 7)
+
 
 class Channels:  # pylint: disable=too-few-public-methods
     """Lazily creates and caches channel objects as needed. Treat it like a sequence.
@@ -175,7 +221,7 @@ class Channels:  # pylint: disable=too-few-public-methods
         self._channels = [None] * len(self)
 
     def __len__(self) -> int:
-        return 16
+        return _CHANNEL_COUNT
 
     def __getitem__(self, index: int) -> Channel:
         if not self._channels[index]:
@@ -187,115 +233,142 @@ class Group:
     """A PCA9955 Graduation Group (set of channels)
 
     :param PCA9955 device: The PCA9955 device object
-    :param int index: The index of the channel
+    :param int index: The index of the group
     """
 
     def __init__(self, device: "PCA9955", index: int):
         self._device = device
         self._index = index
+        self._offset = index * _GROUP_STRIDE
 
 
     @property
     def ramp_up(self) -> bool:
         """Ramp-up enable/disable."""
-        return self._device.read_register(_REGISTER_RAMP_RATE_GRP0, self._index, _1_BIT,_BIT_RAMP_UP)
+        return self._device.read_register(_REGISTER_RAMP_RATE_GRP0, self._offset, _1_BIT,_BIT_RAMP_UP)
 
     @ramp_up.setter
     def ramp_up(self, value: bool) -> bool:
-        self._device.write_register(_REGISTER_RAMP_RATE_GRP0, self._index, value, _1_BIT, _BIT_RAMP_UP)
+        self._device.write_register(_REGISTER_RAMP_RATE_GRP0, self._offset, value, _1_BIT, _BIT_RAMP_UP)
 
     @property
     def ramp_down(self) -> bool:
         """Ramp-down enable/disable."""
-        return self._device.read_register(_REGISTER_RAMP_RATE_GRP0, self._index, _1_BIT, _BIT_RAMP_DOWN)
+        return self._device.read_register(_REGISTER_RAMP_RATE_GRP0, self._offset, _1_BIT, _BIT_RAMP_DOWN)
 
     @ramp_down.setter
     def ramp_down(self, value: bool) -> bool:
-        self._device.write_register(_REGISTER_RAMP_RATE_GRP0, self._index, value, _1_BIT, _BIT_RAMP_DOWN)
+        self._device.write_register(_REGISTER_RAMP_RATE_GRP0, self._offset, value, _1_BIT, _BIT_RAMP_DOWN)
 
     @property
     def ramp_rate(self) -> int:
-        """Ramp rate per step 0 - 64."""
-        return self._device.read_register(_REGISTER_RAMP_RATE_GRP0, self._index, _6_BITS, _BIT_RAMP_RATE)
+        """Ramp rate per step 0 - 63."""
+        return self._device.read_register(_REGISTER_RAMP_RATE_GRP0, self._offset, _6_BITS, _BIT_RAMP_RATE)
 
     @ramp_rate.setter
     def ramp_rate(self, value: int) -> int:
-        if not 0 <= value <= 64:
-            raise ValueError("Value must be between 0 & 64")
-        self._device.write_register(_REGISTER_RAMP_RATE_GRP0, self._index, value, _6_BITS, _BIT_RAMP_RATE)
+        if not 0 <= value <= 63:
+            raise ValueError("Value must be between 0 & 63")
+        self._device.write_register(_REGISTER_RAMP_RATE_GRP0, self._offset, value, _6_BITS, _BIT_RAMP_RATE)
 
     @property
     def cycle_time(self) -> int:
         """Cycle time - 0 (0.5ms) or 1 (8ms)."""
-        return self._device.read_register(_REGISTER_STEP_TIME_GRP0 , self._index, _1_BIT, _BIT_CYCLE_TIME)
+        return self._device.read_register(_REGISTER_STEP_TIME_GRP0, self._offset, _1_BIT, _BIT_CYCLE_TIME)
 
     @cycle_time.setter
     def cycle_time(self, value: int) -> int:
-        if not 0 <= value <= 64:
+        if not 0 <= value <= 1:
             raise ValueError("Valid values are 0 (0.5ms) or 1 (8ms)")
-        self._device.write_register(_REGISTER_STEP_TIME_GRP0, self._index, value, _1_BIT, _BIT_CYCLE_TIME)
+        self._device.write_register(_REGISTER_STEP_TIME_GRP0, self._offset, value, _1_BIT, _BIT_CYCLE_TIME)
 
     @property
     def factor_per_step(self) -> int:
-        """Multiple factor per step 0 - 64."""
-        return self._device.read_register(_REGISTER_STEP_TIME_GRP0, self._index, _6_BITS, _BIT_FACTOR_PER_STEP)
+        """Multiple factor per step 0 - 63."""
+        return self._device.read_register(_REGISTER_STEP_TIME_GRP0, self._offset, _6_BITS, _BIT_FACTOR_PER_STEP)
 
     @factor_per_step.setter
     def factor_per_step(self, value: int) -> int:
-        if not 0 <= value <= 64:
-            raise ValueError("Value must be between 0 & 64")
-        self._device.write_register(_REGISTER_STEP_TIME_GRP0, self._index, value, _6_BITS, _BIT_FACTOR_PER_STEP)
+        if not 0 <= value <= 63:
+            raise ValueError("Value must be between 0 & 63")
+        self._device.write_register(_REGISTER_STEP_TIME_GRP0, self._offset, value, _6_BITS, _BIT_FACTOR_PER_STEP)
 
     @property
     def hold_on(self) -> bool:
         """Hold on enable/disable."""
-        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._index, _1_BIT, _BIT_HOLD_ON)
+        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, _1_BIT, _BIT_HOLD_ON)
 
     @hold_on.setter
     def hold_on(self, value: bool) -> bool:
-        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._index, value, _1_BIT, _BIT_HOLD_ON)
+        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, value, _1_BIT, _BIT_HOLD_ON)
 
     @property
     def hold_off(self) -> bool:
         """Hold off enable/disable."""
-        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._index, _1_BIT, _BIT_HOLD_OFF)
+        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, _1_BIT, _BIT_HOLD_OFF)
 
     @hold_off.setter
     def hold_off(self, value: bool) -> bool:
-        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._index, value, _1_BIT, _BIT_HOLD_OFF)
+        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, value, _1_BIT, _BIT_HOLD_OFF)
 
     @property
     def hold_on_time(self) -> int:
         """Hold On time - 0 (0s), 1 (0.25s), 2 (0.5s), 3 (0.75s), 4 (1s), 5 (2s), 6 (4s), 7 (6s)."""
-        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._index, _3_BITS, _BIT_HOLD_ON_TIME)
+        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, _3_BITS, _BIT_HOLD_ON_TIME)
 
     @hold_on_time.setter
     def hold_on_time(self, value: int) -> int:
-        if not 0 <= value <= 64:
+        if not 0 <= value <= 7:
             raise ValueError("Valid values are 0 (0s), 1 (0.25s), 2 (0.5s), 3 (0.75s), 4 (1s), 5 (2s), 6 (4s), 7 (6s)")
-        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._index, value, _3_BITS, _BIT_HOLD_ON_TIME)
+        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, value, _3_BITS, _BIT_HOLD_ON_TIME)
 
     @property
     def hold_off_time(self) -> int:
         """Hold On time  - 0 (0s), 1 (0.25s), 2 (0.5s), 3 (0.75s), 4 (1s), 5 (2s), 6 (4s), 7 (6s)."""
-        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._index, _3_BITS, _BIT_HOLD_OFF_TIME)
+        return self._device.read_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, _3_BITS, _BIT_HOLD_OFF_TIME)
 
     @hold_off_time.setter
     def hold_off_time(self, value: int) -> int:
-        if not 0 <= value <= 64:
+        if not 0 <= value <= 7:
             raise ValueError("Valid values are 0 (0s), 1 (0.25s), 2 (0.5s), 3 (0.75s), 4 (1s), 5 (2s), 6 (4s), 7 (6s)")
-        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._index, value, _3_BITS, _BIT_HOLD_OFF_TIME)
+        self._device.write_register(_REGISTER_HOLD_CNTL_GRP0, self._offset, value, _3_BITS, _BIT_HOLD_OFF_TIME)
 
     @property
     def output_gain_control(self) -> int:
         """Output current gain 0-255."""
-        return self._device.read_register(_REGISTER_IREF_GRP0, self._index)
+        return self._device.read_register(_REGISTER_IREF_GRP0, self._offset)
 
     @output_gain_control.setter
     def output_gain_control(self, value: int) -> int:
-        if not 0 <= value <= 64:
-            raise ValueError("Valid values are 0 (0s), 1 (0.25s), 2 (0.5s), 3 (0.75s), 4 (1s), 5 (2s), 6 (4s), 7 (6s)")
-        self._device.write_register(_REGISTER_IREF_GRP0, self._index, value)
+        if not 0 <= value <= 255:
+            raise ValueError("Value must be between 0 & 255")
+        self._device.write_register(_REGISTER_IREF_GRP0, self._offset, value)
+
+    @property
+    def running(self) -> bool:
+        """True while the group's gradation is running."""
+        return bool(self._device.read_register(_REGISTER_GRAD_CTRL, 0, _1_BIT, self._index * 2 + _BIT_GRAD_START))
+
+    def configure(self, ramp_rate: int, cycle_time: int, factor_per_step: int, hold_on_time: int, hold_off_time: int, output_gain_control: int,
+                  ramp_up: bool = True, ramp_down: bool = True, hold_on: bool = True, hold_off: bool = True) -> None:
+        """Write the whole gradation profile in one transaction, see the individual properties for value ranges."""
+        if not (0 <= ramp_rate <= 63 and 0 <= cycle_time <= 1 and 0 <= factor_per_step <= 63
+                and 0 <= hold_on_time <= 7 and 0 <= hold_off_time <= 7 and 0 <= output_gain_control <= 255):
+            raise ValueError("Gradation value out of range")
+        self._device.write_block(_REGISTER_RAMP_RATE_GRP0 + self._offset, bytes([
+            (bool(ramp_up) << _BIT_RAMP_UP) | (bool(ramp_down) << _BIT_RAMP_DOWN) | (ramp_rate << _BIT_RAMP_RATE),
+            (cycle_time << _BIT_CYCLE_TIME) | (factor_per_step << _BIT_FACTOR_PER_STEP),
+            (bool(hold_on) << _BIT_HOLD_ON) | (bool(hold_off) << _BIT_HOLD_OFF) | (hold_on_time << _BIT_HOLD_ON_TIME) | (hold_off_time << _BIT_HOLD_OFF_TIME),
+            output_gain_control,
+            ]))
+
+    def start(self, continuous: bool = True) -> None:
+        """Start the gradation, once or repeating continuously."""
+        self._device.write_register(_REGISTER_GRAD_CTRL, 0, (1 << _BIT_GRAD_START) | (bool(continuous) << _BIT_GRAD_CONTINUOUS), _2_BITS, self._index * 2)
+
+    def stop(self) -> None:
+        """Stop the gradation."""
+        self._device.write_register(_REGISTER_GRAD_CTRL, 0, 0, _2_BITS, self._index * 2)
 
 
 class Groups:  # pylint: disable=too-few-public-methods
@@ -309,7 +382,7 @@ class Groups:  # pylint: disable=too-few-public-methods
         self.groups = [None] * len(self)
 
     def __len__(self) -> int:
-        return 16
+        return 4
 
     def __getitem__(self, index: int) -> Group:
         if not self.groups[index]:
@@ -317,18 +390,33 @@ class Groups:  # pylint: disable=too-few-public-methods
         return self.groups[index]
 
 
-class PCA9955:
+class PCA9955(WriteVerify.WriteVerify):
     """
     Initialise the PCA9955 chip at ``address`` on ``i2c_bus``.
 
     :param ~busio.I2C i2c_bus: The I2C bus which the PCA9955 is connected to.
     :param int address: The I2C address of the PCA9955.
     :param int reference_clock_speed: The frequency of the internal reference clock in Hertz.
+    :param bool shadow: Keep an in-memory copy of the read/write registers, used in place of
+        a bus read for read-modify-write updates.
+    :param int verify: Register write read-back policy, ``VERIFY_OFF``, ``VERIFY_ON`` or ``VERIFY_SAMPLED``.
+    :param int verify_interval: With ``VERIFY_SAMPLED``, read back every Nth write.
+    :param bool strict: Raise on a read-back mismatch, otherwise only count it in ``verify_failures``.
     """
 
 
-    def __init__(self, i2c: I2C, address: int) -> None:
+    def __init__(self, i2c: I2C, address: int, shadow: bool = False, verify: int = VERIFY_OFF, verify_interval: int = 16, strict: bool = True) -> None:
+        self._init_verify(verify, verify_interval, strict)
         self._device = i2c_device.I2CDevice(i2c, address)
+        self._frame = bytearray(_FRAME_SIZE)
+        self._frame[0] = _REGISTER_PWM0 | _AUTO_INCREMENT
+        # Preallocated command & result buffers, so register I/O does not allocate
+        self._command = bytearray(2)
+        self._result = bytearray(1)
+        self._shadow = None
+        if shadow:
+            self._shadow = bytearray(_SHADOW_SIZE)
+            self.resync()
         self.channels = Channels(self)
         self.groups = Groups(self)
 
@@ -346,6 +434,11 @@ class PCA9955:
     def deinit(self) -> None:
         """Stop using the PCA9955."""
 
+    def resync(self) -> None:
+        """Reload the register shadow from the chip, e.g. after it may have been reset."""
+        if self._shadow is not None:
+            self.read_block(_REGISTER_MODE1, self._shadow)
+
     @property
     def brightness(self) -> int:
         """Global brightness 0 - 255."""
@@ -374,6 +467,46 @@ class PCA9955:
         """True indicates over temperature condition."""
         return bool(self.read_register(_REGISTER_MODE2,  mask = _1_BIT, offset = _BIT_ERROR))
 
+    def write_frame(self, pwm_values, iref_values=None) -> None:
+        """Write all 16 channel brightnesses, and optionally current gains, in a single transaction.
+
+        :param pwm_values: 16 channel brightness values 0 - 255 (bytearray or memoryview)
+        :param iref_values: Optional 16 channel current gain values 0 - 255 (bytearray or memoryview)
+        """
+        if len(pwm_values) != _CHANNEL_COUNT:
+            raise ValueError(f"Frame must contain {_CHANNEL_COUNT} brightness values")
+        # PWM0-15 & IREF0-15 are contiguous, so both fit in one auto-increment write
+        frame = self._frame
+        frame[1:1 + _CHANNEL_COUNT] = pwm_values
+        end = 1 + _CHANNEL_COUNT
+        if iref_values is not None:
+            if len(iref_values) != _CHANNEL_COUNT:
+                raise ValueError(f"Frame must contain {_CHANNEL_COUNT} current gain values")
+            frame[end:_FRAME_SIZE] = iref_values
+            end = _FRAME_SIZE
+        with self._device as i2c:
+            i2c.write(frame, end=end)
+        if self._shadow is not None:
+            self._shadow[_REGISTER_PWM0:_REGISTER_PWM0 + end - 1] = frame[1:end]
+
+    def read_frame(self, pwm_buffer, iref_buffer=None) -> None:
+        """Read all 16 channel brightnesses, and optionally current gains, into caller supplied buffers.
+
+        :param pwm_buffer: 16 byte buffer to receive channel brightness values
+        :param iref_buffer: Optional 16 byte buffer to receive channel current gain values
+        """
+        if len(pwm_buffer) != _CHANNEL_COUNT:
+            raise ValueError(f"Buffer must be {_CHANNEL_COUNT} bytes")
+        if iref_buffer is None:
+            self.read_block(_REGISTER_PWM0, pwm_buffer)
+            return
+        if len(iref_buffer) != _CHANNEL_COUNT:
+            raise ValueError(f"Buffer must be {_CHANNEL_COUNT} bytes")
+        frame = memoryview(self._frame)
+        self.read_block(_REGISTER_PWM0, frame[1:_FRAME_SIZE])
+        pwm_buffer[:] = frame[1:1 + _CHANNEL_COUNT]
+        iref_buffer[:] = frame[1 + _CHANNEL_COUNT:_FRAME_SIZE]
+
     def read_register(self, base_register: int, index: int = 0, mask: int = 0xFF, offset: int = 0) -> int:
         """Read set of bits from register"""
         register = base_register + index
@@ -386,7 +519,7 @@ class PCA9955:
         register = base_register + index
         mask = mask << offset
         inverse_mask = ~mask & 0xFF
-        current_value = self.read_8(register)
+        current_value = self._read_for_update(register)
         value = (current_value & inverse_mask) | (value << offset)
         result = self.write_8(register, value)
         return (result & mask) >> offset
@@ -405,24 +538,249 @@ class PCA9955:
         offset = (index % 4) << 1
         mask = _2_BITS << offset
         inverse_mask = ~mask & 0xFF
-        current_value = self.read_8(register)
+        current_value = self._read_for_update(register)
         value = (current_value & inverse_mask) | (value << offset)
         result = self.write_8(register, value)
         return (result & mask) >> offset
 
     def read_8(self, address: int) -> int:
         """ Read and return a byte from the specified 8-bit register address."""
-        result = bytearray(1)
+        command = self._command
+        result = self._result
+        command[0] = address
         with self._device as i2c:
-            i2c.write(bytes([address]))
-            i2c.readinto(result)
+            i2c.write_then_readinto(command, result, out_end=1)
         return result[0]
 
     def write_8(self, address: int, value: int) -> int:
-        """ write a byte to the specified 8-bit register address."""
-        result = bytearray(1)
+        """ write a byte to the specified 8-bit register address, reading it back if the verify policy says so."""
+        command = self._command
+        result = self._result
+        command[0] = address
+        command[1] = value
+        # PWMALL & IREFALL are write-only
+        verify = address < _SHADOW_SIZE and self._should_verify()
         with self._device as i2c:
-            i2c.write(bytes([address, value]))
-            i2c.write(bytes([address]))
-            i2c.readinto(result)
+            i2c.write(command)
+            if verify:
+                i2c.write_then_readinto(command, result, out_end=1)
+        if self._shadow is not None:
+            self._update_shadow(address, value)
+        if not verify:
+            return value
+        if address == _REGISTER_MODE2:
+            self._check_write(address, value & _MODE2_READ_WRITE, result[0] & _MODE2_READ_WRITE)
+        else:
+            self._check_write(address, value, result[0])
         return result[0]
+
+    def read_block(self, address: int, buffer: bytearray) -> None:
+        """ Read consecutive registers starting at the specified address into buffer, using auto-increment."""
+        command = self._command
+        command[0] = address | _AUTO_INCREMENT
+        with self._device as i2c:
+            i2c.write_then_readinto(command, buffer, out_end=1)
+
+    def write_block(self, address: int, buffer) -> None:
+        """ Write buffer to consecutive registers starting at the specified address, using auto-increment."""
+        data = bytearray(len(buffer) + 1)
+        data[0] = address | _AUTO_INCREMENT
+        data[1:] = buffer
+        with self._device as i2c:
+            i2c.write(data)
+        if self._shadow is not None:
+            for index, value in enumerate(buffer):
+                self._update_shadow(address + index, value)
+
+    def _read_for_update(self, address: int) -> int:
+        # Read the current register value for a read-modify-write, from the shadow when available.
+        if self._shadow is not None and address < _SHADOW_SIZE:
+            return self._shadow[address]
+        return self.read_8(address)
+
+    def _update_shadow(self, address: int, value: int) -> None:
+        # Mirror a register write into the shadow, PWMALL & IREFALL write all 16 channel registers.
+        if address < _SHADOW_SIZE:
+            self._shadow[address] = value
+        elif address == _REGISTER_PWMALL:
+            for index in range(_REGISTER_PWM0, _REGISTER_PWM0 + 16):
+                self._shadow[index] = value
+        elif address == _REGISTER_IREALL:
+            for index in range(_REGISTER_IREF0, _REGISTER_IREF0 + 16):
+                self._shadow[index] = value
+
+
+class Broadcast:
+    """Write-only access to every PCA9955 answering a shared all-call or sub-address
+
+    :param ~busio.I2C i2c_bus: The I2C bus the PCA9955s are connected to.
+    :param int address: The shared 7-bit I2C address.
+    """
+
+    def __init__(self, i2c: I2C, address: int) -> None:
+        self._device = i2c_device.I2CDevice(i2c, address, probe=False)
+        self._command = bytearray(2)
+
+    def write_8(self, address: int, value: int) -> None:
+        """ write a byte to the specified 8-bit register address on every chip."""
+        command = self._command
+        command[0] = address
+        command[1] = value
+        with self._device as i2c:
+            i2c.write(command)
+
+    def write_block(self, address: int, buffer) -> None:
+        """ Write buffer to consecutive registers starting at the specified address on every chip."""
+        data = bytearray(len(buffer) + 1)
+        data[0] = address | _AUTO_INCREMENT
+        data[1:] = buffer
+        with self._device as i2c:
+            i2c.write(data)
+
+
+class BankChannels:  # pylint: disable=too-few-public-methods
+    """The channels of every PCA9955 in a bank as one flat sequence.
+
+    :param PCA9955Bank bank: The PCA9955Bank object
+    """
+
+    def __init__(self, bank: "PCA9955Bank") -> None:
+        self._bank = bank
+
+    def __len__(self) -> int:
+        return len(self._bank.chips) * _CHANNEL_COUNT
+
+    def __getitem__(self, index: int) -> Channel:
+        if not 0 <= index < len(self):
+            raise IndexError("Channel index out of range")
+        return self._bank.chips[index >> 4].channels[index & 0x0F]
+
+
+class PCA9955Bank:
+    """
+    Several PCA9955 chips on one bus, exposed as one flat channel space.
+
+    Every chip is set to answer ``all_call_address``, so global dimming, blanking and
+    gradation start/stop are a single broadcast write. Global dimming uses GRPPWM,
+    so all channels are switched to individual + group dimming (``LED_DRIVER_PWM_GRP``).
+    Channels must stay in that state, as ``PanelEffects`` leaves them, for dimming
+    and ``blank()`` to reach them; one set to ``LED_DRIVER_PWM`` ignores both.
+
+    :param ~busio.I2C i2c_bus: The I2C bus which the PCA9955s are connected to.
+    :param addresses: The I2C address of each PCA9955, in channel order.
+    :param int all_call_address: The 7-bit I2C all-call address shared by the bank.
+    :param bool shadow: Keep an in-memory copy of each chip's read/write registers.
+    """
+
+    def __init__(self, i2c: I2C, addresses, all_call_address: int = 0x70, shadow: bool = False) -> None:
+        self._i2c = i2c
+        self.chips = [PCA9955(i2c, address, shadow=shadow) for address in addresses]
+        self.channels = BankChannels(self)
+        self._dimming = 0xFF
+        for chip in self.chips:
+            chip.write_8(_REGISTER_ALLCALLADR, all_call_address << 1)
+            chip.write_register(_REGISTER_MODE1, 0, 1, _1_BIT, _BIT_ALLCALL)
+            chip.write_register(_REGISTER_MODE2, 0, 0, _1_BIT, _BIT_DMBLNK)
+        self.all_call = Broadcast(i2c, all_call_address)
+        self._broadcast_block(_REGISTER_LEDOUT0, b"\xFF\xFF\xFF\xFF")
+        self._broadcast_8(_REGISTER_GRPPWM, self._dimming)
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    @property
+    def brightness(self) -> int:
+        """Global brightness 0 - 255, sets every channel's PWM."""
+        raise AttributeError("brightness is write-only")
+
+    @brightness.setter
+    def brightness(self, value: int) -> int:
+        if not 0 <= value <= 255:
+            raise ValueError("Value must be between 0 & 255")
+        self._broadcast_8(_REGISTER_PWMALL, value)
+
+    @property
+    def output_current(self) -> int:
+        """Global output current 0 - 255, sets every channel's IREF."""
+        raise AttributeError("output_current is write-only")
+
+    @output_current.setter
+    def output_current(self, value: int) -> int:
+        if not 0 <= value <= 255:
+            raise ValueError("Value must be between 0 & 255")
+        self._broadcast_8(_REGISTER_IREALL, value)
+
+    @property
+    def dimming(self) -> int:
+        """Global dimming 0 - 255, scales every channel without changing its own brightness."""
+        return self._dimming
+
+    @dimming.setter
+    def dimming(self, value: int) -> int:
+        if not 0 <= value <= 255:
+            raise ValueError("Value must be between 0 & 255")
+        self._dimming = value
+        self._broadcast_8(_REGISTER_GRPPWM, value)
+
+    def blank(self) -> None:
+        """Turn every channel off, keeping its brightness & the global dimming."""
+        self._broadcast_8(_REGISTER_GRPPWM, 0)
+
+    def unblank(self) -> None:
+        """Restore the global dimming after ``blank()``."""
+        self._broadcast_8(_REGISTER_GRPPWM, self._dimming)
+
+    def start_effects(self, groups=(0, 1, 2, 3), continuous: bool = True) -> None:
+        """Start gradation ``groups`` on every chip, any other groups are stopped."""
+        value = 0
+        for group in groups:
+            if not 0 <= group <= 3:
+                raise ValueError("Group must be between 0 and 3")
+            value |= ((1 << _BIT_GRAD_START) | (bool(continuous) << _BIT_GRAD_CONTINUOUS)) << (group * 2)
+        self._broadcast_8(_REGISTER_GRAD_CTRL, value)
+
+    def stop_effects(self) -> None:
+        """Stop every gradation group on every chip."""
+        self._broadcast_8(_REGISTER_GRAD_CTRL, 0)
+
+    def write_frame(self, pwm_values, iref_values=None) -> None:
+        """Write the brightness, and optionally current gain, of every channel in the bank, one transaction per chip."""
+        if len(pwm_values) != len(self.channels):
+            raise ValueError(f"Frame must contain {len(self.channels)} brightness values")
+        pwm_values = memoryview(pwm_values)
+        if iref_values is not None:
+            if len(iref_values) != len(self.channels):
+                raise ValueError(f"Frame must contain {len(self.channels)} current gain values")
+            iref_values = memoryview(iref_values)
+        for index, chip in enumerate(self.chips):
+            start = index * _CHANNEL_COUNT
+            end = start + _CHANNEL_COUNT
+            chip.write_frame(pwm_values[start:end], None if iref_values is None else iref_values[start:end])
+
+    def assign_sub_address(self, sub_address: int, address: int, chips) -> Broadcast:
+        """Set sub-address 1 - 3 of the given chip indexes to ``address``, for broadcasts to that subset.
+
+        :return: A write-only broadcast to the chips answering ``address``
+        """
+        if not 1 <= sub_address <= 3:
+            raise ValueError("Sub-address must be between 1 and 3")
+        for index in chips:
+            chip = self.chips[index]
+            chip.write_8(_REGISTER_SUBADR1 + sub_address - 1, address << 1)
+            chip.write_register(_REGISTER_MODE1, 0, 1, _1_BIT, _BIT_SUB1 + 1 - sub_address)
+        return Broadcast(self._i2c, address)
+
+    def _broadcast_8(self, address: int, value: int) -> None:
+        # Write a register on every chip in one transaction, keeping each chip's shadow in step.
+        self.all_call.write_8(address, value)
+        for chip in self.chips:
+            if chip._shadow is not None:  # pylint: disable=protected-access
+                chip._update_shadow(address, value)  # pylint: disable=protected-access
+
+    def _broadcast_block(self, address: int, buffer) -> None:
+        # Write consecutive registers on every chip in one transaction, keeping each chip's shadow in step.
+        self.all_call.write_block(address, buffer)
+        for chip in self.chips:
+            if chip._shadow is not None:  # pylint: disable=protected-access
+                for index, value in enumerate(buffer):
+                    chip._update_shadow(address + index, value)  # pylint: disable=protected-access
@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`PanelEffects`
+================================================================================
+Panel light animations run by the PCA9955 hardware gradation groups
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+A ``Waveform`` compiles a requested breathe period, peak current and hold times
+into PCA9955 gradation register values. ``PanelEffects`` loads it into one of
+the four gradation groups, moves channels into the group and starts it. After
+that the chip runs the animation itself, with no bus traffic or CPU time until
+it is changed.
+
+Each ramp step adds (ramp rate + 1) to the output current and lasts
+(factor per step + 1) cycles of 0.5ms or 8ms.
+
+Animated channels are set to individual + group dimming (``LED_DRIVER_PWM_GRP``),
+never plain ``LED_DRIVER_PWM``, so ``PCA9955Bank`` dimming & ``blank()`` still
+reach them. On a lone chip GRPPWM is 0xFF from reset, so this is the same as
+plain PWM.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+"""
+
+import PCA9955
+
+# Hold time register codes, in milliseconds
+_HOLD_TIMES_MS = (0, 250, 500, 750, 1000, 2000, 4000, 6000)
+# Gradation cycle time register codes, in microseconds
+_CYCLE_TIMES_US = (500, 8000)
+
+
+def _nearest_hold_time(time_ms: int) -> int:
+    best = 0
+    for code, hold_ms in enumerate(_HOLD_TIMES_MS):
+        if abs(hold_ms - time_ms) < abs(_HOLD_TIMES_MS[best] - time_ms):
+            best = code
+    return best
+
+
+class Waveform:
+    """A breathing waveform compiled to gradation group register values
+
+    :param int period_ms: Time for one full breath, ramp up + hold on + ramp down + hold off
+    :param int peak_current: Output current gain at the top of the ramp 0 - 255
+    :param int hold_on_ms: Time held at peak, rounded to the nearest of 0, 250, 500, 750, 1000, 2000, 4000 or 6000ms
+    :param int hold_off_ms: Time held off, rounded as for ``hold_on_ms``
+    """
+
+    def __init__(self, period_ms: int, peak_current: int, hold_on_ms: int = 0, hold_off_ms: int = 0):
+        if not 1 <= peak_current <= 255:
+            raise ValueError("Peak current must be between 1 & 255")
+        self.peak_current = peak_current
+        self.hold_on_time = _nearest_hold_time(hold_on_ms)
+        self.hold_off_time = _nearest_hold_time(hold_off_ms)
+        ramp_us = (period_ms * 1000 - (_HOLD_TIMES_MS[self.hold_on_time] + _HOLD_TIMES_MS[self.hold_off_time]) * 1000) // 2
+        if ramp_us <= 0:
+            raise ValueError("Period must be longer than the hold times")
+
+        # Search for the step size & step time that fit the ramp time. Take the smallest step, for the
+        # smoothest ramp, that is within 2% of the requested time, else whatever comes closest.
+        tolerance = ramp_us // 50
+        best_error = None
+        for ramp_rate in range(64):
+            steps = (peak_current + ramp_rate) // (ramp_rate + 1)
+            for cycle_time, cycle_us in enumerate(_CYCLE_TIMES_US):
+                factor_per_step = (ramp_us + steps * cycle_us // 2) // (steps * cycle_us) - 1
+                if not 0 <= factor_per_step <= 63:
+                    continue
+                error = abs(steps * (factor_per_step + 1) * cycle_us - ramp_us)
+                if best_error is None or error < best_error:
+                    best_error = error
+                    self.ramp_rate = ramp_rate
+                    self.cycle_time = cycle_time
+                    self.factor_per_step = factor_per_step
+            if best_error is not None and best_error <= tolerance:
+                break
+        if best_error is None:
+            raise ValueError("Period can not be produced by the gradation hardware")
+
+    @property
+    def ramp_ms(self) -> int:
+        """Actual time of each ramp once compiled."""
+        steps = (self.peak_current + self.ramp_rate) // (self.ramp_rate + 1)
+        return steps * (self.factor_per_step + 1) * _CYCLE_TIMES_US[self.cycle_time] // 1000
+
+    @property
+    def period_ms(self) -> int:
+        """Actual breathe period once compiled."""
+        return 2 * self.ramp_ms + _HOLD_TIMES_MS[self.hold_on_time] + _HOLD_TIMES_MS[self.hold_off_time]
+
+
+class PanelEffects:
+    """Runs waveforms on the PCA9955 gradation groups
+
+    :param PCA9955 device: The PCA9955 device object
+    """
+
+    def __init__(self, device: PCA9955.PCA9955):
+        self._device = device
+
+    def start(self, group: int, waveform: Waveform, channels, brightness: int = 255, continuous: bool = True) -> None:
+        """Load ``waveform`` into gradation ``group``, assign ``channels`` to it and start it.
+
+        :param int group: Gradation group 0 - 3
+        :param Waveform waveform: The compiled waveform
+        :param channels: Channel indexes to animate
+        :param int brightness: Channel PWM brightness the current is ramped under 0 - 255
+        :param bool continuous: Repeat the waveform, otherwise run it once
+        """
+        target = self._device.groups[group]
+        target.stop()
+        target.configure(waveform.ramp_rate, waveform.cycle_time, waveform.factor_per_step,
+                         waveform.hold_on_time, waveform.hold_off_time, waveform.peak_current)
+        for index in channels:
+            channel = self._device.channels[index]
+            channel.group = group
+            channel.gradation = True
+            channel.brightness = brightness
+            # Keep group dimming, so global dimming & blanking still apply
+            channel.output_state = PCA9955.LED_DRIVER_PWM_GRP
+        target.start(continuous)
+
+    def stop(self, group: int) -> None:
+        """Stop gradation ``group``, its channels hold their current output."""
+        self._device.groups[group].stop()
+
+    def stop_all(self) -> None:
+        """Stop every gradation group."""
+        for group in range(len(self._device.groups)):
+            self.stop(group)
+
+    def release(self, channels) -> None:
+        """Take ``channels`` out of gradation mode, back under direct brightness control."""
+        for index in channels:
+            self._device.channels[index].gradation = False
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`PioPixels`
+================================================================================
+CircuitPython NeoPixel strip driven in the background by an RP2040 PIO state machine
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+A drop-in replacement for ``neopixel.NeoPixel``. ``show()`` copies the finished
+frame into whichever of two transmit buffers is idle and hands it to
+``rp2pio.StateMachine.background_write``, then returns while DMA streams it out.
+A frame being transmitted is never modified.
+
+**Hardware:**
+
+* RP2040 based boards
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+* Adafruit's PIO Assembler library: https://github.com/adafruit/Adafruit_CircuitPython_PIOASM
+* Adafruit's Pixelbuf library: https://github.com/adafruit/Adafruit_CircuitPython_Pixelbuf
+"""
+
+import struct
+import adafruit_pioasm
+import adafruit_pixelbuf
+import rp2pio
+from micropython import const
+
+# Each bit is 16 PIO cycles at 12.8MHz, i.e. the WS2812 800kHz bit rate.
+# A frame is a 32-bit bit count, the pixel bits, then a 32-bit reset delay count.
+_PROGRAM = adafruit_pioasm.Program(
+    """
+.side_set 1 opt
+.wrap_target
+    pull block          side 0
+    out y, 32           side 0      ; get count of pixel bits
+
+bitloop:
+    pull ifempty        side 0      ; drive low
+    out x 1             side 0 [5]
+    jmp !x do_zero      side 1 [3]  ; drive high and branch depending on bit value
+    jmp y--, bitloop    side 1 [4]  ; drive high for a one (long pulse)
+    jmp end_sequence    side 0      ; sequence is over
+
+do_zero:
+    jmp y--, bitloop    side 0 [4]  ; drive low for a zero (short pulse)
+
+end_sequence:
+    pull block          side 0      ; get reset delay count
+    out y, 32           side 0
+wait_reset:
+    jmp y--, wait_reset side 0      ; hold low until the strip latches
+.wrap
+"""
+)
+
+_FREQUENCY = const(12_800_000)
+_RESET_CYCLES = const(3840)     # 300us at 12.8MHz
+
+# Pixel colour orders
+RGB = "RGB"
+GRB = "GRB"
+RGBW = "RGBW"
+GRBW = "GRBW"
+
+
+class PioPixels(adafruit_pixelbuf.PixelBuf):
+    """
+    A NeoPixel strip on ``pin`` transmitted in the background by PIO & DMA.
+
+    :param ~microcontroller.Pin pin: The pin to output NeoPixel data on.
+    :param int n: The number of NeoPixels in the chain.
+    :param int bpp: Bytes per pixel. 3 for RGB and 4 for RGBW pixels.
+    :param float brightness: Brightness of the pixels between 0.0 and 1.0 where 1.0 is full brightness.
+    :param bool auto_write: True if the strip should be updated immediately when a pixel is changed.
+    :param str pixel_order: Colour order of the strip, defaults to ``GRB`` or ``GRBW``.
+    """
+
+    def __init__(self, pin, n: int, *, bpp: int = 3, brightness: float = 1.0, auto_write: bool = True, pixel_order: str = None):
+        if not pixel_order:
+            pixel_order = GRB if bpp == 3 else GRBW
+        elif isinstance(pixel_order, tuple):
+            order_list = [RGBW[order] for order in pixel_order]
+            pixel_order = "".join(order_list)
+
+        byte_count = len(pixel_order) * n
+        bit_count = byte_count * 8
+        padding_count = -byte_count % 4
+        header = struct.pack(">L", bit_count - 1)
+        trailer = b"\0" * padding_count + struct.pack(">L", _RESET_CYCLES)
+        frame_size = len(header) + byte_count + len(trailer)
+        # Two transmit buffers, one may be streaming while the other is filled
+        self._buffers = (bytearray(frame_size), bytearray(frame_size))
+        for buffer in self._buffers:
+            buffer[0:len(header)] = header
+            buffer[frame_size - len(trailer):frame_size] = trailer
+        self._pixels_start = len(header)
+        self._pixels_end = len(header) + byte_count
+        self._next_buffer = 0
+
+        self._sm = rp2pio.StateMachine(
+            _PROGRAM.assembled,
+            auto_pull=False,
+            first_sideset_pin=pin,
+            out_shift_right=False,
+            pull_threshold=32,
+            frequency=_FREQUENCY,
+            **_PROGRAM.pio_kwargs,
+        )
+
+        super().__init__(n, brightness=brightness, byteorder=pixel_order, auto_write=auto_write, header=header, trailer=trailer)
+
+    def deinit(self) -> None:
+        """Blank out the NeoPixels and release the state machine."""
+        self.fill(0)
+        self.show()
+        self.wait()
+        self._sm.deinit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.deinit()
+
+    def __repr__(self):
+        return "[" + ", ".join([str(x) for x in self]) + "]"
+
+    @property
+    def n(self) -> int:
+        """The number of NeoPixels in the chain (read-only)"""
+        return len(self)
+
+    @property
+    def busy(self) -> bool:
+        """True while a frame is still being transmitted or is queued to be."""
+        return self._sm.writing or self._sm.pending_write
+
+    def wait(self) -> None:
+        """Block until every queued frame has been transmitted."""
+        while self.busy:
+            pass
+
+    def write_frame(self, frame) -> None:
+        """Transmit raw pixel bytes, already in strip colour order and scaled for brightness.
+
+        The pixel buffer, and so ``brightness`` and ``pixels[i]``, is bypassed.
+
+        :param frame: ``n * bpp`` bytes of pixel data (bytearray or memoryview)
+        """
+        if len(frame) != self._pixels_end - self._pixels_start:
+            raise ValueError(f"Frame must be {self._pixels_end - self._pixels_start} bytes")
+        buffer = self._idle_buffer()
+        buffer[self._pixels_start:self._pixels_end] = frame
+        self._background_write(buffer)
+
+    def _transmit(self, buffer: bytearray) -> None:
+        frame = self._idle_buffer()
+        frame[:] = buffer
+        self._background_write(frame)
+
+    def _idle_buffer(self) -> bytearray:
+        # If a frame is already queued behind the one streaming, the idle buffer is the
+        # queued one, so wait for it to start (at most one frame time) before reusing it.
+        while self._sm.pending_write:
+            pass
+        return self._buffers[self._next_buffer]
+
+    def _background_write(self, buffer: bytearray) -> None:
+        self._next_buffer ^= 1
+        self._sm.background_write(once=memoryview(buffer).cast("I"), swap=True)
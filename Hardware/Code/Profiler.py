@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`Profiler`
+================================================================================
+Main loop section timing, sample period jitter and memory statistics
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Each named section keeps a count, min, max & total duration in microseconds,
+and a histogram for the 99th percentile, all in fixed-size integer arrays, so
+recording never allocates beyond ``time.monotonic_ns`` itself. Histogram buckets
+are 4 per octave, so p99 is reported to within 25%, from 1us to 131ms. Longer
+runs all count in the top bucket, so a p99 there is capped by the max.
+
+``tick()`` is called once per joystick sample. It records how far the time since
+the previous sample was from the job's period as the ``jitter`` section. Jobs are
+scheduled in whole ``ticks_ms``, so this includes up to 1ms of rounding.
+It also tracks the ``gc.mem_free`` low-water mark and counts garbage collections,
+seen as a rise in free memory since the previous tick.
+
+Sections are indexes into the names passed in, for a cheap lookup. With
+``enabled`` False every call returns straight away.
+
+On the RP2040 ``time.monotonic_ns()`` is past the small int range about 1s
+after boot, so each reading, and each difference taken from it, allocates a
+long int: about a dozen per joystick sample. That garbage brings on the GC pauses
+the sampling path is otherwise free of, and ``gcRuns`` counts them. So
+profiling is for tuning sessions, and code.py ships with it off.
+"""
+
+import array
+import gc
+import time
+from micropython import const
+
+_BUCKET_COUNT = const(64)
+_MAX_US = const(0xFFFFFFFF)
+
+
+def bucketOf(us: int) -> int:
+    """Histogram bucket for a duration, 4 buckets per octave."""
+    if us < 4:
+        return us
+    shift = 0
+    while (us >> shift) >= 8:
+        shift += 1
+    bucket = (shift + 1) * 4 + ((us >> shift) & 3)
+    return bucket if bucket < _BUCKET_COUNT else _BUCKET_COUNT - 1
+
+
+def bucketLimit(bucket: int) -> int:
+    """Largest duration counted in a bucket."""
+    if bucket < 4:
+        return bucket
+    shift = (bucket >> 2) - 1
+    return ((5 + (bucket & 3)) << shift) - 1
+
+
+class Profiler:
+    """
+    :param tuple sections: Section names, recorded by index
+    :param bool enabled: Record timings, when False all calls return immediately
+    """
+
+    def __init__(self, sections: tuple, enabled: bool = True):
+        self.enabled = enabled
+        self.sections = tuple(sections) + ("jitter",)
+        self.jitter = len(self.sections) - 1
+        count = len(self.sections)
+        self.counts = array.array("L", [0] * count)
+        self.minimums = array.array("L", [_MAX_US] * count)
+        self.maximums = array.array("L", [0] * count)
+        self.totals = array.array("L", [0] * count)
+        self.histograms = array.array("L", [0] * (count * _BUCKET_COUNT))
+        self.lastTickNs = 0
+        self.lastFree = 0
+        self.gcRuns = 0
+        self.memFreeLow = _MAX_US
+
+    def start(self) -> int:
+        """The start time of a run of sections, pass it to the first ``lap()``."""
+        if not self.enabled:
+            return 0
+        return time.monotonic_ns()
+
+    def lap(self, section: int, started: int) -> int:
+        """Record ``section`` as running from ``started`` until now, and return now for the next section."""
+        if not self.enabled:
+            return 0
+        now = time.monotonic_ns()
+        self.record(section, (now - started) // 1000)
+        return now
+
+    def timed(self, section: int, callback):
+        """Wrap ``callback`` so each call is recorded as ``section``, e.g. for a scheduler job."""
+        def run():
+            if not self.enabled:
+                callback()
+                return
+            started = time.monotonic_ns()
+            callback()
+            self.record(section, (time.monotonic_ns() - started) // 1000)
+        return run
+
+    def tick(self, periodMs: int) -> None:
+        """Track sample period jitter, GC runs and free memory, once per sample.
+
+        :param int periodMs: The period the sample was scheduled at
+        """
+        if not self.enabled:
+            return
+        now = time.monotonic_ns()
+        if self.lastTickNs:
+            deviation = (now - self.lastTickNs) // 1000 - periodMs * 1000
+            self.record(self.jitter, deviation if deviation >= 0 else -deviation)
+        self.lastTickNs = now
+        free = gc.mem_free()
+        if free > self.lastFree and self.lastFree:
+            self.gcRuns += 1
+        self.lastFree = free
+        if free < self.memFreeLow:
+            self.memFreeLow = free
+
+    def record(self, section: int, us: int) -> None:
+        if self.totals[section] > _MAX_US - us:
+            # Halve rather than overflow, the mean & percentiles are unchanged
+            self.totals[section] >>= 1
+            self.halveHistogram(section)
+        self.counts[section] += 1
+        self.totals[section] += us
+        if us < self.minimums[section]:
+            self.minimums[section] = us
+        if us > self.maximums[section]:
+            self.maximums[section] = us
+        self.histograms[section * _BUCKET_COUNT + bucketOf(us)] += 1
+
+    def halveHistogram(self, section: int) -> None:
+        # Count stays the histogram's total, so percentile() targets line up with the buckets
+        base = section * _BUCKET_COUNT
+        count = 0
+        for index in range(base, base + _BUCKET_COUNT):
+            self.histograms[index] >>= 1
+            count += self.histograms[index]
+        self.counts[section] = count
+
+    def percentile(self, section: int, percent: int = 99) -> int:
+        """Duration in microseconds that ``percent`` of the section's runs were within."""
+        count = self.counts[section]
+        if not count:
+            return 0
+        target = (count * percent + 99) // 100
+        seen = 0
+        base = section * _BUCKET_COUNT
+        for bucket in range(_BUCKET_COUNT):
+            seen += self.histograms[base + bucket]
+            if seen >= target:
+                return min(bucketLimit(bucket), self.maximums[section])
+        return self.maximums[section]
+
+    def stats(self, section: int) -> tuple:
+        """``(count, min, mean, max, p99)`` of a section, in microseconds."""
+        count = self.counts[section]
+        if not count:
+            return (0, 0, 0, 0, 0)
+        return (count, self.minimums[section], self.totals[section] // count, self.maximums[section], self.percentile(section))
+
+    def reset(self) -> None:
+        for section in range(len(self.sections)):
+            self.counts[section] = 0
+            self.minimums[section] = _MAX_US
+            self.maximums[section] = 0
+            self.totals[section] = 0
+        for index in range(len(self.histograms)):
+            self.histograms[index] = 0
+        self.lastTickNs = 0
+        self.gcRuns = 0
+        self.memFreeLow = _MAX_US
+
+    def report(self, jobs=()) -> None:
+        """Print the statistics, and each scheduler job's runs & overruns, to the serial console."""
+        if not self.enabled:
+            print("Profiling is off, set PROFILE = True in code.py")
+            return
+        print("section count min mean max p99 (us)")
+        for section, name in enumerate(self.sections):
+            print(name, *self.stats(section))
+        for job in jobs:
+            print("job", job.name, "runs", job.runs, "overruns", job.overruns)
+        print("gc runs", self.gcRuns, "mem_free low", self.memFreeLow if self.memFreeLow != _MAX_US else gc.mem_free())
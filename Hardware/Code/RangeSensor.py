@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`RangeSensor`
+================================================================================
+Non-blocking VL6180X time of flight ranging in continuous mode
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+The VL6180X is put into continuous ranging mode, so it measures on its own every
+``period_ms``. ``poll()`` only touches the bus when a new result is ready, as
+signalled by the GPIO1 interrupt pin if one is wired, or otherwise by the
+interrupt status register. ``range`` always returns the last good measurement
+straight away, so reading it never waits for a conversion.
+
+Start up waits up to 5 measurement periods for a first good measurement. If
+there is none, e.g. no target in range, ``range`` starts at the first raw
+reading, or 0 if there wasn't one, and the errors are counted as usual.
+
+**Hardware:**
+
+* `VL6180X <https://www.st.com/en/imaging-and-photonics-solutions/vl6180x.html>`
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+* Adafruit's VL6180X library: https://github.com/adafruit/Adafruit_CircuitPython_VL6180X
+"""
+
+import time
+from micropython import const
+import adafruit_bus_device.i2c_device as i2c_device
+import adafruit_vl6180x
+import digitalio
+
+# Register map & bit positions
+
+_VL6180X_DEFAULT_I2C_ADDR = const(0x29)
+_REGISTER_SYSTEM_MODE_GPIO1 = const(0x0011)
+_REGISTER_SYSTEM_INTERRUPT_CONFIG_GPIO = const(0x0014)
+_REGISTER_SYSTEM_INTERRUPT_CLEAR = const(0x0015)
+_REGISTER_RESULT_RANGE_STATUS = const(0x004D)
+_REGISTER_RESULT_INTERRUPT_STATUS_GPIO = const(0x004F)
+_REGISTER_RESULT_RANGE_VAL = const(0x0062)
+
+_GPIO1_INTERRUPT_ACTIVE_LOW = const(0x10)
+_RANGE_INTERRUPT_NEW_SAMPLE = const(0x04)
+_RANGE_INTERRUPT_MASK = const(0x07)
+_INTERRUPT_CLEAR_ALL = const(0x07)
+_RANGE_ERROR_SHIFT = const(4)
+_STARTUP_WAIT_PERIODS = const(5)
+
+
+class RangeSensor:
+    """
+    Initialise the VL6180X chip at ``address`` on ``i2c_bus`` and start continuous ranging.
+
+    :param ~busio.I2C i2c_bus: The I2C bus which the VL6180X is connected to.
+    :param int period_ms: Time between measurements in milliseconds, 20 - 2550 in steps of 10.
+    :param ~microcontroller.Pin interrupt_pin: Pin wired to the VL6180X GPIO1, or None to poll the status register.
+    :param int address: The I2C address of the VL6180X.
+    """
+
+    def __init__(self, i2c, period_ms: int = 20, interrupt_pin=None, address: int = _VL6180X_DEFAULT_I2C_ADDR):
+        self.sensor = adafruit_vl6180x.VL6180X(i2c, address)
+        self._device = i2c_device.I2CDevice(i2c, address)
+        self._command = bytearray(3)
+        self._result = bytearray(1)
+        self._interrupt = None
+        self.samples = 0
+        self.errors = 0
+
+        # Raise GPIO1 (active low) when a new range sample is ready
+        self._write_8(_REGISTER_SYSTEM_MODE_GPIO1, _GPIO1_INTERRUPT_ACTIVE_LOW)
+        self._write_8(_REGISTER_SYSTEM_INTERRUPT_CONFIG_GPIO, _RANGE_INTERRUPT_NEW_SAMPLE)
+        self._write_8(_REGISTER_SYSTEM_INTERRUPT_CLEAR, _INTERRUPT_CLEAR_ALL)
+        if interrupt_pin is not None:
+            self._interrupt = digitalio.DigitalInOut(interrupt_pin)
+            self._interrupt.switch_to_input(pull=digitalio.Pull.UP)
+
+        self.sensor.start_range_continuous(period_ms)
+        # Wait a few periods for a first good measurement, so range is valid from the start,
+        # but never block start up on one
+        self._range = 0
+        self._first_raw = None
+        deadline = time.monotonic_ns() + period_ms * _STARTUP_WAIT_PERIODS * 1000000
+        while not self.poll():
+            if time.monotonic_ns() >= deadline:
+                if self._first_raw is not None:
+                    self._range = self._first_raw
+                break
+
+    @property
+    def range(self) -> int:
+        """The last good range in millimeters, never blocks."""
+        return self._range
+
+    def poll(self) -> bool:
+        """Pick up a new measurement if one is ready.
+
+        :return: True if ``range`` was updated with a new good measurement
+        """
+        if self._interrupt is not None:
+            if self._interrupt.value:
+                return False
+        elif self._read_8(_REGISTER_RESULT_INTERRUPT_STATUS_GPIO) & _RANGE_INTERRUPT_MASK != _RANGE_INTERRUPT_NEW_SAMPLE:
+            return False
+        value = self._read_8(_REGISTER_RESULT_RANGE_VAL)
+        status = self._read_8(_REGISTER_RESULT_RANGE_STATUS) >> _RANGE_ERROR_SHIFT
+        self._write_8(_REGISTER_SYSTEM_INTERRUPT_CLEAR, _INTERRUPT_CLEAR_ALL)
+        if self._first_raw is None:
+            self._first_raw = value
+        if status:
+            # Keep the last good value through dropouts
+            self.errors += 1
+            return False
+        self._range = value
+        self.samples += 1
+        return True
+
+    def deinit(self) -> None:
+        """Stop continuous ranging and release the interrupt pin."""
+        self.sensor.stop_range_continuous()
+        if self._interrupt is not None:
+            self._interrupt.deinit()
+
+    # Internal Class Functions
+
+    def _read_8(self, address: int) -> int:
+        # Read and return a byte from the specified 16-bit register address.
+        command = self._command
+        result = self._result
+        command[0] = (address >> 8) & 0xFF
+        command[1] = address & 0xFF
+        with self._device as i2c:
+            i2c.write_then_readinto(command, result, out_end=2)
+        return result[0]
+
+    def _write_8(self, address: int, value: int) -> None:
+        # Write a byte to the specified 16-bit register address.
+        command = self._command
+        command[0] = (address >> 8) & 0xFF
+        command[1] = address & 0xFF
+        command[2] = value
+        with self._device as i2c:
+            i2c.write(command)
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`Scheduler`
+================================================================================
+Deadline based cooperative job scheduler for the control panel main loop
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Each job is an asyncio task that runs its callback, advances its deadline by its
+period and sleeps until the next deadline. Deadlines are kept in
+``supervisor.ticks_ms`` time, so job rates do not depend on how long the rest of
+the loop takes.
+
+A job that overruns its deadline skips the missed periods rather than running
+back-to-back to catch up, and always yields after running, so a slow job (e.g.
+Game of Life) cannot starve a fast one (e.g. joystick sampling).
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+* CircuitPython asyncio: https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+"""
+
+from micropython import const
+import asyncio
+import supervisor
+
+# supervisor.ticks_ms() wraps at 2**29
+_TICKS_PERIOD = const(1 << 29)
+_TICKS_MAX = const(_TICKS_PERIOD - 1)
+_TICKS_HALFPERIOD = const(_TICKS_PERIOD // 2)
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    """Add a delta to a ticks_ms value, handling wraparound."""
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(ticks1: int, ticks2: int) -> int:
+    """Signed difference ticks1 - ticks2 between two ticks_ms values, handling wraparound."""
+    diff = (ticks1 - ticks2) & _TICKS_MAX
+    return ((diff + _TICKS_HALFPERIOD) & _TICKS_MAX) - _TICKS_HALFPERIOD
+
+
+class Job:
+    """A periodic job
+
+    :param str name: Job name, used for diagnostics
+    :param callback: Function called with no arguments each period
+    :param int period_ms: Period between deadlines in milliseconds
+    """
+
+    def __init__(self, name: str, callback, period_ms: int):
+        if period_ms <= 0:
+            raise ValueError("Period must be greater than 0")
+        self.name = name
+        self.callback = callback
+        self.period_ms = period_ms
+        self.enabled = True
+        self.runs = 0
+        self.overruns = 0
+        self.deadline = 0
+
+    async def _run(self) -> None:
+        self.deadline = supervisor.ticks_ms()
+        while True:
+            if self.enabled:
+                self.callback()
+                self.runs += 1
+            self.deadline = ticks_add(self.deadline, self.period_ms)
+            delay = ticks_diff(self.deadline, supervisor.ticks_ms())
+            if delay < 0:
+                # Overran, skip the missed periods and re-anchor on now
+                self.overruns += 1
+                self.deadline = supervisor.ticks_ms()
+                delay = 0
+            # Always yield so other due jobs get to run
+            await asyncio.sleep(delay / 1000)
+
+
+class Scheduler:
+    """Runs a set of periodic jobs on ticks_ms deadlines, sleeping in between."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def add(self, name: str, callback, period_ms: int) -> Job:
+        """Register ``callback`` to be run every ``period_ms`` milliseconds.
+
+        Jobs registered first are run first when several fall due together,
+        so register the most latency sensitive job first.
+        """
+        job = Job(name, callback, period_ms)
+        self.jobs.append(job)
+        return job
+
+    def __getitem__(self, name: str) -> Job:
+        for job in self.jobs:
+            if job.name == name:
+                return job
+        raise KeyError(name)
+
+    async def run_async(self) -> None:
+        """Run all registered jobs forever."""
+        await asyncio.gather(*[asyncio.create_task(job._run()) for job in self.jobs])  # pylint: disable=protected-access
+
+    def run(self) -> None:
+        """Run all registered jobs forever, blocking the caller."""
+        asyncio.run(self.run_async())
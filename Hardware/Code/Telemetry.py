@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`Telemetry`
+================================================================================
+Binary telemetry frames to the Raspberry Pi over the USB CDC data channel
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Each frame is fixed size and little endian, packed with ``struct.pack_into`` into a
+preallocated buffer:
+
+======  ======  =========================================================
+Offset  Format  Field
+======  ======  =========================================================
+0       H       Sync, 0x5AA5 (bytes A5 5A)
+2       B       Version
+3       B       Frame length in bytes, checksum included
+4       H       Sequence number, wraps at 65536
+6       I       ``supervisor.ticks_ms`` when sent
+10      H       Raw AS5600 angle (RAW ANGLE)
+12      H       AS5600 angle (ANGLE)
+14      B       Raw range in mm
+15      B       Filtered range in mm
+16      h       Roll (X) axis as sent to the host
+18      h       Pitch (Y) axis as sent to the host
+20      B       AS5600 STATUS, magnet detected / too weak / too strong bits
+21      B       AS5600 AGC
+22      H       AS5600 MAGNITUDE
+24      H       Joystick sample period jitter mean, us
+26      H       Joystick sample period jitter p99, us
+28      H       Joystick sample period jitter max, us
+30      H       Joystick job overruns
+32      H       Garbage collections
+34      I       ``gc.mem_free`` low-water mark, 0xFFFFFFFF if not yet measured
+38      H       Fletcher-16 checksum of bytes 2 - 37
+======  ======  =========================================================
+
+``Pi/TelemetryDecoder.py`` decodes the stream. The data channel is enabled in
+boot.py. Writes never block, if the Pi isn't reading frames are dropped, which
+the sequence number shows.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+"""
+
+import struct
+import supervisor
+from micropython import const
+
+SYNC = const(0x5AA5)
+VERSION = const(1)
+FORMAT = "<HBBHIHHBBhhBBHHHHHHI"
+FRAME_SIZE = struct.calcsize(FORMAT) + 2
+_U16_MAX = const(0xFFFF)
+
+
+def fletcher16(buffer, start: int, end: int) -> int:
+    """Fletcher-16 checksum of ``buffer[start:end]``."""
+    sum1 = 0
+    sum2 = 0
+    for index in range(start, end):
+        sum1 = (sum1 + buffer[index]) % 255
+        sum2 = (sum2 + sum1) % 255
+    return (sum2 << 8) | sum1
+
+
+class Telemetry:
+    """
+    :param serial: The ``usb_cdc.data`` serial port, or None if it isn't enabled
+    """
+
+    def __init__(self, serial):
+        self.serial = serial
+        if serial is not None:
+            # Drop frames rather than hold up the loop when the Pi isn't reading
+            serial.write_timeout = 0
+        self.buffer = bytearray(FRAME_SIZE)
+        self.sequence = 0
+        self.framesSent = 0
+        self.framesDropped = 0
+
+    @property
+    def connected(self) -> bool:
+        """True if the Pi has the data channel open."""
+        return self.serial is not None and self.serial.connected
+
+    def send(self, rawAngle: int, angle: int, rawRange: int, range_: int, roll: int, pitch: int,
+             magnetStatus: int, agc: int, magnitude: int, jitter: tuple, overruns: int, gcRuns: int, memFreeLow: int) -> bool:
+        """Pack and send one frame.
+
+        :param tuple jitter: Joystick period jitter ``Profiler.stats()``, ``(count, min, mean, max, p99)`` in microseconds
+        :return: True if the whole frame was written
+        """
+        buffer = self.buffer
+        struct.pack_into(FORMAT, buffer, 0, SYNC, VERSION, FRAME_SIZE, self.sequence, supervisor.ticks_ms(),
+                         rawAngle, angle, rawRange, range_, roll, pitch, magnetStatus, agc, magnitude,
+                         min(jitter[2], _U16_MAX), min(jitter[4], _U16_MAX), min(jitter[3], _U16_MAX),
+                         overruns & _U16_MAX, gcRuns & _U16_MAX, memFreeLow)
+        struct.pack_into("<H", buffer, FRAME_SIZE - 2, fletcher16(buffer, 2, FRAME_SIZE - 2))
+        self.sequence = (self.sequence + 1) & _U16_MAX
+        if self.serial.write(buffer) == FRAME_SIZE:
+            self.framesSent += 1
+            return True
+        self.framesDropped += 1
+        return False
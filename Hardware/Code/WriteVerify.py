@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`WriteVerify`
+================================================================================
+Register write read-back policy shared by the I2C drivers
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+``AS5600`` & ``PCA9955`` inherit ``WriteVerify`` and call ``_init_verify()``
+from their constructors. Each register write asks ``_should_verify()`` whether
+to read the register back, and passes what it read to ``_check_write()``.
+The drivers re-export the ``VERIFY_*`` constants, so ``AS5600.VERIFY_ON`` etc.
+still work.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards: https://github.com/adafruit/circuitpython/releases
+"""
+
+from micropython import const
+
+VERIFY_OFF = const(0)
+VERIFY_ON = const(1)
+VERIFY_SAMPLED = const(2)
+
+
+class WriteVerify:
+    """Write read-back policy & counts, mixed into a driver."""
+
+    def _init_verify(self, verify: int, verify_interval: int, strict: bool) -> None:
+        if not VERIFY_OFF <= verify <= VERIFY_SAMPLED:
+            raise ValueError(f"Verify value must be between {VERIFY_OFF} & {VERIFY_SAMPLED}")
+        if verify_interval < 1:
+            raise ValueError("Verify interval must be at least 1")
+        self.verify = verify
+        self.verify_interval = verify_interval
+        self.strict = strict
+        self.verify_count = 0
+        self.verify_failures = 0
+        self._write_count = 0
+
+    def _should_verify(self) -> bool:
+        # Apply the verify policy to decide whether this write is read back.
+        if self.verify == VERIFY_OFF:
+            return False
+        if self.verify == VERIFY_SAMPLED:
+            self._write_count += 1
+            if self._write_count < self.verify_interval:
+                return False
+            self._write_count = 0
+        return True
+
+    def _check_write(self, address: int, expected: int, actual: int) -> None:
+        # Count, and if strict raise on, a read-back mismatch.
+        self.verify_count += 1
+        if actual != expected:
+            self.verify_failures += 1
+            if self.strict:
+                raise RuntimeError(f"Register 0x{address:02X} read back 0x{actual:X}, expected 0x{expected:X}")
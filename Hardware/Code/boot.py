@@ -0,0 +1,8 @@
+import usb_cdc
+import usb_hid
+import HidJoystick
+
+# Replace the default keyboard, mouse & consumer control devices with the high resolution joystick
+usb_hid.enable((HidJoystick.device(),))
+# Second USB serial port for binary telemetry to the Pi, alongside the REPL console
+usb_cdc.enable(console=True, data=True)
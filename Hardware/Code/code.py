@@ -1,72 +1,87 @@
+import sys
 import board
 import busio
-import neopixel
+import supervisor
 import adafruit_bus_device.i2c_device as i2c_device
-import adafruit_vl6180x
 import AS5600
+import AdaptiveSampling
+import AnglePredictor
+import AxisMap
+import Filters
+import HidJoystick
+import I2CStats
+import JoystickOutput
 import LedArray
+import OctoAlert
+import PioPixels
+import Profiler
+import RangeSensor
+import Scheduler
+import Telemetry
+import usb_cdc
 import usb_hid
-from adafruit_hid.gamepad import Gamepad
 from micropython import const
 import microcontroller
 from microcontroller import watchdog as watchDog
 from watchdog import WatchDogMode
 
 
-class OctoAlert:
-    def __init__(self, pin: int):
-        self.brightness = 0
-        self.pixels = neopixel.NeoPixel(pin, 16)
-        self.pixels.fill((255, 165, 0))
-
-    def pulse(self) -> None:
-        self.pixels.brightness = (10-abs(10-self.brightness))/10
-        self.brightness = (self.brightness + 1) % 20
-
-
-class MovingAverageFilter:
-    def __init__(self, initialValue: int):
-        self.buffer = [initialValue] * 8
-        self.index = 0
-
-    def update(self, newValue: int) -> int:
-        self.buffer[self.index] = newValue
-        self.index = (self.index + 1) % 8
-        return int(sum(self.buffer) >> 3)
-
-
-FILTER_ALPHA_POINT2 = const(0x3333)   #(0.2 * 65535)
-def ExponentialMovingAverageFilter(new, average, alpha):
-
-    tmp = new * (alpha + 1 ) + average * (65536 - alpha)
-    return int((tmp + 32768) / 65536)
-
-
-octoalert = OctoAlert(board.GP1)
-ledArray = LedArray.LedArray(board.GP0)
+# Pixel data is streamed by PIO & DMA, so LED updates don't hold up the joystick
+octoalert = OctoAlert.OctoAlert(board.GP1, PioPixels.PioPixels)
+ledArray = LedArray.LedArray(board.GP0, PioPixels.PioPixels)
 
 # Create I2C bus.
 i2c = busio.I2C (scl=board.GP15, sda=board.GP14)
 
-'''
-# Create time of flight ranging sensor instance.
-rangeSensor = adafruit_vl6180x.VL6180X(i2c)
-filteredRange = MovingAverageFilter(rangeSensor.range)
+# Create time of flight ranging sensor instance, measuring continuously in the background.
+# GPIO1 isn't wired, so new samples are picked up by polling the status register.
+rangeSensor = RangeSensor.RangeSensor(i2c, period_ms = 20)
+# Reject dropout spikes, then smooth
+currentRange = rangeSensor.range
+filteredRange = Filters.FilterChain(Filters.MedianOf3Filter(currentRange), Filters.BoxcarFilter(currentRange))
 OFFSET = const(6) # Min reading from range sensor
 MAX = const(106) # Max reading from range sensor
-scale = int(round(65536 / (MAX - OFFSET)))
-'''
+# Range sensor reading (0 - 255mm) to HID joystick input, OFFSET to MAX is full travel
+pitchMap = AxisMap.AxisMap({"normal": AxisMap.Curve((MAX - OFFSET) >> 1, outputMax = HidJoystick.AXIS_MAX)}, "normal", 256, (OFFSET + MAX) >> 1)
 
 # Create Magnetic Rotation Sensor.
 angleSensor = AS5600.AS5600(i2c)
 # Set current position as our new zero datum
-angleSensor.setZeroPosition(angleSensor.rawAngle)
-print(angleSensor.status)
-print("MagnetDetected: ", angleSensor.isMagnetDetected)
-print("Too Strong: ", angleSensor.isMagnetTooStrong)
-print("Too Weak: ", angleSensor.isMagnetTooWeak)
-
-gamePad = Gamepad(usb_hid.devices)
+angleSensor.zero_position = angleSensor.raw_angle
+angleSnapshot = angleSensor.read_snapshot(bytearray(AS5600.SNAPSHOT_SIZE))
+print(angleSnapshot.status)
+print("MagnetDetected: ", angleSnapshot.is_magnet_detected)
+print("Too Strong: ", angleSnapshot.is_magnet_too_strong)
+print("Too Weak: ", angleSnapshot.is_magnet_too_weak)
+print("Gain: ", angleSnapshot.gain, " Magnitude: ", angleSnapshot.magnitude)
+# Roll is sampled over I2C. To read the AS5600 OUT pin instead, and keep roll off the bus, use
+# rollSensor = AS5600Out.AS5600Pwm(angleSensor, <OUT pin>) or AS5600Out.AS5600Analog(angleSensor, <OUT pin>)
+rollSensor = angleSensor
+# Extrapolate roll ahead to make up for sensor filtering & sample interval lag
+rollPredictor = AnglePredictor.AnglePredictor(leadMs = 15)
+
+# Control column angle to HID joystick input
+# 0 to 90 degrees (0 - 1023 angle reading) = 0 to 32767
+# 0 to -90 degrees  (4095 - 3072 angle reading) = 0 to -32767
+ROLL_CURVES = {
+    "normal": AxisMap.Curve(1023, outputMax = HidJoystick.AXIS_MAX),
+    "toddler": AxisMap.Curve(1023, deadzone = 64, expo = 0.6, outputMax = HidJoystick.AXIS_MAX),
+    "sensitive": AxisMap.Curve(512, outputMax = HidJoystick.AXIS_MAX),
+}
+rollMap = AxisMap.AxisMap(ROLL_CURVES, "normal", 4096, 0, wrap = True)
+
+gamePad = HidJoystick.HidJoystick(usb_hid.devices)
+# Only send reports when the yoke moves, or as a keepalive. One sensor count is 32 or 33 joystick
+# counts on the normal roll curve, so a deadband of 31 passes every single sensor step straight away.
+joystickOutput = JoystickOutput.JoystickOutput(gamePad, deadband = 31, keepaliveMs = 250)
+
+# Per register I2C counts & latencies for the 'i' command. When off the drivers are left untouched.
+I2C_STATS = False
+busStats = None
+if I2C_STATS:
+    busStats = I2CStats.I2CStats()
+    busStats.instrument(angleSensor, "as5600")
+    busStats.instrument(rangeSensor, "vl6180x", address_bytes = 2)
 
 # Setup watchdog
 microcontroller.on_next_reset(microcontroller.RunMode.NORMAL)
@@ -74,40 +89,107 @@ microcontroller.on_next_reset(microcontroller.RunMode.NORMAL)
 #watchDog.mode = WatchDogMode.RESET
 
 
-loopCount = 0
+# Job periods in milliseconds
+JOYSTICK_PERIOD_MS = const(10)
+PULSE_PERIOD_MS = const(50)
+GAME_OF_LIFE_PERIOD_MS = const(500)
+WATCHDOG_PERIOD_MS = const(1000)
+HOST_COMMAND_PERIOD_MS = const(100)
+TELEMETRY_PERIOD_MS = const(100)
+JOYSTICK_IDLE_PERIOD_MS = const(100)
+JOYSTICK_IDLE_TIMEOUT_MS = const(5000)
+RANGE_MOTION_THRESHOLD = const(1)   # mm
+
+ROLL_COMMANDS = {"n": "normal", "t": "toddler", "s": "sensitive"}
+
+# Loop profiling for the 'p' command, section timings are skipped when off. Leave off in use,
+# time.monotonic_ns() values are long ints that allocate on every reading once past ~1s of uptime.
+PROFILE = False
+ANGLE_SECTION, RANGE_SECTION, AXES_SECTION, REPORT_SECTION, OCTOALERT_SECTION, GAME_OF_LIFE_SECTION = range(6)
+profiler = Profiler.Profiler(("angle", "range", "axes", "report", "octoalert", "gameoflife"), enabled = PROFILE)
+
+# Binary telemetry frames to the Pi over the USB CDC data channel enabled in boot.py
+telemetry = Telemetry.Telemetry(usb_cdc.data)
+
+
+def sampleJoystick() -> None:
+    global currentRange
+    profiler.tick(joystickJob.period_ms)
+    # Read control column angle & range and map them to HID joystick input
+    started = profiler.start()
+    currentAngle = rollSensor.angle
+    sampledMs = supervisor.ticks_ms()
+    started = profiler.lap(ANGLE_SECTION, started)
+    # Only filter new range samples, between samples hold the last value
+    pitchMoved = False
+    newSample = rangeSensor.poll()
+    started = profiler.lap(RANGE_SECTION, started)
+    if newSample:
+        newRange = filteredRange.update(rangeSensor.range)
+        pitchMoved = abs(newRange - currentRange) > RANGE_MOTION_THRESHOLD
+        currentRange = newRange
+    turn = rollMap.table[rollPredictor.update(currentAngle, sampledMs)]
+    pitch = pitchMap.table[currentRange]
+    # Speed up sampling while the yoke is in use, slow down when it's left alone
+    sampler.update(currentAngle, pitchMoved)
+    started = profiler.lap(AXES_SECTION, started)
+
+    #print((pitch, turn))
+    joystickOutput.update(turn, pitch)
+    profiler.lap(REPORT_SECTION, started)
+
+
+def sendTelemetry() -> None:
+    # Raw & filtered readings plus loop stats, only while the Pi has the data channel open
+    if not telemetry.connected:
+        return
+    angleSensor.read_snapshot(angleSnapshot.buffer)
+    telemetry.send(angleSnapshot.raw_angle, angleSnapshot.angle, rangeSensor.range, currentRange,
+                   joystickOutput.lastX or 0, joystickOutput.lastY or 0,
+                   angleSnapshot.status, angleSnapshot.gain, angleSnapshot.magnitude,
+                   profiler.stats(profiler.jitter), joystickJob.overruns, profiler.gcRuns, profiler.memFreeLow)
+
+
+def readHostCommand() -> None:
+    # Single character commands from the host over the USB serial console
+    # '0' - '3' select the OctoAlert effect (pulse, strobe, beacon, red alert)
+    # 'n', 't' & 's' select the normal, toddler & sensitive roll curves
+    # 'r' prints the HID report & telemetry counters
+    # 'l' prints the latency removed by roll prediction
+    # 'i' prints the I2C bus stats, if enabled
+    # 'p' prints the loop profile
+    while supervisor.runtime.serial_bytes_available:
+        command = sys.stdin.read(1)
+        if "0" <= command <= "9" and int(command) < len(OctoAlert.EFFECTS):
+            octoalert.selectIndex(int(command))
+        elif command in ROLL_COMMANDS:
+            rollMap.select(ROLL_COMMANDS[command])
+        elif command == "r":
+            print("Reports sent: ", joystickOutput.reportsSent, " Suppressed: ", joystickOutput.reportsSuppressed, " Keepalives: ", joystickOutput.keepalives)
+            print("Telemetry frames sent: ", telemetry.framesSent, " Dropped: ", telemetry.framesDropped)
+        elif command == "l":
+            print("Latency removed (ms): ", rollPredictor.latencyRemovedMs, " Hold error: ", rollPredictor.holdError, " Prediction error: ", rollPredictor.predictError)
+            rollPredictor.resetStats()
+        elif command == "i":
+            if busStats is None:
+                print("I2C stats are off, set I2C_STATS")
+            else:
+                busStats.report()
+                busStats.reset()
+        elif command == "p":
+            profiler.report(scheduler.jobs)
+            profiler.reset()
+
+
 # Main loop
-while True:
-    if (loopCount % 400) == 0:
-        octoalert.pulse()
-
-    if (loopCount % 4000) == 0:
-        ledArray.GameOfLife()
-
-    # Read the range in millimeters and print it.
-    if (loopCount % 100) == 0:
-
-        # Read control column angle and scale its output for HID Gamepad input
-        # 0 to 90 degrees (0 - 2047 angle reading) = 0 to 127
-        # 0 to -90 degrees  (4095 - 3072 angle reading) = 0 to -127
-        currentAngle = angleSensor.angle
-        if currentAngle <= 2047:
-            if currentAngle > 1023:
-                currentAngle = 1023
-            turn = currentAngle >> 3
-        else:
-            if currentAngle < 3073:
-                currentAngle = 3072
-            turn = 0 - (abs(currentAngle - 4095) >> 3)
-
-        # Read control column angle and scale its output for HID Gamepad input
-        # -127 to 127
-        currentRange = filteredRange.update(rangeSensor.range)
-        pitch = (((currentRange - OFFSET) * scale) - 32768) >> 8
-        if pitch > 127: pitch = 127
-        if pitch < -127: pitch = -127
-
-        #print((pitch, turn))
-        gamePad.move_joysticks(x = turn, y = pitch)
-
-    #watchDog.feed()
-    loopCount = (loopCount + 1) % 1000000
\ No newline at end of file
+scheduler = Scheduler.Scheduler()
+# Joystick first so it wins when several jobs fall due together
+joystickJob = scheduler.add("joystick", sampleJoystick, JOYSTICK_PERIOD_MS)
+sampler = AdaptiveSampling.AdaptiveSampler(angleSensor, joystickJob, JOYSTICK_PERIOD_MS, JOYSTICK_IDLE_PERIOD_MS, JOYSTICK_IDLE_TIMEOUT_MS)
+scheduler.add("octoalert", profiler.timed(OCTOALERT_SECTION, octoalert.tick), PULSE_PERIOD_MS)
+scheduler.add("gameoflife", profiler.timed(GAME_OF_LIFE_SECTION, ledArray.GameOfLife), GAME_OF_LIFE_PERIOD_MS)
+scheduler.add("hostcommand", readHostCommand, HOST_COMMAND_PERIOD_MS)
+scheduler.add("telemetry", sendTelemetry, TELEMETRY_PERIOD_MS)
+if watchDog.mode is not None:
+    scheduler.add("watchdog", watchDog.feed, WATCHDOG_PERIOD_MS)
+scheduler.run()
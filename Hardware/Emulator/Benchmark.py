@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`Benchmark`
+================================================================================
+Hot path benchmarks on the emulated hardware, checked against a budget
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Each benchmark builds its firmware objects on a freshly installed emulator, then
+times one operation over many iterations and reports, per operation:
+
+* ``wallUs``, CPython wall time in microseconds, for comparing runs on one machine.
+* ``transactions``, I2C transactions.
+* ``busBytes``, data bytes written & read on the I2C bus.
+* ``allocBytes``, the median peak of CPython heap bytes allocated during the
+  operation, from ``tracemalloc``. A new buffer in a driver hot path shows up here.
+
+Transactions, bus bytes & allocations are deterministic, and are checked against
+``Budgets.json``. Any over budget fails the run. Wall time is only checked when
+a budget gives it, as it depends on the machine. Run from anywhere with::
+
+    python Hardware/Emulator/Benchmark.py [--iterations N] [--update] [name ...]
+
+``--update`` writes the measured figures back to ``Budgets.json``, for when a
+change is meant to cost more (or less). Allocation figures depend on the CPython
+version, so update them when it changes.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import Emulator  # pylint: disable=wrong-import-position
+import Models  # pylint: disable=wrong-import-position
+
+BUDGETS_PATH = os.path.join(Emulator.EMULATOR_DIR, "Budgets.json")
+METRICS = ("wallUs", "transactions", "busBytes", "allocBytes")
+_PCA9955_ADDRESS = 0x60
+
+
+class Benchmark:
+    """
+    A named operation, built by ``setup`` on a fresh emulator.
+
+    :param str name: Name in the report & budget file
+    :param setup: Called with the ``Hardware``, returns ``(operation, prepare)``. ``prepare``,
+        or None, is called before each operation, outside the measurement, e.g. to move the yoke.
+    """
+
+    def __init__(self, name: str, setup):
+        self.name = name
+        self.setup = setup
+
+    def run(self, iterations: int, warmup: int = 5) -> dict:
+        hardware = Emulator.install()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                operation, prepare = self.setup(hardware)
+            hardware.recording = False
+            bus = hardware.buses[0] if hardware.buses else None
+            for index in range(warmup):
+                if prepare:
+                    prepare(index)
+                operation()
+
+            # Bus traffic & allocations
+            if bus:
+                bus.resetStats()
+            allocations = []
+            tracemalloc.start()
+            for index in range(iterations):
+                if prepare:
+                    prepare(index)
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                operation()
+                allocations.append(tracemalloc.get_traced_memory()[1] - before)
+            tracemalloc.stop()
+            transactions = bus.transactions if bus else 0
+            busBytes = bus.bytesWritten + bus.bytesRead if bus else 0
+
+            # Wall time, without tracemalloc's overhead
+            elapsed = 0
+            for index in range(iterations):
+                if prepare:
+                    prepare(index)
+                start = time.perf_counter_ns()
+                operation()
+                elapsed += time.perf_counter_ns() - start
+        finally:
+            Emulator.uninstall()
+        return {
+            "wallUs": round(elapsed / iterations / 1000, 2),
+            "transactions": round(transactions / iterations, 2),
+            "busBytes": round(busBytes / iterations, 2),
+            "allocBytes": statistics.median(allocations),
+        }
+
+
+def _i2c():
+    import board  # pylint: disable=import-outside-toplevel
+    import busio  # pylint: disable=import-outside-toplevel
+    return busio.I2C(scl=board.GP15, sda=board.GP14)
+
+
+def _gameOfLife(hardware):
+    import board  # pylint: disable=import-outside-toplevel
+    import LedArray  # pylint: disable=import-outside-toplevel
+    import PioPixels  # pylint: disable=import-outside-toplevel
+    ledArray = LedArray.LedArray(board.GP0, PioPixels.PioPixels)
+    return ledArray.GameOfLife, None
+
+
+def _joystick(hardware):
+    # The code.py globals, stopped as the scheduler starts
+    namespace = hardware.runFirmware(untilMs=0)
+    sampleJoystick = namespace["sampleJoystick"]
+
+    def prepare(index):
+        # One joystick period between samples, the yoke swinging back & forth
+        hardware.clock.advance(namespace["JOYSTICK_PERIOD_MS"] * 1000)
+        hardware.as5600.rawAngle = (abs(index % 64 - 32) * 32 - 512) & 0x0FFF
+        hardware.vl6180x.range = 20 + abs(index % 40 - 20) * 4
+
+    return sampleJoystick, prepare
+
+
+def _as5600Angle(hardware):
+    import AS5600  # pylint: disable=import-outside-toplevel
+    sensor = AS5600.AS5600(_i2c())
+    return lambda: sensor.angle, None
+
+
+def _pca9955(shadow: bool = False):
+    import PCA9955  # pylint: disable=import-outside-toplevel
+    Emulator.current.attach(Models.PCA9955Model(_PCA9955_ADDRESS))
+    return PCA9955.PCA9955(_i2c(), _PCA9955_ADDRESS, shadow=shadow)
+
+
+def _channelSetter(attribute: str, values: tuple, shadow: bool = False):
+    def setup(hardware):
+        chip = _pca9955(shadow)
+        channel = chip.channels[5]
+        state = [0]
+
+        def operation():
+            setattr(channel, attribute, values[state[0]])
+            state[0] ^= 1
+        return operation, None
+    return setup
+
+
+def _groupSetter(attribute: str, values: tuple, shadow: bool = False):
+    def setup(hardware):
+        chip = _pca9955(shadow)
+        group = chip.groups[2]
+        state = [0]
+
+        def operation():
+            setattr(group, attribute, values[state[0]])
+            state[0] ^= 1
+        return operation, None
+    return setup
+
+
+BENCHMARKS = (
+    Benchmark("LedArray.GameOfLife", _gameOfLife),
+    Benchmark("code.sampleJoystick", _joystick),
+    Benchmark("AS5600.angle", _as5600Angle),
+    Benchmark("PCA9955.Channel.brightness", _channelSetter("brightness", (10, 200))),
+    Benchmark("PCA9955.Channel.gain", _channelSetter("gain", (10, 200))),
+    Benchmark("PCA9955.Channel.output_state", _channelSetter("output_state", (2, 3))),
+    Benchmark("PCA9955.Channel.output_state shadow", _channelSetter("output_state", (2, 3), shadow=True)),
+    Benchmark("PCA9955.Channel.group", _channelSetter("group", (1, 2))),
+    Benchmark("PCA9955.Channel.gradation", _channelSetter("gradation", (True, False))),
+    Benchmark("PCA9955.Group.ramp_rate", _groupSetter("ramp_rate", (5, 40))),
+    Benchmark("PCA9955.Group.ramp_rate shadow", _groupSetter("ramp_rate", (5, 40), shadow=True)),
+    Benchmark("PCA9955.Group.output_gain_control", _groupSetter("output_gain_control", (10, 200))),
+)
+
+
+def loadBudgets() -> dict:
+    if not os.path.exists(BUDGETS_PATH):
+        return {}
+    with open(BUDGETS_PATH, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def saveBudgets(budgets: dict) -> None:
+    with open(BUDGETS_PATH, "w", encoding="utf-8") as file:
+        json.dump(budgets, file, indent=4, sort_keys=True)
+        file.write("\n")
+
+
+def checkBudget(result: dict, budget: dict) -> list:
+    """The metrics of ``result`` over ``budget``."""
+    return [metric for metric in METRICS if metric in budget and result[metric] > budget[metric]]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the firmware hot paths on emulated hardware.")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run, all by default")
+    parser.add_argument("--iterations", type=int, default=200, help="Operations measured per benchmark")
+    parser.add_argument("--update", action="store_true", help="Write the results to Budgets.json")
+    args = parser.parse_args(argv)
+
+    benchmarks = [benchmark for benchmark in BENCHMARKS if not args.names or benchmark.name in args.names]
+    budgets = loadBudgets()
+    failures = 0
+    print(f"{'Benchmark':40} {'wall us':>9} {'trans':>7} {'bytes':>7} {'alloc B':>8}  result")
+    for benchmark in benchmarks:
+        result = benchmark.run(args.iterations)
+        budget = budgets.get(benchmark.name)
+        if args.update:
+            budgets[benchmark.name] = {metric: result[metric] for metric in METRICS if metric != "wallUs"}
+            status = "updated"
+        elif budget is None:
+            status = "no budget"
+        else:
+            over = checkBudget(result, budget)
+            status = "over budget: " + ", ".join(f"{metric} {result[metric]} > {budget[metric]}" for metric in over) if over else "ok"
+            failures += bool(over)
+        print(f"{benchmark.name:40} {result['wallUs']:9.2f} {result['transactions']:7.2f} {result['busBytes']:7.2f} {result['allocBytes']:8}  {status}")
+    if args.update:
+        saveBudgets(budgets)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`Emulator`
+================================================================================
+Run the control panel firmware on CPython against emulated hardware
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+This directory holds stand-ins for the device-only CircuitPython modules the
+firmware imports (``board``, ``busio``, ``neopixel``, ``usb_hid``, ``usb_cdc``,
+``supervisor``, ``microcontroller``, ``adafruit_bus_device.i2c_device``,
+``adafruit_vl6180x`` etc.).
+``install()`` puts them, and ``Hardware/Code``, on ``sys.path`` and returns a
+fresh ``Hardware`` describing the emulated board:
+
+* ``clock``, a simulated microsecond clock behind ``supervisor.ticks_ms`` and
+  ``time``. It only moves when an I2C transaction takes bus time or the firmware
+  sleeps, so every run is deterministic.
+* ``as5600`` & ``vl6180x``, register level models (see ``Models``) attached to
+  every ``busio.I2C`` the firmware creates. ``attach()`` adds more, e.g. PCA9955s.
+* ``strips``, a ``Strip`` per pixel pin recording every frame sent.
+* ``hidReports``, every USB HID report sent, with its timestamp.
+* ``cdcData``, everything written to the ``usb_cdc.data`` channel.
+* ``recording``, clear it to stop keeping frames & reports, e.g. while benchmarking.
+* ``serial``, console input read by ``sys.stdin`` and ``supervisor.runtime``.
+* ``memFree``, the heap free memory reported by ``gc.mem_free()``.
+* ``traceHeap``, set it while ``tracemalloc`` is tracing to have ``gc.mem_free()``
+  fall by the bytes held by objects allocated in ``Hardware/Code``. Each I2C
+  transaction also lowers ``memFreeLow`` to it, so a buffer built for one bus
+  call shows up even though CPython frees it straight after.
+
+``asyncio`` is replaced by ``SimAsyncio``, whose event loop advances the simulated
+clock straight to the next wake up instead of sleeping, and ``time`` by ``SimTime``. ``runFirmware()`` runs
+``boot.py`` then ``code.py`` until a given simulated time, for example::
+
+    hardware = Emulator.install()
+    hardware.as5600.rawAngle = 300
+    namespace = hardware.runFirmware(untilMs=1000)
+    print(hardware.hidReports[-1])
+    Emulator.uninstall()
+
+``gc`` can't be replaced, so ``install()`` adds ``mem_free`` & ``mem_alloc`` to it.
+``uninstall()`` restores ``sys.path``, ``asyncio``, ``time``, ``sys.stdin`` & ``gc`` and forgets the
+imported firmware, so the next ``install()`` starts from power on.
+"""
+
+import gc
+import os
+import random
+import struct
+import sys
+import tracemalloc
+
+import Models
+
+EMULATOR_DIR = os.path.dirname(os.path.abspath(__file__))
+CODE_DIR = os.path.join(os.path.dirname(EMULATOR_DIR), "Code")
+
+# supervisor.ticks_ms() wraps at 2**29
+_TICKS_MAX = (1 << 29) - 1
+# Allocations made by a line of the firmware
+_FIRMWARE_TRACES = (tracemalloc.Filter(True, os.path.join(CODE_DIR, "*")),)
+
+# The emulated board, set by install()
+current = None
+_saved = None
+
+
+class SimulationComplete(Exception):
+    """Raised by the simulated event loop when ``Hardware.stopAtMs`` is reached."""
+
+
+class Clock:
+    """Simulated time in microseconds since power on."""
+
+    def __init__(self):
+        self.us = 0
+
+    def advance(self, us: int) -> None:
+        self.us += us
+
+    def advanceTo(self, us: int) -> None:
+        if us > self.us:
+            self.us = us
+
+    @property
+    def ms(self) -> int:
+        return self.us // 1000
+
+    def ticks_ms(self) -> int:
+        return self.ms & _TICKS_MAX
+
+
+class Strip:
+    """Frames sent to the pixels on one pin, as raw bytes in strip colour order."""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.frames = []
+        self.times = []
+
+    def record(self, clock: Clock, frame: bytes) -> None:
+        self.frames.append(frame)
+        self.times.append(clock.ms)
+
+    @property
+    def last(self) -> bytes:
+        return self.frames[-1] if self.frames else None
+
+
+class SerialInput:
+    """USB serial console input, stands in for ``sys.stdin``."""
+
+    def __init__(self):
+        self._data = ""
+        self._position = 0
+
+    def send(self, text: str) -> None:
+        self._data = self._data[self._position:] + text
+        self._position = 0
+
+    @property
+    def available(self) -> int:
+        return len(self._data) - self._position
+
+    def read(self, count: int = -1) -> str:
+        if count < 0:
+            count = self.available
+        text = self._data[self._position:self._position + count]
+        self._position += len(text)
+        return text
+
+    def readline(self) -> str:
+        end = self._data.find("\n", self._position)
+        return self.read(self.available if end < 0 else end + 1 - self._position)
+
+
+class Hardware:
+    """
+    The emulated control panel board.
+
+    :param int seed: Seed for ``random``, so Game of Life runs repeat
+    """
+
+    def __init__(self, seed: int = 0):
+        self.clock = Clock()
+        self.as5600 = Models.AS5600Model()
+        self.vl6180x = Models.VL6180XModel(self.clock)
+        self.i2cDevices = [self.as5600, self.vl6180x]
+        self.buses = []
+        self.strips = {}
+        self.hidReports = []
+        self.cdcData = bytearray()
+        self.serial = SerialInput()
+        self.analogValues = {}
+        self.pinLevels = {}
+        self.pulseInputs = {}
+        self.stopAtMs = None
+        self.recording = True
+        self.memFree = 180 * 1024
+        self.memAlloc = 20 * 1024
+        self.traceHeap = False
+        self.memFreeLow = self.memFree
+        random.seed(seed)
+
+    def attach(self, model: Models.RegisterDevice) -> Models.RegisterDevice:
+        """Connect another device model to the emulated I2C buses."""
+        self.i2cDevices.append(model)
+        return model
+
+    def strip(self, pin) -> Strip:
+        """The frame recorder for ``pin``, created on first use."""
+        name = getattr(pin, "name", pin)
+        if name not in self.strips:
+            self.strips[name] = Strip(name)
+        return self.strips[name]
+
+    def recordHidReport(self, reportId: int, report: bytes) -> None:
+        if self.recording:
+            self.hidReports.append((self.clock.ms, reportId, report))
+
+    def heapUsed(self) -> int:
+        """Bytes held by objects allocated in ``Hardware/Code``, 0 unless ``traceHeap`` is set and ``tracemalloc`` is tracing."""
+        if not self.traceHeap or not tracemalloc.is_tracing():
+            return 0
+        snapshot = tracemalloc.take_snapshot().filter_traces(_FIRMWARE_TRACES)
+        return sum(statistic.size for statistic in snapshot.statistics("filename"))
+
+    def sampleHeap(self) -> int:
+        """The ``gc.mem_free()`` figure now, lowering ``memFreeLow`` to it."""
+        free = self.memFree - self.heapUsed()
+        if free < self.memFreeLow:
+            self.memFreeLow = free
+        return free
+
+    def resetBusStats(self) -> None:
+        for bus in self.buses:
+            bus.resetStats()
+
+    def runScript(self, name: str, untilMs: int = None) -> dict:
+        """Run a script from ``Hardware/Code`` as ``__main__`` and return its globals.
+
+        :param str name: The script, e.g. ``code.py``
+        :param int untilMs: Stop the event loop at this simulated time, or None to run to completion
+        """
+        self.stopAtMs = untilMs
+        path = os.path.join(CODE_DIR, name)
+        namespace = {"__name__": "__main__", "__file__": path}
+        with open(path, encoding="utf-8") as source:
+            code = compile(source.read(), path, "exec")
+        try:
+            exec(code, namespace)  # pylint: disable=exec-used
+        except SimulationComplete:
+            pass
+        return namespace
+
+    def runFirmware(self, untilMs: int, boot: bool = True) -> dict:
+        """Run ``boot.py``, then ``code.py`` until ``untilMs``, and return the ``code.py`` globals."""
+        if boot:
+            self.runScript("boot.py")
+        return self.runScript("code.py", untilMs)
+
+
+def decodePioFrame(data: bytes) -> bytes:
+    """The pixel bytes of a ``PioPixels`` frame, a 32-bit bit count - 1 header, pixels then a trailer."""
+    byteCount = (struct.unpack_from(">L", data)[0] + 1) >> 3
+    return bytes(data[4:4 + byteCount])
+
+
+def _isLocalModule(module) -> bool:
+    path = getattr(module, "__file__", None)
+    if not path:
+        return False
+    path = os.path.abspath(path)
+    return path.startswith(CODE_DIR + os.sep) or (path.startswith(EMULATOR_DIR + os.sep) and os.path.basename(path) not in ("Emulator.py", "Models.py"))
+
+
+def _forgetModules() -> None:
+    for name in [name for name, module in sys.modules.items() if _isLocalModule(module)]:
+        del sys.modules[name]
+
+
+def install(seed: int = 0) -> Hardware:
+    """Emulate a freshly powered on board, and return it."""
+    global current, _saved  # pylint: disable=global-statement
+    if _saved is None:
+        _saved = (list(sys.path), sys.modules.get("asyncio"), sys.modules.get("time"), sys.stdin)
+    _forgetModules()
+    for path in (CODE_DIR, EMULATOR_DIR):
+        if path in sys.path:
+            sys.path.remove(path)
+        sys.path.insert(0, path)
+    current = Hardware(seed)
+    import SimAsyncio  # pylint: disable=import-outside-toplevel
+    import SimTime  # pylint: disable=import-outside-toplevel
+    sys.modules["asyncio"] = SimAsyncio
+    sys.modules["time"] = SimTime
+    sys.stdin = current.serial
+    gc.mem_free = lambda: current.memFree - current.heapUsed()
+    gc.mem_alloc = lambda: current.memAlloc
+    return current
+
+
+def uninstall() -> None:
+    """Restore the interpreter to how it was before ``install()``."""
+    global current, _saved  # pylint: disable=global-statement
+    if _saved is None:
+        return
+    _forgetModules()
+    path, asyncio, time, stdin = _saved
+    sys.path[:] = path
+    for name, module in (("asyncio", asyncio), ("time", time)):
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+    sys.stdin = stdin
+    del gc.mem_free
+    del gc.mem_alloc
+    current = None
+    _saved = None
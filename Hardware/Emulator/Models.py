@@ -0,0 +1,334 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`Models`
+================================================================================
+Register level models of the control panel's I2C devices
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Each model sees the bytes of every I2C write & read addressed to it, exactly as
+the chip would. The first byte (two for the VL6180X) of a write sets the register
+pointer, any following bytes are written from there on, and reads continue from
+the pointer. Registers the firmware can't write are read-only here too.
+
+* ``AS5600Model``, the angle comes from ``rawAngle`` through ZPOS / MPOS / MANG,
+  STATUS from ``magnetDetected``, ``magnetTooWeak`` & ``magnetTooStrong``. The
+  pointer auto-increments, except reads set to the high byte of RAW ANGLE, ANGLE
+  or MAGNITUDE, which re-read that register as on the chip.
+* ``PCA9955Model``, auto-increment only when the register address has the AIF
+  bit set, PWMALL / IREFALL write every channel, the MODE2 status bits &
+  EFLAG registers are read-only and it answers its ALLCALL & SUBADR addresses.
+* ``VL6180XModel``, single shot & continuous ranging timed from the simulated
+  clock, with the new sample interrupt status & clear.
+
+**Hardware:**
+
+* `AS5600 <https://ams.com/as5600>`
+* `PCA9955B <https://www.nxp.com/docs/en/data-sheet/PCA9955B.pdf>`
+* `VL6180X <https://www.st.com/en/imaging-and-photonics-solutions/vl6180x.html>`
+"""
+
+
+class RegisterDevice:
+    """
+    An I2C device with a register pointer, base class for the models.
+
+    :param int address: The 7-bit I2C address
+    :param int size: Number of registers
+    """
+
+    addressBytes = 1
+
+    def __init__(self, address: int, size: int = 256):
+        self.address = address
+        self.registers = bytearray(size)
+        self.pointer = 0
+        self.writes = 0
+        self.reads = 0
+
+    def matches(self, address: int) -> bool:
+        """True if the device answers ``address``."""
+        return address == self.address
+
+    def write(self, data: bytes) -> None:
+        """An I2C write, the register address then any data."""
+        if len(data) < self.addressBytes:
+            return
+        self.writes += 1
+        self.setPointer(data[:self.addressBytes])
+        for value in data[self.addressBytes:]:
+            self.writeRegister(self.pointer, value)
+            self.pointer = self.nextPointer(self.pointer)
+
+    def read(self, count: int) -> bytes:
+        """An I2C read of ``count`` bytes from the register pointer."""
+        self.reads += 1
+        data = bytearray(count)
+        for index in range(count):
+            data[index] = self.readRegister(self.pointer)
+            self.pointer = self.nextPointer(self.pointer)
+        return data
+
+    def setPointer(self, address: bytes) -> None:
+        pointer = 0
+        for value in address:
+            pointer = (pointer << 8) | value
+        self.pointer = pointer
+
+    def nextPointer(self, pointer: int) -> int:
+        return (pointer + 1) % len(self.registers)
+
+    def readRegister(self, address: int) -> int:
+        return self.registers[address]
+
+    def writeRegister(self, address: int, value: int) -> None:
+        self.registers[address] = value
+
+
+class AS5600Model(RegisterDevice):
+    """
+    AMS AS5600 magnetic rotary position sensor.
+
+    :param int address: The 7-bit I2C address
+    """
+
+    # Writable registers & the bits that can be written
+    WRITE_MASKS = {0x01: 0x0F, 0x02: 0xFF, 0x03: 0x0F, 0x04: 0xFF, 0x05: 0x0F, 0x06: 0xFF, 0x07: 0x3F, 0x08: 0xFF}
+    # High bytes of the registers whose pointer doesn't auto-increment
+    HOLD_POINTER = (0x0C, 0x0E, 0x1B)
+
+    def __init__(self, address: int = 0x36):
+        super().__init__(address)
+        self.rawAngle = 0
+        self.magnetDetected = True
+        self.magnetTooWeak = False
+        self.magnetTooStrong = False
+        self.agc = 128
+        self.magnitude = 2048
+        self.angleBurns = 0
+        self.settingsBurns = 0
+        self._hold = None
+
+    def setPointer(self, address: bytes) -> None:
+        super().setPointer(address)
+        self._hold = self.pointer if self.pointer in AS5600Model.HOLD_POINTER else None
+
+    def nextPointer(self, pointer: int) -> int:
+        if self._hold is not None:
+            return self._hold + 1 if pointer == self._hold else self._hold
+        return super().nextPointer(pointer)
+
+    @property
+    def angle(self) -> int:
+        """The scaled output angle, as read from ANGLE."""
+        registers = self.registers
+        start = ((registers[0x01] << 8) | registers[0x02]) & 0x0FFF
+        stop = ((registers[0x03] << 8) | registers[0x04]) & 0x0FFF
+        span = ((registers[0x05] << 8) | registers[0x06]) & 0x0FFF
+        if stop:
+            span = (stop - start) & 0x0FFF
+        position = (self.rawAngle - start) & 0x0FFF
+        if not span:
+            return position
+        return min(position * 4096 // span, 4095)
+
+    @property
+    def status(self) -> int:
+        return (self.magnetDetected << 5) | (self.magnetTooWeak << 4) | (self.magnetTooStrong << 3)
+
+    def readRegister(self, address: int) -> int:
+        if address == 0x0B:
+            return self.status
+        if address == 0x0C:
+            return (self.rawAngle >> 8) & 0x0F
+        if address == 0x0D:
+            return self.rawAngle & 0xFF
+        if address == 0x0E:
+            return self.angle >> 8
+        if address == 0x0F:
+            return self.angle & 0xFF
+        if address == 0x1A:
+            return self.agc
+        if address == 0x1B:
+            return (self.magnitude >> 8) & 0x0F
+        if address == 0x1C:
+            return self.magnitude & 0xFF
+        return self.registers[address]
+
+    def writeRegister(self, address: int, value: int) -> None:
+        if address in AS5600Model.WRITE_MASKS:
+            self.registers[address] = value & AS5600Model.WRITE_MASKS[address]
+        elif address == 0xFF:
+            # BURN, ZMCO counts angle burns
+            if value == 0x80:
+                self.angleBurns += 1
+                self.registers[0x00] = min(self.registers[0x00] + 1, 3)
+            elif value == 0x40:
+                self.settingsBurns += 1
+
+
+class PCA9955Model(RegisterDevice):
+    """
+    NXP PCA9955B 16-channel constant current LED driver.
+
+    :param int address: The 7-bit I2C address
+    """
+
+    REGISTER_COUNT = 0x4A
+    # Reset values, MODE1 has AIF, SUB1 & ALLCALL set, LEDOUTx individual PWM
+    DEFAULTS = {0x00: 0x89, 0x01: 0x05, 0x02: 0xAA, 0x03: 0xAA, 0x04: 0xAA, 0x05: 0xAA, 0x06: 0xFF,
+                0x40: 0xEC, 0x41: 0xEC, 0x42: 0xEC, 0x43: 0xE0}
+    MODE1 = 0x00
+    MODE2 = 0x01
+    PWM0 = 0x08
+    IREF0 = 0x18
+    SUBADR1 = 0x40
+    ALLCALLADR = 0x43
+    PWMALL = 0x44
+    IREFALL = 0x45
+    EFLAG0 = 0x46
+    AUTO_INCREMENT = 0x80
+
+    def __init__(self, address: int):
+        super().__init__(address, PCA9955Model.REGISTER_COUNT)
+        for register, value in PCA9955Model.DEFAULTS.items():
+            self.registers[register] = value
+        self.autoIncrement = False
+        self.overTemperature = False
+        # Per channel open / short circuit error bits, as the EFLAG registers
+        self.errorFlags = 0
+
+    def matches(self, address: int) -> bool:
+        if address == self.address:
+            return True
+        mode1 = self.registers[PCA9955Model.MODE1]
+        if mode1 & 0x01 and address == self.registers[PCA9955Model.ALLCALLADR] >> 1:
+            return True
+        for index in range(3):
+            if mode1 & (0x08 >> index) and address == self.registers[PCA9955Model.SUBADR1 + index] >> 1:
+                return True
+        return False
+
+    def setPointer(self, address: bytes) -> None:
+        self.autoIncrement = bool(address[0] & PCA9955Model.AUTO_INCREMENT)
+        self.pointer = address[0] & ~PCA9955Model.AUTO_INCREMENT
+
+    def nextPointer(self, pointer: int) -> int:
+        if not self.autoIncrement:
+            return pointer
+        return super().nextPointer(pointer)
+
+    @property
+    def pwm(self) -> bytes:
+        return bytes(self.registers[PCA9955Model.PWM0:PCA9955Model.PWM0 + 16])
+
+    @property
+    def iref(self) -> bytes:
+        return bytes(self.registers[PCA9955Model.IREF0:PCA9955Model.IREF0 + 16])
+
+    def readRegister(self, address: int) -> int:
+        if address == PCA9955Model.MODE2:
+            value = self.registers[address] & 0x3F
+            return value | (self.overTemperature << 7) | (bool(self.errorFlags) << 6)
+        if address >= PCA9955Model.EFLAG0:
+            return (self.errorFlags >> ((address - PCA9955Model.EFLAG0) * 8)) & 0xFF
+        if address in (PCA9955Model.PWMALL, PCA9955Model.IREFALL):
+            return 0xFF
+        return self.registers[address]
+
+    def writeRegister(self, address: int, value: int) -> None:
+        if address == PCA9955Model.MODE1:
+            # AIF is read-only
+            self.registers[address] = (self.registers[address] & 0x80) | (value & 0x7F)
+        elif address == PCA9955Model.MODE2:
+            # OVERTEMP & ERROR are read-only, CLRERR clears the error flags and reads back 0
+            if value & 0x10:
+                self.errorFlags = 0
+            self.registers[address] = value & 0x2F
+        elif address == PCA9955Model.PWMALL:
+            self.registers[PCA9955Model.PWM0:PCA9955Model.PWM0 + 16] = bytes((value,)) * 16
+        elif address == PCA9955Model.IREFALL:
+            self.registers[PCA9955Model.IREF0:PCA9955Model.IREF0 + 16] = bytes((value,)) * 16
+        elif address < PCA9955Model.PWMALL:
+            self.registers[address] = value
+
+
+class VL6180XModel(RegisterDevice):
+    """
+    ST VL6180X time of flight ranging sensor.
+
+    :param Clock clock: The simulated clock, measurements complete in simulated time
+    :param int address: The 7-bit I2C address
+    """
+
+    addressBytes = 2
+    IDENTIFICATION_MODEL_ID = 0x000
+    SYSTEM_INTERRUPT_CLEAR = 0x015
+    SYSTEM_FRESH_OUT_OF_RESET = 0x016
+    SYSRANGE_START = 0x018
+    SYSRANGE_INTERMEASUREMENT_PERIOD = 0x01B
+    RESULT_RANGE_STATUS = 0x04D
+    RESULT_INTERRUPT_STATUS_GPIO = 0x04F
+    RESULT_RANGE_VAL = 0x062
+    NEW_SAMPLE_READY = 0x04
+    # Convergence time of one measurement
+    CONVERSION_US = 8000
+
+    def __init__(self, clock, address: int = 0x29):
+        super().__init__(address, 0x400)
+        self.clock = clock
+        self.registers[VL6180XModel.IDENTIFICATION_MODEL_ID] = 0xB4
+        self.registers[VL6180XModel.SYSTEM_FRESH_OUT_OF_RESET] = 0x01
+        self.range = 100
+        self.rangeError = 0
+        self.continuous = False
+        self.measurements = 0
+        self._readyUs = None
+
+    @property
+    def periodUs(self) -> int:
+        return (self.registers[VL6180XModel.SYSRANGE_INTERMEASUREMENT_PERIOD] + 1) * 10000
+
+    def _update(self) -> None:
+        # Latch any measurement that has completed by now
+        now = self.clock.us
+        if self._readyUs is None or now < self._readyUs:
+            return
+        self.measurements += 1
+        self.registers[VL6180XModel.RESULT_RANGE_VAL] = self.range & 0xFF
+        self.registers[VL6180XModel.RESULT_RANGE_STATUS] = (self.rangeError << 4) | 0x01
+        status = self.registers[VL6180XModel.RESULT_INTERRUPT_STATUS_GPIO]
+        self.registers[VL6180XModel.RESULT_INTERRUPT_STATUS_GPIO] = (status & ~0x07) | VL6180XModel.NEW_SAMPLE_READY
+        if self.continuous:
+            # Measurements missed while nobody was reading are overwritten
+            period = self.periodUs
+            self._readyUs += ((now - self._readyUs) // period + 1) * period
+        else:
+            self._readyUs = None
+
+    def readRegister(self, address: int) -> int:
+        self._update()
+        return self.registers[address]
+
+    def writeRegister(self, address: int, value: int) -> None:
+        self._update()
+        if address == VL6180XModel.SYSTEM_INTERRUPT_CLEAR:
+            self.registers[VL6180XModel.RESULT_INTERRUPT_STATUS_GPIO] &= ~(value & 0x07)
+        elif address == VL6180XModel.SYSRANGE_START:
+            if value & 0x01:
+                if self.continuous:
+                    self.continuous = False
+                    self._readyUs = None
+                elif value & 0x02:
+                    self.continuous = True
+                    self._readyUs = self.clock.us + VL6180XModel.CONVERSION_US
+                else:
+                    self._readyUs = self.clock.us + VL6180XModel.CONVERSION_US
+            self.registers[address] = 0x02 if self.continuous else 0x00
+        else:
+            self.registers[address] = value
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`SimAsyncio`
+================================================================================
+Deterministic stand-in for CircuitPython ``asyncio`` on the simulated clock
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+``Emulator.install()`` makes this module ``asyncio``. It has the subset the
+firmware uses, ``run``, ``create_task``, ``gather`` & ``sleep``. Instead of
+sleeping, the event loop advances ``Emulator.current.clock`` to the earliest
+wake up, so time only passes in whole ``sleep`` steps plus I2C bus time. Tasks
+due at the same time run in the order they became due. The loop raises
+``Emulator.SimulationComplete`` once the clock reaches ``stopAtMs``.
+"""
+
+import heapq
+import Emulator
+
+_loop = None
+
+
+class _Sleep:
+    # Yielded to the loop, wake up after us microseconds
+    def __init__(self, us: int):
+        self.us = us
+
+    def __await__(self):
+        yield self
+
+
+class _Join:
+    # Yielded to the loop, wake up when task is done
+    def __init__(self, task: "Task"):
+        self.task = task
+
+    def __await__(self):
+        yield self
+
+
+class Task:
+    """A scheduled coroutine."""
+
+    def __init__(self, coro):
+        self.coro = coro
+        self.done = False
+        self.result = None
+        self.waiters = []
+
+    def __await__(self):
+        if not self.done:
+            yield _Join(self)
+        return self.result
+
+
+class _Loop:
+    def __init__(self, hardware: Emulator.Hardware):
+        self.hardware = hardware
+        self.clock = hardware.clock
+        self.queue = []
+        self.sequence = 0
+
+    def schedule(self, task: Task, wakeUs: int) -> None:
+        self.sequence += 1
+        heapq.heappush(self.queue, (wakeUs, self.sequence, task))
+
+    def step(self, task: Task) -> None:
+        try:
+            request = task.coro.send(None)
+        except StopIteration as stop:
+            task.done = True
+            task.result = stop.value
+            for waiter in task.waiters:
+                self.schedule(waiter, self.clock.us)
+            return
+        if isinstance(request, _Sleep):
+            self.schedule(task, self.clock.us + request.us)
+        elif isinstance(request, _Join):
+            if request.task.done:
+                self.schedule(task, self.clock.us)
+            else:
+                request.task.waiters.append(task)
+        else:
+            raise RuntimeError(f"Unsupported awaitable {request!r}")
+
+    def run(self, main: Task) -> None:
+        stopAtMs = self.hardware.stopAtMs
+        while not main.done:
+            if not self.queue:
+                raise RuntimeError("Deadlock, no task is runnable")
+            self.clock.advanceTo(self.queue[0][0])
+            if stopAtMs is not None and self.clock.ms >= stopAtMs:
+                raise Emulator.SimulationComplete()
+            self.step(heapq.heappop(self.queue)[2])
+
+
+async def sleep(seconds: float) -> None:
+    await _Sleep(int(seconds * 1000000))
+
+
+async def sleep_ms(ms: int) -> None:
+    await _Sleep(ms * 1000)
+
+
+def create_task(coro) -> Task:
+    task = Task(coro)
+    _loop.schedule(task, _loop.clock.us)
+    return task
+
+
+async def gather(*awaitables) -> list:
+    tasks = [item if isinstance(item, Task) else create_task(item) for item in awaitables]
+    return [await task for task in tasks]
+
+
+def run(coro):
+    global _loop  # pylint: disable=global-statement
+    _loop = _Loop(Emulator.current)
+    try:
+        main = create_task(coro)
+        _loop.run(main)
+        return main.result
+    finally:
+        # Close the tasks left when the simulation stopped
+        for _, _, task in _loop.queue:
+            task.coro.close()
+        _loop = None
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`SimTime`
+================================================================================
+Stand-in for CircuitPython ``time`` on the simulated clock
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+``Emulator.install()`` makes this module ``time`` for the firmware. Modules that
+imported ``time`` before then, e.g. pytest or ``Benchmark``, keep the real one.
+``sleep`` advances the simulated clock rather than waiting. Anything else, e.g.
+``localtime`` or ``perf_counter``, is the real ``time``'s.
+"""
+
+import time as _time
+import Emulator
+
+
+def __getattr__(name: str):
+    return getattr(_time, name)
+
+
+def monotonic_ns() -> int:
+    return Emulator.current.clock.us * 1000
+
+
+def monotonic() -> float:
+    return Emulator.current.clock.us / 1000000
+
+
+def time() -> int:
+    return Emulator.current.clock.us // 1000000
+
+
+def sleep(seconds: float) -> None:
+    Emulator.current.clock.advance(int(seconds * 1000000))
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`adafruit_bus_device.i2c_device`
+================================================================================
+Emulated Adafruit Bus Device ``I2CDevice``, same API, on the emulated ``busio.I2C``
+* Author(s): Noel Anderson
+"""
+
+
+class I2CDevice:
+    """
+    An I2C device at ``device_address`` on ``i2c``.
+
+    :param ~busio.I2C i2c: The I2C bus the device is on
+    :param int device_address: The 7-bit device address
+    :param bool probe: Check the device is present on construction
+    """
+
+    def __init__(self, i2c, device_address: int, probe: bool = True) -> None:
+        self.i2c = i2c
+        self.device_address = device_address
+        self._exit = self._unlock
+        if probe:
+            self.__probe_for_device()
+
+    def readinto(self, buf, *, start: int = 0, end: int = None) -> None:
+        self.i2c.readfrom_into(self.device_address, buf, start=start, end=end)
+
+    def write(self, buf, *, start: int = 0, end: int = None) -> None:
+        self.i2c.writeto(self.device_address, buf, start=start, end=end)
+
+    def write_then_readinto(self, out_buffer, in_buffer, *, out_start: int = 0, out_end: int = None, in_start: int = 0, in_end: int = None) -> None:
+        self.i2c.writeto_then_readfrom(self.device_address, out_buffer, in_buffer, out_start=out_start, out_end=out_end, in_start=in_start, in_end=in_end)
+
+    def __enter__(self) -> "I2CDevice":
+        while not self.i2c.try_lock():
+            pass
+        return self
+
+    @property
+    def __exit__(self):
+        # CPython's with statement binds __exit__ for the length of the block, a new method object
+        # attributed to the firmware's with line. Hand back one bound at construction instead, as
+        # CircuitPython allocates nothing here.
+        return self._exit
+
+    def _unlock(self, exception_type, exception_value, traceback) -> bool:
+        self.i2c.unlock()
+        return False
+
+    def __probe_for_device(self) -> None:
+        while not self.i2c.try_lock():
+            pass
+        try:
+            self.i2c.writeto(self.device_address, b"")
+        except OSError:
+            try:
+                result = bytearray(1)
+                self.i2c.readfrom_into(self.device_address, result)
+            except OSError:
+                # pylint: disable=raise-missing-from
+                raise ValueError(f"No I2C device at address: 0x{self.device_address:x}")
+        finally:
+            self.i2c.unlock()
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`adafruit_pixelbuf`
+================================================================================
+Emulated Adafruit Pixelbuf ``PixelBuf``, the pixel buffer behind NeoPixel drivers
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Pixels are stored unscaled, and scaled by ``brightness`` into the transmit buffer,
+which is framed by ``header`` & ``trailer`` and handed to the subclass's
+``_transmit`` on ``show()``.
+"""
+
+
+class PixelBuf:
+    """
+    A buffer of ``size`` pixels in ``byteorder`` colour order.
+
+    :param int size: Number of pixels
+    :param str byteorder: Colour order, e.g. ``GRB`` or ``GRBW``
+    :param float brightness: Brightness 0.0 - 1.0
+    :param bool auto_write: Show after every change
+    :param bytes header: Bytes sent before the pixels
+    :param bytes trailer: Bytes sent after the pixels
+    """
+
+    def __init__(self, size: int, *, byteorder: str = "BGR", brightness: float = 1.0, auto_write: bool = False, header: bytes = None, trailer: bytes = None):
+        self._byteorder = byteorder
+        self._bpp = len(byteorder)
+        self._offsets = [byteorder.index(colour) if colour in byteorder else None for colour in "RGBW"]
+        header = header or b""
+        trailer = trailer or b""
+        self._start = len(header)
+        self._pixels = size
+        self._pre = bytearray(size * self._bpp)
+        self._post = bytearray(header) + bytearray(size * self._bpp) + bytearray(trailer)
+        self._brightness = min(max(brightness, 0.0), 1.0)
+        self.auto_write = auto_write
+
+    def __len__(self) -> int:
+        return self._pixels
+
+    @property
+    def bpp(self) -> int:
+        return self._bpp
+
+    @property
+    def byteorder(self) -> str:
+        return self._byteorder
+
+    @property
+    def brightness(self) -> float:
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value: float) -> None:
+        self._brightness = min(max(value, 0.0), 1.0)
+        for index in range(len(self._pre)):
+            self._post[self._start + index] = int(self._pre[index] * self._brightness)
+        if self.auto_write:
+            self.show()
+
+    def _set(self, index: int, value) -> None:
+        if isinstance(value, int):
+            colour = [(value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF, 0]
+            if self._offsets[3] is not None and colour[0] == colour[1] == colour[2]:
+                colour = [0, 0, 0, colour[0]]
+        else:
+            colour = list(value) + [0] * (4 - len(value))
+        base = index * self._bpp
+        for channel, offset in enumerate(self._offsets):
+            if offset is not None:
+                self._pre[base + offset] = colour[channel]
+                self._post[self._start + base + offset] = int(colour[channel] * self._brightness)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            for position, colour in zip(range(*index.indices(self._pixels)), value):
+                self._set(position, colour)
+        else:
+            if index < 0:
+                index += self._pixels
+            if not 0 <= index < self._pixels:
+                raise IndexError("Pixel index out of range")
+            self._set(index, value)
+        if self.auto_write:
+            self.show()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._pixels))]
+        if index < 0:
+            index += self._pixels
+        base = index * self._bpp
+        return tuple(self._pre[base + offset] for offset in self._offsets if offset is not None)
+
+    def fill(self, colour) -> None:
+        auto_write = self.auto_write
+        self.auto_write = False
+        self[:] = [colour] * self._pixels
+        self.auto_write = auto_write
+        if auto_write:
+            self.show()
+
+    def show(self) -> None:
+        self._transmit(self._post)
+
+    def _transmit(self, buffer: bytearray) -> None:
+        raise NotImplementedError("Must be subclassed")
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`adafruit_vl6180x`
+================================================================================
+Emulated Adafruit VL6180X library, the ranging calls used by the firmware over the emulated bus
+* Author(s): Noel Anderson
+"""
+
+from micropython import const
+import adafruit_bus_device.i2c_device as i2c_device
+
+_VL6180X_DEFAULT_I2C_ADDR = const(0x29)
+_VL6180X_REG_IDENTIFICATION_MODEL_ID = const(0x000)
+_VL6180X_REG_SYSTEM_INTERRUPT_CLEAR = const(0x015)
+_VL6180X_REG_SYSTEM_FRESH_OUT_OF_RESET = const(0x016)
+_VL6180X_REG_SYSRANGE_START = const(0x018)
+_VL6180X_REG_SYSRANGE_INTERMEASUREMENT_PERIOD = const(0x01B)
+_VL6180X_REG_RESULT_RANGE_STATUS = const(0x04D)
+_VL6180X_REG_RESULT_INTERRUPT_STATUS_GPIO = const(0x04F)
+_VL6180X_REG_RESULT_RANGE_VAL = const(0x062)
+
+
+class VL6180X:
+    """
+    Create an instance of the VL6180X distance sensor.
+
+    :param ~busio.I2C i2c: The I2C bus the VL6180X is connected to.
+    :param int address: The I2C address of the VL6180X.
+    :param int offset: The offset to be applied to measurements, in mm.
+    """
+
+    def __init__(self, i2c, address: int = _VL6180X_DEFAULT_I2C_ADDR, offset: int = 0) -> None:
+        self._device = i2c_device.I2CDevice(i2c, address)
+        if self._read_8(_VL6180X_REG_IDENTIFICATION_MODEL_ID) != 0xB4:
+            raise RuntimeError("Could not find VL6180X, is it connected and powered?")
+        self._write_8(_VL6180X_REG_SYSTEM_FRESH_OUT_OF_RESET, 0x00)
+        self.offset = offset
+
+    @property
+    def range(self) -> int:
+        """Read the range of an object in front of sensor and return it in mm."""
+        if self.continuous_mode_enabled:
+            return self._read_range_continuous()
+        return self._read_range_single()
+
+    @property
+    def continuous_mode_enabled(self) -> bool:
+        return bool(self._read_8(_VL6180X_REG_SYSRANGE_START) & 0x02)
+
+    @property
+    def range_status(self) -> int:
+        return self._read_8(_VL6180X_REG_RESULT_RANGE_STATUS) >> 4
+
+    def start_range_continuous(self, period: int = 100) -> None:
+        """Start continuous range mode, ``period`` ms between measurements, 20 - 2550."""
+        if not 20 <= period <= 2550:
+            raise ValueError("Delay must be in 10 millisecond increments between 20 and 2550 milliseconds")
+        period_reg = 0
+        if period > 10:
+            period_reg = period // 10 - 1
+        self._write_8(_VL6180X_REG_SYSRANGE_INTERMEASUREMENT_PERIOD, period_reg)
+        self._write_8(_VL6180X_REG_SYSRANGE_START, 0x03)
+
+    def stop_range_continuous(self) -> None:
+        """Stop continuous range mode."""
+        if self.continuous_mode_enabled:
+            self._write_8(_VL6180X_REG_SYSRANGE_START, 0x01)
+
+    def _read_range_single(self) -> int:
+        self._write_8(_VL6180X_REG_SYSRANGE_START, 0x01)
+        return self._read_range_continuous()
+
+    def _read_range_continuous(self) -> int:
+        while not self._read_8(_VL6180X_REG_RESULT_INTERRUPT_STATUS_GPIO) & 0x04:
+            pass
+        range_ = self._read_8(_VL6180X_REG_RESULT_RANGE_VAL)
+        self._write_8(_VL6180X_REG_SYSTEM_INTERRUPT_CLEAR, 0x07)
+        return range_
+
+    def _read_8(self, address: int) -> int:
+        result = bytearray(1)
+        with self._device as i2c:
+            i2c.write_then_readinto(bytes([(address >> 8) & 0xFF, address & 0xFF]), result)
+        return result[0]
+
+    def _write_8(self, address: int, data: int) -> None:
+        with self._device as i2c:
+            i2c.write(bytes([(address >> 8) & 0xFF, address & 0xFF, data]))
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`analogio`
+================================================================================
+Emulated CircuitPython ``analogio``, readings from ``Emulator.current.analogValues``
+* Author(s): Noel Anderson
+"""
+
+import Emulator
+
+
+class AnalogIn:
+    """An analog input, reads ``analogValues[pin.name]``, 0 - 65535."""
+
+    reference_voltage = 3.3
+
+    def __init__(self, pin):
+        self.pin = pin
+
+    def deinit(self) -> None:
+        pass
+
+    @property
+    def value(self) -> int:
+        return Emulator.current.analogValues.get(self.pin.name, 0)
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`board`
+================================================================================
+Emulated CircuitPython ``board`` pins for the control panel RP2040 board
+* Author(s): Noel Anderson
+"""
+
+from microcontroller import Pin
+
+for _index in range(30):
+    globals()[f"GP{_index}"] = Pin(f"GP{_index}")
+del _index
+
+LED = GP25  # pylint: disable=undefined-variable
+A0 = GP26  # pylint: disable=undefined-variable
+A1 = GP27  # pylint: disable=undefined-variable
+A2 = GP28  # pylint: disable=undefined-variable
+A3 = GP29  # pylint: disable=undefined-variable
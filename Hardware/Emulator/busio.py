@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`busio`
+================================================================================
+Emulated CircuitPython ``busio``, an I2C bus connected to the device models
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Every transaction advances the simulated clock by its time on the wire, nine bit
+times for the address and for each byte, so busy-wait loops make progress.
+Transactions & bytes are counted per bus and per device address. With
+``traceHeap`` set, each transaction samples the firmware's heap use.
+"""
+
+import Emulator
+
+# Start & stop conditions, in bit times
+_FRAMING_BITS = 2
+
+
+class I2C:
+    """
+    An emulated I2C bus, with every device model in ``Emulator.current.i2cDevices``.
+
+    :param ~microcontroller.Pin scl: The clock pin
+    :param ~microcontroller.Pin sda: The data pin
+    :param int frequency: The clock frequency in Hertz
+    :param int timeout: Clock stretching timeout in microseconds, unused
+    """
+
+    def __init__(self, scl, sda, *, frequency: int = 100000, timeout: int = 255):
+        self.scl = scl
+        self.sda = sda
+        self.frequency = frequency
+        self._hardware = Emulator.current
+        self._locked = False
+        self.resetStats()
+        self._hardware.buses.append(self)
+
+    def resetStats(self) -> None:
+        """Zero the transaction & byte counts."""
+        self.transactions = 0
+        self.bytesWritten = 0
+        self.bytesRead = 0
+        self.addressCounts = {}
+
+    @property
+    def devices(self) -> list:
+        return self._hardware.i2cDevices
+
+    def deinit(self) -> None:
+        self._hardware.buses.remove(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.deinit()
+
+    def try_lock(self) -> bool:
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        self._locked = False
+
+    def scan(self) -> list:
+        return sorted({device.address for device in self.devices})
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: int = None) -> None:
+        targets = self._targets(address)
+        data = bytes(buffer[start:end])
+        self._account(address, len(data), 0)
+        for device in targets:
+            device.write(data)
+
+    def readfrom_into(self, address: int, buffer, *, start: int = 0, end: int = None) -> None:
+        device = self._targets(address)[0]
+        if end is None:
+            end = len(buffer)
+        self._account(address, 0, end - start)
+        buffer[start:end] = device.read(end - start)
+
+    def writeto_then_readfrom(self, address: int, buffer_out, buffer_in, *, out_start: int = 0, out_end: int = None, in_start: int = 0, in_end: int = None) -> None:
+        targets = self._targets(address)
+        data = bytes(buffer_out[out_start:out_end])
+        if in_end is None:
+            in_end = len(buffer_in)
+        # One transaction, the read follows a repeated start
+        self._account(address, len(data), in_end - in_start)
+        for device in targets:
+            device.write(data)
+        buffer_in[in_start:in_end] = targets[0].read(in_end - in_start)
+
+    def _targets(self, address: int) -> list:
+        targets = [device for device in self.devices if device.matches(address)]
+        if not targets:
+            self._account(address, 0, 0)
+            raise OSError(19, "No such device")
+        return targets
+
+    def _account(self, address: int, written: int, read: int) -> None:
+        self.transactions += 1
+        self.bytesWritten += written
+        self.bytesRead += read
+        self.addressCounts[address] = self.addressCounts.get(address, 0) + 1
+        # Address byte, each data byte (plus the repeated start address) at 9 bits each
+        bytesOnWire = 1 + written + read + (1 if written and read else 0)
+        self._hardware.clock.advance((bytesOnWire * 9 + _FRAMING_BITS) * 1000000 // self.frequency)
+        if self._hardware.traceHeap:
+            # Buffers built for this transaction are still live here
+            self._hardware.sampleHeap()
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`digitalio`
+================================================================================
+Emulated CircuitPython ``digitalio``, input levels from ``Emulator.current.pinLevels``
+* Author(s): Noel Anderson
+"""
+
+import Emulator
+
+
+class Direction:
+    INPUT = "INPUT"
+    OUTPUT = "OUTPUT"
+
+
+class Pull:
+    UP = "UP"
+    DOWN = "DOWN"
+
+
+class DriveMode:
+    PUSH_PULL = "PUSH_PULL"
+    OPEN_DRAIN = "OPEN_DRAIN"
+
+
+class DigitalInOut:
+    """A digital pin, inputs read ``pinLevels[pin.name]``, else their pull."""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self._value = False
+
+    def deinit(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.deinit()
+
+    def switch_to_input(self, pull=None) -> None:
+        self.direction = Direction.INPUT
+        self.pull = pull
+
+    def switch_to_output(self, value: bool = False, drive_mode=DriveMode.PUSH_PULL) -> None:
+        self.direction = Direction.OUTPUT
+        self._value = value
+
+    @property
+    def value(self) -> bool:
+        if self.direction == Direction.OUTPUT:
+            return self._value
+        return Emulator.current.pinLevels.get(self.pin.name, self.pull == Pull.UP)
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        self._value = value
+        Emulator.current.pinLevels[self.pin.name] = bool(value)
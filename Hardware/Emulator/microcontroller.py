@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`microcontroller`
+================================================================================
+Emulated CircuitPython ``microcontroller``, pins, reset mode & watchdog
+* Author(s): Noel Anderson
+"""
+
+import Emulator
+
+
+class Pin:
+    """A named microcontroller pin."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return f"board.{self.name}"
+
+
+class RunMode:
+    NORMAL = "NORMAL"
+    SAFE_MODE = "SAFE_MODE"
+    UF2 = "UF2"
+    BOOTLOADER = "BOOTLOADER"
+
+
+class WatchDogTimer:
+    """The watchdog, disabled until ``mode`` is set, counts feeds."""
+
+    def __init__(self):
+        self.timeout = 0
+        self.mode = None
+        self.feeds = 0
+
+    def feed(self) -> None:
+        self.feeds += 1
+
+    def deinit(self) -> None:
+        self.mode = None
+
+
+class Processor:
+    frequency = 125000000
+    temperature = 27.0
+    voltage = 3.3
+
+
+cpu = Processor()
+watchdog = WatchDogTimer()
+nextResetMode = RunMode.NORMAL
+
+
+def on_next_reset(run_mode) -> None:
+    global nextResetMode  # pylint: disable=global-statement
+    nextResetMode = run_mode
+
+
+def reset() -> None:
+    raise Emulator.SimulationComplete("microcontroller.reset()")
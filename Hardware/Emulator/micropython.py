@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`micropython`
+================================================================================
+Emulated MicroPython ``micropython`` decorators & ``const``
+* Author(s): Noel Anderson
+"""
+
+
+def const(value):
+    return value
+
+
+def native(function):
+    return function
+
+
+def viper(function):
+    return function
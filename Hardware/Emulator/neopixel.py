@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`neopixel`
+================================================================================
+Emulated Adafruit ``neopixel``, every frame shown is recorded in ``Emulator.current.strips``
+* Author(s): Noel Anderson
+"""
+
+import Emulator
+import adafruit_pixelbuf
+
+# Pixel colour orders
+RGB = "RGB"
+GRB = "GRB"
+RGBW = "RGBW"
+GRBW = "GRBW"
+
+
+class NeoPixel(adafruit_pixelbuf.PixelBuf):
+    """
+    A NeoPixel strip on ``pin``, recording its frames.
+
+    :param ~microcontroller.Pin pin: The pin to output NeoPixel data on.
+    :param int n: The number of NeoPixels in the chain.
+    :param int bpp: Bytes per pixel. 3 for RGB and 4 for RGBW pixels.
+    :param float brightness: Brightness of the pixels between 0.0 and 1.0 where 1.0 is full brightness.
+    :param bool auto_write: True if the strip should be updated immediately when a pixel is changed.
+    :param str pixel_order: Colour order of the strip, defaults to ``GRB`` or ``GRBW``.
+    """
+
+    def __init__(self, pin, n: int, *, bpp: int = 3, brightness: float = 1.0, auto_write: bool = True, pixel_order: str = None):
+        if not pixel_order:
+            pixel_order = GRB if bpp == 3 else GRBW
+        elif isinstance(pixel_order, tuple):
+            pixel_order = "".join(RGBW[order] for order in pixel_order)
+        self.pin = pin
+        self.strip = Emulator.current.strip(pin)
+        super().__init__(n, brightness=brightness, byteorder=pixel_order, auto_write=auto_write)
+
+    def deinit(self) -> None:
+        self.fill(0)
+        self.show()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.deinit()
+
+    @property
+    def n(self) -> int:
+        return len(self)
+
+    def _transmit(self, buffer: bytearray) -> None:
+        if Emulator.current.recording:
+            self.strip.record(Emulator.current.clock, bytes(buffer))
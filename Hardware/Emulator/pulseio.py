@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`pulseio`
+================================================================================
+Emulated CircuitPython ``pulseio``, pulses appended by the caller, the oldest dropped when full
+* Author(s): Noel Anderson
+"""
+
+import Emulator
+
+
+class PulseIn:
+    """Captured pulse lengths, registered in ``Emulator.current.pulseInputs`` so they can be fed with ``append``."""
+
+    def __init__(self, pin, maxlen: int = 2, *, idle_state: bool = False):
+        self.pin = pin
+        self.maxlen = maxlen
+        self.idle_state = idle_state
+        self.paused = False
+        self._pulses = []
+        Emulator.current.pulseInputs[pin.name] = self
+
+    def append(self, length: int) -> None:
+        if self.paused:
+            return
+        if len(self._pulses) >= self.maxlen:
+            # Full, drop the oldest pulse like the real PulseIn
+            self._pulses.pop(0)
+        self._pulses.append(length)
+
+    def deinit(self) -> None:
+        Emulator.current.pulseInputs.pop(self.pin.name, None)
+
+    def pause(self) -> None:
+        self.paused = True
+
+    def resume(self, trigger_duration: int = 0) -> None:
+        self.paused = False
+
+    def clear(self) -> None:
+        self._pulses.clear()
+
+    def popleft(self) -> int:
+        return self._pulses.pop(0)
+
+    def __len__(self) -> int:
+        return len(self._pulses)
+
+    def __getitem__(self, index: int) -> int:
+        return self._pulses[index]
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`rp2pio`
+================================================================================
+Emulated CircuitPython ``rp2pio``, background writes complete at once
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Only the transmit side used by ``PioPixels`` is emulated. Every write is kept
+in ``writes`` and, decoded as a ``PioPixels`` frame, recorded against the
+first sideset pin in ``Emulator.current.strips``.
+"""
+
+import Emulator
+
+
+class StateMachine:
+    """
+    A PIO state machine running ``program``.
+
+    :param bytes program: The assembled program
+    :param int frequency: The state machine clock in Hertz
+    """
+
+    def __init__(self, program, frequency: int, *, first_sideset_pin=None, first_out_pin=None, **kwargs):
+        self.program = program
+        self.frequency = frequency
+        self.pin = first_sideset_pin if first_sideset_pin is not None else first_out_pin
+        self.strip = Emulator.current.strip(self.pin) if self.pin is not None else None
+        self.writes = []
+
+    def deinit(self) -> None:
+        pass
+
+    @property
+    def writing(self) -> bool:
+        return False
+
+    @property
+    def pending_write(self) -> bool:
+        return False
+
+    def write(self, buffer, *, start: int = 0, end: int = None, swap: bool = False) -> None:
+        self._record(memoryview(buffer)[start:end])
+
+    def background_write(self, once=None, *, loop=None, swap: bool = False) -> None:
+        if once is not None:
+            self._record(once)
+
+    def _record(self, buffer) -> None:
+        if not Emulator.current.recording:
+            return
+        data = memoryview(buffer).cast("B").tobytes()
+        self.writes.append(data)
+        if self.strip is not None:
+            self.strip.record(Emulator.current.clock, Emulator.decodePioFrame(data))
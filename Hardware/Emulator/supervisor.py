@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`supervisor`
+================================================================================
+Emulated CircuitPython ``supervisor``, ticks from the simulated clock
+* Author(s): Noel Anderson
+"""
+
+import Emulator
+
+
+class Runtime:
+    """Serial console state, from ``Emulator.current.serial``."""
+
+    @property
+    def serial_connected(self) -> bool:
+        return True
+
+    @property
+    def serial_bytes_available(self) -> int:
+        return Emulator.current.serial.available
+
+
+runtime = Runtime()
+
+
+def ticks_ms() -> int:
+    return Emulator.current.clock.ticks_ms()
+
+
+def reload() -> None:
+    raise Emulator.SimulationComplete("supervisor.reload()")
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+
+"""Fixtures running the firmware on the emulated hardware, run with ``python -m pytest Hardware/Emulator``."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import Emulator  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture
+def hardware():
+    """A freshly powered on emulated board, uninstalled after the test."""
+    hardware = Emulator.install()
+    try:
+        yield hardware
+    finally:
+        Emulator.uninstall()
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+
+"""Steady state driver I/O allocates nothing, measured with ``gc.mem_free()`` on the emulated heap."""
+
+import gc
+import sys
+import tracemalloc
+import types
+
+import pytest
+
+import Models
+
+PCA9955_ADDRESS = 0x60
+
+
+def memFreeDrop(hardware, operation, iterations: int = 20) -> tuple:
+    """How far ``gc.mem_free()`` fell over ``iterations`` operations, at the end and at its lowest."""
+    # Warm up, e.g. lazily built channel objects
+    for _ in range(3):
+        operation()
+    tracemalloc.start()
+    hardware.traceHeap = True
+    try:
+        before = gc.mem_free()
+        hardware.memFreeLow = before
+        for _ in range(iterations):
+            operation()
+        after = gc.mem_free()
+    finally:
+        hardware.traceHeap = False
+        tracemalloc.stop()
+    return before - after, before - hardware.memFreeLow
+
+
+@pytest.fixture
+def i2c(hardware):
+    import board  # pylint: disable=import-outside-toplevel
+    import busio  # pylint: disable=import-outside-toplevel
+    return busio.I2C(scl=board.GP15, sda=board.GP14)
+
+
+@pytest.fixture
+def as5600(hardware, i2c):
+    import AS5600  # pylint: disable=import-outside-toplevel
+    hardware.as5600.rawAngle = 1234
+    return AS5600.AS5600(i2c)
+
+
+@pytest.fixture
+def pca9955(hardware, i2c):
+    import PCA9955  # pylint: disable=import-outside-toplevel
+    hardware.attach(Models.PCA9955Model(PCA9955_ADDRESS))
+    return PCA9955.PCA9955(i2c, PCA9955_ADDRESS)
+
+
+@pytest.mark.parametrize("name", ("angle", "raw_angle", "status", "magnitude"))
+def test_as5600_read_allocates_nothing(hardware, as5600, name):
+    assert memFreeDrop(hardware, lambda: getattr(as5600, name)) == (0, 0)
+
+
+def test_as5600_snapshot_allocates_nothing(hardware, as5600):
+    import AS5600  # pylint: disable=import-outside-toplevel
+    buffer = bytearray(AS5600.SNAPSHOT_SIZE)
+
+    def readSnapshot():
+        snapshot = as5600.read_snapshot(buffer)
+        return snapshot.angle, snapshot.raw_angle, snapshot.magnitude
+
+    assert memFreeDrop(hardware, readSnapshot) == (0, 0)
+
+
+def test_pca9955_channel_write_allocates_nothing(hardware, pca9955):
+    channel = pca9955.channels[5]
+    values = [10]
+
+    def setBrightness():
+        values[0] ^= 0xFF
+        channel.brightness = values[0]
+
+    assert memFreeDrop(hardware, setBrightness) == (0, 0)
+
+
+def test_mem_free_sees_per_call_buffers(hardware, as5600):
+    # The read as it was before preallocated buffers, compiled as part of AS5600.py so it counts as firmware.
+    # CPython frees its buffers straight after the transaction, only the lowest mem_free shows them.
+    source = (
+        "def _read_16(self, address):\n"
+        "    result = bytearray(2)\n"
+        "    with self._device as i2c:\n"
+        "        i2c.write_then_readinto(bytes([address]), result)\n"
+        "    return (result[0] << 8) | result[1]\n"
+    )
+    namespace = {}
+    exec(compile(source, sys.modules["AS5600"].__file__, "exec"), namespace)  # pylint: disable=exec-used
+    as5600._read_16 = types.MethodType(namespace["_read_16"], as5600)  # pylint: disable=protected-access
+    end, lowest = memFreeDrop(hardware, lambda: as5600.angle)
+    assert end == 0
+    assert lowest > 0
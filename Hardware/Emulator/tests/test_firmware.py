@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+
+"""Smoke tests running the unmodified firmware on the emulated hardware."""
+
+import gc
+import sys
+import time
+
+import Emulator
+import Models
+
+# Pixel bytes per frame, GRB
+OCTOALERT_FRAME_BYTES = 16 * 3
+LED_ARRAY_FRAME_BYTES = 64 * 3
+
+
+class MovingYoke(Models.AS5600Model):
+    """An AS5600 held at ``startAngle`` until ``atMs``, then at ``endAngle``."""
+
+    def __init__(self, clock, startAngle: int, endAngle: int, atMs: int):
+        super().__init__()
+        self.clock = clock
+        self.startAngle = startAngle
+        self.endAngle = endAngle
+        self.atMs = atMs
+
+    @property
+    def rawAngle(self) -> int:
+        return self.startAngle if self.clock.ms < self.atMs else self.endAngle
+
+    @rawAngle.setter
+    def rawAngle(self, value: int) -> None:
+        pass
+
+
+def test_firmware_sends_hid_reports_and_pixel_frames(hardware):
+    hardware.as5600.rawAngle = 1000
+    hardware.vl6180x.range = 60
+    namespace = hardware.runFirmware(untilMs=1000)
+
+    # At rest, a first report then keepalives
+    assert hardware.hidReports
+    assert hardware.hidReports[0][0] < 100
+    assert len(hardware.hidReports) >= 1000 // namespace["joystickOutput"].keepaliveMs
+    assert all(reportId == hardware.hidReports[0][1] for _, reportId, _ in hardware.hidReports)
+
+    # OctoAlert ring on GP1 every 50ms, Game of Life panel on GP0 every 500ms
+    octoAlert = hardware.strips["GP1"]
+    ledArray = hardware.strips["GP0"]
+    assert len(octoAlert.frames) >= 15
+    assert all(len(frame) == OCTOALERT_FRAME_BYTES for frame in octoAlert.frames)
+    assert any(frame != octoAlert.frames[0] for frame in octoAlert.frames)
+    assert len(ledArray.frames) >= 2
+    assert all(len(frame) == LED_ARRAY_FRAME_BYTES for frame in ledArray.frames)
+
+
+def test_firmware_reports_yoke_movement(hardware):
+    yoke = MovingYoke(hardware.clock, 1000, 1000 + 256, atMs=300)
+    hardware.i2cDevices[0] = hardware.as5600 = yoke
+    hardware.vl6180x.range = 60
+    namespace = hardware.runFirmware(untilMs=600)
+
+    before = [report for timeMs, _, report in hardware.hidReports if timeMs < 300]
+    after = [report for timeMs, _, report in hardware.hidReports if timeMs >= 300]
+    assert before and after
+    assert before[-1] != after[-1]
+    # The yoke rolled right by 256 counts, 22.5 degrees, from its zero at boot
+    assert namespace["joystickOutput"].lastX > 0
+
+
+def test_uninstall_restores_interpreter():
+    stdin = sys.stdin
+    realTime = sys.modules["time"]
+    Emulator.install()
+    assert sys.modules["time"] is not realTime
+    assert sys.stdin is not stdin
+    assert gc.mem_free() > 0
+    Emulator.uninstall()
+    assert sys.modules["time"] is realTime is time
+    assert sys.stdin is stdin
+    assert not hasattr(gc, "mem_free")
+    assert Emulator.current is None
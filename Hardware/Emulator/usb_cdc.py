@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`usb_cdc`
+================================================================================
+Emulated CircuitPython ``usb_cdc``, data written to the data channel is recorded
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+``data`` is None until boot.py enables it, as on the board. Everything written
+to it is appended to ``Emulator.current.cdcData``. Clear ``connected`` to
+emulate the host not having the port open.
+"""
+
+import Emulator
+
+
+class Serial:
+    """A USB CDC serial channel."""
+
+    def __init__(self, recordTo: bytearray = None):
+        self.connected = True
+        self.timeout = 1
+        self.write_timeout = None
+        self._record = recordTo
+
+    @property
+    def in_waiting(self) -> int:
+        return 0
+
+    @property
+    def out_waiting(self) -> int:
+        return 0
+
+    def read(self, size: int = 1) -> bytes:
+        return b""
+
+    def readinto(self, buf) -> int:
+        return 0
+
+    def write(self, buf) -> int:
+        if not self.connected:
+            return 0
+        if self._record is not None and Emulator.current.recording:
+            self._record.extend(buf)
+        return len(buf)
+
+    def flush(self) -> None:
+        pass
+
+    def reset_input_buffer(self) -> None:
+        pass
+
+    def reset_output_buffer(self) -> None:
+        pass
+
+
+console = Serial()
+data = None
+
+
+def enable(*, console: bool = True, data: bool = False) -> bool:  # pylint: disable=redefined-outer-name
+    globals()["console"] = Serial() if console else None
+    globals()["data"] = Serial(Emulator.current.cdcData) if data else None
+    return True
+
+
+def disable() -> None:
+    enable(console=False, data=False)
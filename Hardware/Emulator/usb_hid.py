@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`usb_hid`
+================================================================================
+Emulated CircuitPython ``usb_hid``, every report sent is recorded
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+Reports are kept per device in ``reports`` and, with their simulated time, in
+``Emulator.current.hidReports``, whether sent by ``HidJoystick`` or by
+``adafruit_hid`` devices such as ``Gamepad``. ``enable()`` replaces ``devices``
+straight away, as boot.py's ``enable()`` does for code.py.
+"""
+
+import Emulator
+
+
+class Device:
+    """
+    A USB HID device.
+
+    :param bytes report_descriptor: The HID report descriptor
+    :param int usage_page: Usage page of the first collection
+    :param int usage: Usage of the first collection
+    :param tuple report_ids: Report IDs, or (0,) for none
+    :param tuple in_report_lengths: Length of each input report
+    :param tuple out_report_lengths: Length of each output report
+    """
+
+    KEYBOARD = None
+    MOUSE = None
+    CONSUMER_CONTROL = None
+
+    def __init__(self, *, report_descriptor: bytes, usage_page: int, usage: int, report_ids, in_report_lengths, out_report_lengths):
+        self.report_descriptor = bytes(report_descriptor)
+        self.usage_page = usage_page
+        self.usage = usage
+        self.report_ids = tuple(report_ids)
+        self.in_report_lengths = tuple(in_report_lengths)
+        self.out_report_lengths = tuple(out_report_lengths)
+        self.reports = []
+
+    def send_report(self, report, report_id: int = None) -> None:
+        if report_id is None:
+            report_id = self.report_ids[0]
+        length = self.in_report_lengths[self.report_ids.index(report_id)]
+        if len(report) != length:
+            raise ValueError(f"Buffer should be of length {length}")
+        if Emulator.current.recording:
+            report = bytes(report)
+            self.reports.append(report)
+            Emulator.current.recordHidReport(report_id, report)
+
+    def get_last_received_report(self, report_id: int = None):
+        return None
+
+
+Device.KEYBOARD = Device(report_descriptor=b"", usage_page=0x01, usage=0x06, report_ids=(1,), in_report_lengths=(8,), out_report_lengths=(1,))
+Device.MOUSE = Device(report_descriptor=b"", usage_page=0x01, usage=0x02, report_ids=(2,), in_report_lengths=(4,), out_report_lengths=(0,))
+Device.CONSUMER_CONTROL = Device(report_descriptor=b"", usage_page=0x0C, usage=0x01, report_ids=(3,), in_report_lengths=(2,), out_report_lengths=(0,))
+
+devices = (Device.KEYBOARD, Device.MOUSE, Device.CONSUMER_CONTROL)
+
+
+def enable(enabled_devices, boot_device: int = 0) -> None:
+    global devices  # pylint: disable=global-statement
+    devices = tuple(enabled_devices)
+
+
+def disable() -> None:
+    global devices  # pylint: disable=global-statement
+    devices = ()
@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`watchdog`
+================================================================================
+Emulated CircuitPython ``watchdog``
+* Author(s): Noel Anderson
+"""
+
+
+class WatchDogMode:
+    RAISE = "RAISE"
+    RESET = "RESET"
+
+
+class WatchDogTimeout(Exception):
+    """Raised when the watchdog expires in RAISE mode."""
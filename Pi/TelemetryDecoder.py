@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022 Noel Anderson
+#
+# SPDX-License-Identifier: MIT
+# pylint: disable=line-too-long
+
+"""
+`TelemetryDecoder`
+================================================================================
+Decode the control panel's binary telemetry stream on the Raspberry Pi
+* Author(s): Noel Anderson
+
+Implementation Notes
+--------------------
+The panel sends fixed-size frames over its second USB serial port, the
+``usb_cdc.data`` channel, usually ``/dev/ttyACM1``. The frame layout is documented
+in, and must match, ``Hardware/Code/Telemetry.py``.
+
+``TelemetryDecoder.feed()`` takes bytes as they arrive, in any sized pieces, and
+returns the complete frames. Frames are parsed in place with ``struct.unpack_from``
+on a ``memoryview`` of the receive buffer, so nothing is copied. The decoder locks
+on the sync word, then checks the version, length & Fletcher-16 checksum. On a
+mismatch it skips one byte and hunts for the next sync word, so it resyncs after
+dropped or corrupted bytes. Frames missed are counted from gaps in the sequence
+number.
+
+Run on the Pi to print frames as they arrive::
+
+    python3 TelemetryDecoder.py /dev/ttyACM1
+"""
+
+import collections
+import struct
+import sys
+
+SYNC = b"\xA5\x5A"
+VERSION = 1
+FORMAT = "<HBBHIHHBBhhBBHHHHHHI"
+FRAME_SIZE = struct.calcsize(FORMAT) + 2
+_CHECKSUM = struct.Struct("<H")
+
+Frame = collections.namedtuple("Frame", (
+    "sequence", "timeMs", "rawAngle", "angle", "rawRange", "range", "roll", "pitch",
+    "magnetStatus", "agc", "magnitude", "jitterMeanUs", "jitterP99Us", "jitterMaxUs",
+    "overruns", "gcRuns", "memFreeLow",
+))
+
+# AS5600 STATUS bits
+MAGNET_TOO_STRONG = 0x08
+MAGNET_TOO_WEAK = 0x10
+MAGNET_DETECTED = 0x20
+
+
+def fletcher16(data) -> int:
+    """Fletcher-16 checksum of ``data``."""
+    sum1 = 0
+    sum2 = 0
+    for value in data:
+        sum1 = (sum1 + value) % 255
+        sum2 = (sum2 + sum1) % 255
+    return (sum2 << 8) | sum1
+
+
+class TelemetryDecoder:
+    """Reassembles telemetry frames from a byte stream."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._lastSequence = None
+        self.frames = 0
+        self.framesMissed = 0
+        self.bytesSkipped = 0
+        self.checksumErrors = 0
+
+    def feed(self, data) -> list:
+        """Add received bytes and return the complete frames now available, as ``Frame`` tuples."""
+        self._buffer += data
+        frames = []
+        position = 0
+        with memoryview(self._buffer) as view:
+            while True:
+                start = self._buffer.find(SYNC, position)
+                if start < 0:
+                    # Keep a trailing byte that may be the first half of the sync word
+                    keep = max(position, len(self._buffer) - 1)
+                    self.bytesSkipped += keep - position
+                    position = keep
+                    break
+                self.bytesSkipped += start - position
+                position = start
+                if len(self._buffer) - start < FRAME_SIZE:
+                    break
+                frame = self._parse(view, start)
+                if frame is None:
+                    # Not a frame after all, hunt for the next sync word
+                    position = start + 1
+                    self.bytesSkipped += 1
+                    continue
+                frames.append(frame)
+                position = start + FRAME_SIZE
+        del self._buffer[:position]
+        return frames
+
+    def _parse(self, view: memoryview, start: int):
+        fields = struct.unpack_from(FORMAT, view, start)
+        if fields[1] != VERSION or fields[2] != FRAME_SIZE:
+            return None
+        if fletcher16(view[start + 2:start + FRAME_SIZE - 2]) != _CHECKSUM.unpack_from(view, start + FRAME_SIZE - 2)[0]:
+            self.checksumErrors += 1
+            return None
+        frame = Frame(*fields[3:])
+        if self._lastSequence is not None:
+            self.framesMissed += (frame.sequence - self._lastSequence - 1) & 0xFFFF
+        self._lastSequence = frame.sequence
+        self.frames += 1
+        return frame
+
+
+def main(path: str) -> None:
+    decoder = TelemetryDecoder()
+    with open(path, "rb", buffering=0) as port:
+        if port.isatty():
+            import tty  # pylint: disable=import-outside-toplevel
+            tty.setraw(port.fileno())
+        while True:
+            data = port.read(FRAME_SIZE * 4)
+            if not data:
+                break
+            for frame in decoder.feed(data):
+                print(frame, "missed", decoder.framesMissed, "skipped", decoder.bytesSkipped)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "/dev/ttyACM1")